@@ -10,6 +10,11 @@ from specialties import models as specialty_models
 from subjects import models as subject_models
 from assignments import models as assignment_models
 from auth import models as auth_models
+from utils import compression, identity_cache, json_backend, unit_of_work
+from utils.password_hasher import password_hasher
+from auth.commands import calibrate_bcrypt_rounds, purge_token_blocklist
+from auth.utils.login_throttle import login_throttle
+from auth.utils.revocation_cache import epoch_cache, revocation_cache
 
 
 def create_app():
@@ -17,25 +22,29 @@ def create_app():
     app.config.from_object(os.environ["APP_SETTINGS"])
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
     app.config["PROPAGATE_EXCEPTIONS"] = True
+    json_backend.init_app(app)
 
     jwt = JWTManager(app)
     db.init_app(app)
     ma.init_app(app)
     migrate.init_app(app, db)
+    revocation_cache.init_app(app)
+    epoch_cache.init_app(app)
+    password_hasher.init_app(app)
+    login_throttle.init_app(app)
+    identity_cache.init_app(app)
+    unit_of_work.init_app(app)
+    # after_request hooks run in reverse: compress what the others produced
+    compression.init_app(app)
+    app.cli.add_command(purge_token_blocklist)
+    app.cli.add_command(calibrate_bcrypt_rounds)
 
     @app.before_first_request
     def create_tables():
         db.create_all()
 
-    @jwt.additional_claims_loader
-    def add_claims_to_jwt(identity):
-        pass
-
-    @jwt.token_in_blocklist_loader
-    def check_if_token_revoked(jwt_headers, jwt_data):
-        jti = jwt_data["jti"]
-        token = auth_models.TokenBlocklistModel.get_by_jti(jti)
-        return token is not None
+    jwt.additional_claims_loader(add_claims_to_jwt)
+    jwt.token_in_blocklist_loader(check_if_token_revoked)
 
     @jwt.revoked_token_loader
     def revoked_token_callback(jwt_header, jwt_data):
@@ -48,6 +57,25 @@ def create_app():
     return app
 
 
+def add_claims_to_jwt(identity):
+    epoch = user_models.UserModel.get_token_epoch(identity)
+    epoch_cache.set(str(identity), epoch)
+    return {"epoch": epoch}
+
+
+def check_if_token_revoked(jwt_headers, jwt_data):
+    current_epoch = epoch_cache.get(
+        jwt_data["sub"], user_models.UserModel.get_token_epoch
+    )
+    if jwt_data.get("epoch", 0) != current_epoch:
+        return True
+    return revocation_cache.is_revoked(
+        jwt_data["jti"],
+        jwt_data.get("exp", None),
+        auth_models.TokenBlocklistModel.get_by_jti,
+    )
+
+
 def register_blueprints(app):
     from users import urls as user_urls
     from subjects import urls as subject_urls
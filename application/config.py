@@ -14,6 +14,56 @@ class Config:
     JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=30)
     JWT_BLACKLIST_ENABLED = True
     JWT_BLACKLIST_TOKEN_CHECKS = ["access", "refresh"]
+    JWT_BLOCKLIST_CACHE_SIZE = 10000
+    JWT_BLOCKLIST_NEGATIVE_TTL = 30
+    JWT_EPOCH_CACHE_TTL = 30
+
+    # bcrypt releases the GIL, so threads are enough; "process" is available
+    PASSWORD_HASHER_EXECUTOR = "thread"
+    PASSWORD_HASHER_WORKERS = 4
+    PASSWORD_HASHER_MAX_PENDING = 32
+    # adds "X-Password-Hasher: workers=<n>, pending=<n>, queue_depth=<n>,
+    # completed=<n>, failed=<n>, rejected=<n>" (of this process) to responses
+    PASSWORD_HASHER_STATS_HEADER = False
+    # the same for every worker; "flask calibrate-bcrypt-rounds" measures
+    # the highest cost the hardware hashes within a target time. Stored
+    # hashes of a lower cost are upgraded at login, never downgraded
+    BCRYPT_ROUNDS = 12
+
+    # token buckets: BURST attempts at once, then RATE attempts per second;
+    # "shared" keeps the buckets in shared memory for all local workers
+    LOGIN_RATE_LIMIT_ENABLED = True
+    LOGIN_RATE_LIMIT_BACKEND = "memory"
+    LOGIN_RATE_LIMIT_SHARED_NAME = "university_login_throttle"
+    LOGIN_RATE_LIMIT_MAX_KEYS = 100000
+    LOGIN_RATE_LIMIT_EMAIL_BURST = 5
+    LOGIN_RATE_LIMIT_EMAIL_RATE = 5 / 60
+    LOGIN_RATE_LIMIT_ADDRESS_BURST = 20
+    LOGIN_RATE_LIMIT_ADDRESS_RATE = 20 / 60
+
+    # adds "X-Identity-Cache: hits=<n>, misses=<n>" to every response
+    IDENTITY_CACHE_STATS_HEADER = False
+
+    # list endpoints return pages of ?limit=<n> rows, at most MAX_PAGE_SIZE
+    DEFAULT_PAGE_SIZE = 50
+    MAX_PAGE_SIZE = 200
+    # ?stream=true reads and serializes the rows this many at a time
+    STREAM_BATCH_SIZE = 1000
+    # ?expand=a.b.c nests relations up to this many levels
+    MAX_EXPAND_DEPTH = 2
+
+    # "orjson", "json" (standard library) or "auto": orjson if installed
+    JSON_BACKEND = "auto"
+
+    # gzip or deflate, as negotiated, for bodies of at least COMPRESS_MIN_SIZE
+    # bytes (and all streamed ones); level 1 is the fastest, 9 the smallest
+    COMPRESS_ENABLED = True
+    COMPRESS_MIN_SIZE = 1024
+    COMPRESS_LEVEL = 6
+    COMPRESS_MIMETYPES = ("application/json", "text/html", "text/plain")
+
+    # one transaction per request: saves flush, the request commits once
+    UNIT_OF_WORK = True
 
     SQLALCHEMY_DATABASE_URI = os.environ["DATABASE_URI"]
 
@@ -30,7 +80,11 @@ class StagingConfig(Config):
 class DevelopmentConfig(Config):
     DEVELOPMENT = True
     DEBUG = True
+    IDENTITY_CACHE_STATS_HEADER = True
+    PASSWORD_HASHER_STATS_HEADER = True
 
 
 class TestingConfig(Config):
     TESTING = True
+    BCRYPT_ROUNDS = 4
+    LOGIN_RATE_LIMIT_ENABLED = False
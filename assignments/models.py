@@ -22,3 +22,5 @@ class AssignmentModel(BaseModel):
     subject = db.relationship(
         "SubjectModel", uselist=False, back_populates="assignments"
     )
+
+    natural_key = ("subject_id", "name")
@@ -1,11 +1,11 @@
 import datetime
 
 from marshmallow import EXCLUDE, validates, ValidationError
-from application.ma import ma
+from application.ma import AutoSchema, ma
 from assignments import models as assignment_models
 
 
-class AssignmentSchema(ma.SQLAlchemyAutoSchema):
+class AssignmentSchema(AutoSchema):
     subject = ma.Nested("SubjectSchema", many=False)
 
     class Meta:
@@ -3,11 +3,9 @@ import uuid
 from flask import request
 from flask_jwt_extended import jwt_required
 
+from assignments import models as assignment_models
 from assignments import schemas as assignment_schemas
-from assignments.utils.utils import (
-    get_assignment_from_subject,
-    check_name_accessibility,
-)
+from assignments.utils.utils import get_assignment_from_subject
 from subjects import models as subject_models
 from users import models as user_models
 from utils.constants import (
@@ -18,9 +16,16 @@ from utils.constants import (
     UPDATED_SUCCESSFULLY,
     SUCCESSFULLY_DELETED,
     TEACHER,
+    ALREADY_EXISTS,
+    ASSIGNMENT_NOT_FOUND_IN_SUBJECT,
 )
 from utils.custom_decorators import find_active_user
-from utils.custom_exceptions import UpdateException
+from utils.custom_exceptions import (
+    CreateException,
+    SearchException,
+    UpdateException,
+)
+from utils.schemas.projection import get_projection
 from utils.utils import get_entity, get_entity_with_teacher
 
 assignment_schema = assignment_schemas.AssignmentSchema()
@@ -33,13 +38,20 @@ def create_assignment(
     teacher: user_models.TeacherModel, subject_id: uuid.UUID
 ):
     subject = get_entity_with_teacher(
-        teacher, subject_id, subject_models.SubjectModel, SUBJECT
+        teacher,
+        subject_id,
+        subject_models.SubjectModel,
+        SUBJECT,
+        profile="owned_assignments",
     )
     assignment_json = request.get_json()
     assignment_json["subject_id"] = subject.id
     assignment = assignment_schema.load(assignment_json)
-    check_name_accessibility(subject, assignment.name)
-    assignment.save_to_db()
+    # the unique constraint on (subject_id, name) rejects a taken name
+    if not assignment.insert_unique():
+        raise CreateException(
+            ALREADY_EXISTS.format(ASSIGNMENT, assignment.name)
+        )
     assignment_json = assignment_schema.dump(assignment)
     return {
         "message": CREATED_SUCCESSFULLY.format(ASSIGNMENT, assignment.id),
@@ -48,18 +60,31 @@ def create_assignment(
 
 
 def get_assignments(subject_id: uuid.UUID):
-    subject = get_entity(subject_id, subject_models.SubjectModel, SUBJECT)
-    assignments = [
-        assignment_schema.dump(assignment)
-        for assignment in subject.assignments
-    ]
+    schema, _ = get_projection(
+        assignment_schemas.AssignmentSchema, request.args
+    )
+    subject = get_entity(
+        subject_id,
+        subject_models.SubjectModel,
+        SUBJECT,
+        profile="assignments",
+    )
+    assignments = schema.dump(subject.assignments, many=True)
     return {"data": {"assignments": assignments}}, 200
 
 
 def get_assignment(subject_id: uuid.UUID, assignment_id: uuid.UUID):
-    subject = get_entity(subject_id, subject_models.SubjectModel, SUBJECT)
+    schema, _ = get_projection(
+        assignment_schemas.AssignmentSchema, request.args
+    )
+    subject = get_entity(
+        subject_id,
+        subject_models.SubjectModel,
+        SUBJECT,
+        profile="assignments",
+    )
     assignment = get_assignment_from_subject(subject, assignment_id)
-    assignment_json = assignment_schema.dump(assignment)
+    assignment_json = schema.dump(assignment)
     return {"data": assignment_json}, 200
 
 
@@ -73,17 +98,26 @@ def update_assignment(
     subject = get_entity_with_teacher(
         teacher, subject_id, subject_models.SubjectModel, SUBJECT
     )
-    assignment_obj = get_assignment_from_subject(subject, assignment_id)
     assignment_json = request.get_json()
     if "subject_id" in assignment_json:
         raise UpdateException(IMPOSSIBLE_TO_UPDATE.format("subject_id"))
-    assignment_name = assignment_json.get("name", None)
-    if assignment_name:
-        check_name_accessibility(subject, assignment_name)
-    assignment = assignment_schema.load(
-        assignment_json, instance=assignment_obj, partial=True
+    changes = assignment_schema.load_changes(assignment_json)
+    model = assignment_models.AssignmentModel
+    assignment = model.update_returning(
+        assignment_id, changes, model.subject_id == subject.id
     )
-    assignment.save_to_db()
+    if not assignment:
+        if "name" not in changes:
+            raise SearchException(
+                ASSIGNMENT_NOT_FOUND_IN_SUBJECT.format(
+                    assignment_id, subject.id
+                )
+            )
+        # not in the subject, otherwise the new name is taken
+        get_assignment_from_subject(subject, assignment_id)
+        raise CreateException(
+            ALREADY_EXISTS.format(ASSIGNMENT, changes["name"])
+        )
     assignment_json = assignment_schema.dump(assignment)
     return {
         "message": UPDATED_SUCCESSFULLY.format(ASSIGNMENT, assignment_id),
@@ -99,7 +133,11 @@ def delete_assignment(
     assignment_id: uuid.UUID,
 ):
     subject = get_entity_with_teacher(
-        teacher, subject_id, subject_models.SubjectModel, SUBJECT
+        teacher,
+        subject_id,
+        subject_models.SubjectModel,
+        SUBJECT,
+        profile="owned_assignments",
     )
     assignment_obj = get_assignment_from_subject(subject, assignment_id)
     assignment_obj.remove_from_db()
@@ -0,0 +1,38 @@
+import click
+from flask.cli import with_appcontext
+
+from auth import models as auth_models
+from utils.password_hasher import calibrate_rounds
+
+
+@click.command("purge-token-blocklist")
+@click.option(
+    "--batch-size",
+    default=1000,
+    show_default=True,
+    help="Max number of rows deleted per transaction.",
+)
+@with_appcontext
+def purge_token_blocklist(batch_size):
+    """Deletes blocklisted tokens that have already expired."""
+    deleted = auth_models.TokenBlocklistModel.purge_expired(batch_size)
+    click.echo(f"Purged {deleted} expired token(s).")
+
+
+@click.command("calibrate-bcrypt-rounds")
+@click.option(
+    "--target-time",
+    default=0.25,
+    show_default=True,
+    help="Max seconds a single password hash may take.",
+)
+@click.option(
+    "--min-rounds",
+    default=10,
+    show_default=True,
+    help="Lowest acceptable cost, chosen even if it is slower.",
+)
+def calibrate_bcrypt_rounds(target_time, min_rounds):
+    """Prints the bcrypt cost to set as BCRYPT_ROUNDS on this machine."""
+    rounds = calibrate_rounds(target_time, min_rounds)
+    click.echo(f"BCRYPT_ROUNDS = {rounds}")
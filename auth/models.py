@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from sqlalchemy import exc
 
 from application import db
@@ -7,11 +9,42 @@ from utils.constants import SOMETHING_WENT_WRONG
 class TokenBlocklistModel(db.Model):
     jti = db.Column(db.String(36), nullable=False, primary_key=True)
     created_on = db.Column(db.DateTime, server_default=db.func.now())
+    expires_at = db.Column(db.DateTime, index=True)
 
     @classmethod
     def get_by_jti(cls, jti):
         return cls.query.filter_by(jti=jti).scalar()
 
+    @classmethod
+    def purge_expired(cls, batch_size=1000):
+        """Deletes rows of already expired tokens in batches
+
+        :param batch_size: max number of rows deleted per transaction
+        :type batch_size: int
+        :return: number of deleted rows
+        """
+        total = 0
+        while True:
+            expired_jtis = (
+                db.session.query(cls.jti)
+                .filter(cls.expires_at < datetime.utcnow())
+                .limit(batch_size)
+                .subquery()
+            )
+            deleted = cls.query.filter(
+                cls.jti.in_(db.select(expired_jtis.c.jti))
+            ).delete(synchronize_session=False)
+            try:
+                db.session.commit()
+            except exc.SQLAlchemyError as err:
+                db.session.rollback()
+                raise exc.SQLAlchemyError(
+                    SOMETHING_WENT_WRONG.format(str(err))
+                )
+            total += deleted
+            if deleted < batch_size:
+                return total
+
     def save_to_db(self):
         db.session.add(self)
         try:
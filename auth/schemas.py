@@ -1,6 +1,6 @@
 from marshmallow import EXCLUDE, Schema, fields, validates, ValidationError
 
-from application.ma import ma
+from application.ma import AutoSchema
 from auth import models as auth_models
 from utils.constants import VALIDATE_EMAIL
 
@@ -24,7 +24,7 @@ class LoginSchema(Schema):
             raise ValidationError("Too short password(min 8 symbols)")
 
 
-class TokenBlocklistSchema(ma.SQLAlchemyAutoSchema):
+class TokenBlocklistSchema(AutoSchema):
     class Meta:
         model = auth_models.TokenBlocklistModel
         load_instance = True
@@ -0,0 +1,20 @@
+import unittest
+from unittest.mock import patch
+
+from utils.test_utils import BaseTestCase
+
+
+class CalibrateBcryptRoundsTestCase(BaseTestCase):
+    @patch("auth.commands.calibrate_rounds")
+    def test_prints_rounds(self, mock_calibrate_rounds):
+        mock_calibrate_rounds.return_value = 13
+        result = self.app.test_cli_runner().invoke(
+            args=["calibrate-bcrypt-rounds", "--target-time", "0.5"]
+        )
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(result.output, "BCRYPT_ROUNDS = 13\n")
+        mock_calibrate_rounds.assert_called_once_with(0.5, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+import uuid
+
+from auth.utils.login_throttle import (
+    MemoryBucketStore,
+    SharedMemoryBucketStore,
+)
+
+
+class BucketStoreTestMixin:
+    def test_burst_then_refill(self):
+        waits = [self.store.consume("key", 3, 1.0, 100.0) for _ in range(4)]
+        self.assertEqual(waits[:3], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(waits[3], 1.0)
+        self.assertEqual(self.store.consume("key", 3, 1.0, 101.0), 0.0)
+
+    def test_keys_are_independent(self):
+        self.store.consume("key", 1, 1.0, 100.0)
+        self.assertTrue(self.store.consume("key", 1, 1.0, 100.0))
+        self.assertFalse(self.store.consume("other", 1, 1.0, 100.0))
+
+
+class MemoryBucketStoreTestCase(BucketStoreTestMixin, unittest.TestCase):
+    def setUp(self):
+        self.store = MemoryBucketStore(16)
+
+    def test_memory_is_bounded(self):
+        for i in range(32):
+            self.store.consume(f"key-{i}", 1, 1.0, 100.0)
+        self.assertEqual(len(self.store._buckets), 16)
+
+
+class SharedMemoryBucketStoreTestCase(BucketStoreTestMixin, unittest.TestCase):
+    def setUp(self):
+        name = f"test_login_throttle_{uuid.uuid4().hex[:8]}"
+        self.store = SharedMemoryBucketStore(64, name)
+        self.other_worker_store = SharedMemoryBucketStore(64, name)
+
+    def tearDown(self):
+        self.store._memory.close()
+        self.other_worker_store._memory.close()
+        self.store._memory.unlink()
+
+    def test_buckets_are_shared(self):
+        self.store.consume("key", 1, 1.0, 100.0)
+        self.assertTrue(self.other_worker_store.consume("key", 1, 1.0, 100.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
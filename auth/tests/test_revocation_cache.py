@@ -0,0 +1,58 @@
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from auth.utils.revocation_cache import BloomFilter, RevocationCache
+
+
+class BloomFilterTestCase(unittest.TestCase):
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(100)
+        keys = [f"jti-{i}" for i in range(100)]
+        for key in keys:
+            bloom.add(key)
+        self.assertTrue(all(key in bloom for key in keys))
+
+
+class RevocationCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.cache = RevocationCache(maxsize=4, negative_ttl=60)
+        self.expires_at = time.time() + 3600
+
+    def test_not_revoked_is_cached(self):
+        loader = MagicMock(return_value=None)
+        self.assertFalse(self.cache.is_revoked("a", self.expires_at, loader))
+        self.assertFalse(self.cache.is_revoked("a", self.expires_at, loader))
+        loader.assert_called_once_with("a")
+
+    def test_revoked_is_cached(self):
+        loader = MagicMock(return_value=object())
+        self.assertTrue(self.cache.is_revoked("a", self.expires_at, loader))
+        self.assertTrue(self.cache.is_revoked("a", self.expires_at, loader))
+        loader.assert_called_once_with("a")
+
+    def test_revoke_invalidates_negative_entry(self):
+        loader = MagicMock(return_value=None)
+        self.assertFalse(self.cache.is_revoked("a", self.expires_at, loader))
+        self.cache.revoke("a", self.expires_at)
+        self.assertTrue(self.cache.is_revoked("a", self.expires_at, loader))
+        loader.assert_called_once_with("a")
+
+    def test_negative_ttl_is_bounded_by_token_expiry(self):
+        loader = MagicMock(return_value=None)
+        self.cache.is_revoked("a", time.time() - 1, loader)
+        self.cache.is_revoked("a", time.time() - 1, loader)
+        self.assertEqual(loader.call_count, 2)
+
+    def test_evicted_revoked_entry_falls_back_to_loader(self):
+        for i in range(5):
+            self.cache.revoke(f"jti-{i}", self.expires_at)
+        loader = MagicMock(return_value=object())
+        self.assertTrue(
+            self.cache.is_revoked("jti-0", self.expires_at, loader)
+        )
+        loader.assert_called_once_with("jti-0")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,15 +6,25 @@ from unittest.mock import patch
 from flask_jwt_extended import create_refresh_token, get_jwt
 from marshmallow import ValidationError
 
+from auth.utils.login_throttle import MemoryBucketStore, login_throttle
+from auth.utils.revocation_cache import epoch_cache
 from users import models as user_models
 from utils.constants import (
+    SERVER_IS_BUSY,
+    TOO_MANY_LOGIN_ATTEMPTS,
     EMAIL_DOES_NOT_EXISTS,
     PW_DO_NOT_MATCH,
     EMAIL_NOT_ACTIVE_USER,
 )
-from utils.custom_exceptions import SearchException, InvalidCredentials
+from utils.custom_exceptions import (
+    SearchException,
+    InvalidCredentials,
+    Overloaded,
+    TooManyRequests,
+)
+from utils.password_hasher import get_rounds, password_hasher
 from utils.test_utils import BaseTestCase, create_obj, get_headers
-from utils.utils import get_hashed_password
+from utils.utils import check_password, get_hashed_password
 
 
 class AuthTestCase(BaseTestCase):
@@ -32,9 +42,9 @@ class AuthTestCase(BaseTestCase):
         student.password.encode("utf8")
     ).decode("utf-8")
 
-    @patch("users.models.UserModel.get_by_email")
-    def test_login_user_success(self, mock_user_get_by_email):
-        mock_user_get_by_email.return_value = self.student
+    @patch("users.models.UserModel.get_credentials_by_email")
+    def test_login_user_success(self, mock_get_credentials_by_email):
+        mock_get_credentials_by_email.return_value = self.student
         data = {"email": "studw@gmail.com", "password": "Awnafjfawga12@"}
         response = self.client.post("auth/login", json=data)
         response_data = json.loads(response.data.decode("utf-8"))["data"]
@@ -43,6 +53,35 @@ class AuthTestCase(BaseTestCase):
         self.assertTrue(response_data["access_token"])
         self.assertTrue(response_data["refresh_token"])
 
+    @patch("users.models.UserModel.update_password_hash")
+    @patch("users.models.UserModel.get_credentials_by_email")
+    def test_login_user_rehashes_password(
+        self, mock_get_credentials_by_email, mock_update_password_hash
+    ):
+        mock_get_credentials_by_email.return_value = self.student
+        data = {"email": "studw@gmail.com", "password": "Awnafjfawga12@"}
+        stored_hash = self.student.password
+        self.addCleanup(setattr, self.student, "password", stored_hash)
+        # hashed with BCRYPT_ROUNDS of the testing config
+        self.student.password = get_hashed_password(
+            data["password"].encode("utf-8")
+        ).decode("utf-8")
+        self.assertEqual(get_rounds(self.student.password), 4)
+        with patch.object(password_hasher, "rounds", 5):
+            response = self.client.post("auth/login", json=data)
+            self.assertEqual(response.status_code, 200)
+            user_id, password_hash = mock_update_password_hash.call_args[0]
+            self.assertEqual(user_id, self.student_id)
+            self.assertEqual(get_rounds(password_hash), 5)
+            self.assertTrue(check_password(data["password"], password_hash))
+            mock_update_password_hash.reset_mock()
+            self.student.password = password_hash
+            self.client.post("auth/login", json=data)
+            mock_update_password_hash.assert_not_called()
+        # a lower cost than the stored one keeps the stronger hash
+        self.client.post("auth/login", json=data)
+        mock_update_password_hash.assert_not_called()
+
     def test_login_user_fail_wrong_email(self):
         data = {"email": "studgmail.com", "password": "Awnafjfawga12@"}
         with self.assertRaises(ValidationError) as context:
@@ -50,9 +89,11 @@ class AuthTestCase(BaseTestCase):
         message = "{'email': ['Invalid Email Address']}"
         self.assertEqual(str(context.exception), message)
 
-    @patch("users.models.UserModel.get_by_email")
-    def test_login_user_fail_user_not_found(self, mock_user_get_by_email):
-        mock_user_get_by_email.return_value = None
+    @patch("users.models.UserModel.get_credentials_by_email")
+    def test_login_user_fail_user_not_found(
+        self, mock_get_credentials_by_email
+    ):
+        mock_get_credentials_by_email.return_value = None
         data = {"email": "studw1@gmail.com", "password": "Awnafjfawga12@"}
         with self.assertRaises(SearchException) as context:
             self.client.post("auth/login", json=data)
@@ -60,9 +101,11 @@ class AuthTestCase(BaseTestCase):
             str(context.exception), EMAIL_DOES_NOT_EXISTS.format(data["email"])
         )
 
-    @patch("users.models.UserModel.get_by_email")
-    def test_login_user_fail_user_not_active(self, mock_user_get_by_email):
-        mock_user_get_by_email.return_value = self.student
+    @patch("users.models.UserModel.get_credentials_by_email")
+    def test_login_user_fail_user_not_active(
+        self, mock_get_credentials_by_email
+    ):
+        mock_get_credentials_by_email.return_value = self.student
         self.student.is_active = False
         data = {"email": "studw@gmail.com", "password": "Awnafjfawga12@"}
         with self.assertRaises(SearchException) as context:
@@ -72,14 +115,43 @@ class AuthTestCase(BaseTestCase):
         )
         self.student.is_active = True
 
-    @patch("users.models.UserModel.get_by_email")
-    def test_login_user_fail_wrong_password(self, mock_user_get_by_email):
-        mock_user_get_by_email.return_value = self.student
+    @patch("users.models.UserModel.get_credentials_by_email")
+    def test_login_user_fail_wrong_password(
+        self, mock_get_credentials_by_email
+    ):
+        mock_get_credentials_by_email.return_value = self.student
         data = {"email": "studw@gmail.com", "password": "Awnafjfawga122@"}
         with self.assertRaises(InvalidCredentials) as context:
             self.client.post("auth/login", json=data)
         self.assertEqual(str(context.exception), PW_DO_NOT_MATCH)
 
+    @patch.object(password_hasher, "max_pending", 0)
+    @patch("users.models.UserModel.get_credentials_by_email")
+    def test_login_user_fail_hashing_overloaded(
+        self, mock_get_credentials_by_email
+    ):
+        mock_get_credentials_by_email.return_value = self.student
+        data = {"email": "studw@gmail.com", "password": "Awnafjfawga12@"}
+        with self.assertRaises(Overloaded) as context:
+            self.client.post("auth/login", json=data)
+        self.assertEqual(str(context.exception), SERVER_IS_BUSY)
+
+    @patch.object(login_throttle, "email_limit", (2, 0.001))
+    @patch.object(login_throttle, "_store", MemoryBucketStore(10))
+    @patch.object(login_throttle, "enabled", True)
+    @patch("users.models.UserModel.get_credentials_by_email")
+    def test_login_user_fail_throttled(self, mock_get_credentials_by_email):
+        mock_get_credentials_by_email.return_value = self.student
+        data = {"email": "studw@gmail.com", "password": "Awnafjfawga122@"}
+        for _ in range(2):
+            with self.assertRaises(InvalidCredentials):
+                self.client.post("auth/login", json=data)
+        data["email"] = "StudW@gmail.com"
+        with self.assertRaises(TooManyRequests) as context:
+            self.client.post("auth/login", json=data)
+        self.assertEqual(str(context.exception), TOO_MANY_LOGIN_ATTEMPTS)
+        self.assertEqual(mock_get_credentials_by_email.call_count, 2)
+
     def test_login_user_fail_missing_required_fields(self):
         data = {
             "email": "studw@gmail.com",
@@ -112,6 +184,27 @@ class AuthTestCase(BaseTestCase):
             message, {"TokenException": "The token has been revoked."}
         )
 
+    @patch("users.models.UserModel.revoke_tokens_by_id")
+    @patch("users.models.UserModel.get_token_epoch")
+    def test_logout_user_everywhere(
+        self, mock_get_token_epoch, mock_revoke_tokens_by_id
+    ):
+        mock_get_token_epoch.return_value = 0
+        headers = get_headers(self.student.id)
+        mock_revoke_tokens_by_id.side_effect = lambda user_id: (
+            epoch_cache.set(user_id, 1)
+        )
+        response = self.client.post("auth/logout-all", headers=headers)
+        message = json.loads(response.data.decode("utf-8"))["message"]
+        self.assertEqual(message, "Successfully logged out everywhere")
+        mock_revoke_tokens_by_id.assert_called_once_with(str(self.student.id))
+        response = self.client.post("auth/logout-all", headers=headers)
+        message = json.loads(response.data.decode("utf-8"))["errors"]
+        self.assertEqual(response.status_code, 401)
+        self.assertDictEqual(
+            message, {"TokenException": "The token has been revoked."}
+        )
+
     def test_refresh_token(self):
         refresh_token = create_refresh_token(self.student_id)
         headers = {"Authorization": "Bearer {}".format(refresh_token)}
@@ -0,0 +1,151 @@
+import fcntl
+import hashlib
+import os
+import struct
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from multiprocessing import resource_tracker, shared_memory
+from typing import Optional, Tuple
+
+from utils.constants import TOO_MANY_LOGIN_ATTEMPTS
+from utils.custom_exceptions import TooManyRequests
+
+
+def take_token(
+    tokens: float, updated_at: float, burst: int, rate: float, now: float
+) -> Tuple[float, float]:
+    """Refills a token bucket and tries to take one token out of it
+
+    :param tokens: tokens left after the previous attempt
+    :param updated_at: time of the previous attempt
+    :param burst: bucket capacity
+    :param rate: tokens added per second
+    :param now: current time
+    :return: tokens left and seconds to wait (0 if a token was taken)
+    """
+    tokens = min(burst, tokens + (now - updated_at) * rate)
+    if tokens >= 1:
+        return tokens - 1, 0.0
+    return tokens, (1 - tokens) / rate
+
+
+class MemoryBucketStore:
+    """Token buckets of a single process, bounded to the newest keys"""
+
+    def __init__(self, max_keys: int) -> None:
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._buckets = OrderedDict()
+
+    def consume(self, key: str, burst: int, rate: float, now: float) -> float:
+        with self._lock:
+            tokens, updated_at = self._buckets.pop(key, (burst, now))
+            tokens, wait = take_token(tokens, updated_at, burst, rate, now)
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > self.max_keys:
+                # a forgotten bucket is a full one, so evict the idlest
+                self._buckets.popitem(last=False)
+            return wait
+
+
+class SharedMemoryBucketStore:
+    """Token buckets shared by all worker processes on the host
+
+    Buckets live in a fixed-size table of slots in a named shared memory
+    segment, guarded by a lock file. Keys that collide on a slot evict each
+    other, which resets the bucket to full like an LRU eviction would.
+    """
+
+    slot = struct.Struct("=Qdd")
+
+    def __init__(self, max_keys: int, name: str) -> None:
+        self.max_keys = max_keys
+        size = self.slot.size * max_keys
+        try:
+            self._memory = shared_memory.SharedMemory(
+                name=name, create=True, size=size
+            )
+        except FileExistsError:
+            self._memory = shared_memory.SharedMemory(name=name)
+        # the segment outlives any single worker; do not unlink it on exit
+        resource_tracker.unregister(self._memory._name, "shared_memory")
+        lock_path = os.path.join(tempfile.gettempdir(), f"{name}.lock")
+        self._lock_file = open(lock_path, "a")
+        self._thread_lock = threading.Lock()
+
+    def consume(self, key: str, burst: int, rate: float, now: float) -> float:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+        key_hash = int.from_bytes(digest, "little") or 1
+        offset = (key_hash % self.max_keys) * self.slot.size
+        with self._thread_lock:
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+            try:
+                stored_hash, tokens, updated_at = self.slot.unpack_from(
+                    self._memory.buf, offset
+                )
+                if stored_hash != key_hash:
+                    tokens, updated_at = burst, now
+                tokens, wait = take_token(tokens, updated_at, burst, rate, now)
+                self.slot.pack_into(
+                    self._memory.buf, offset, key_hash, tokens, now
+                )
+            finally:
+                fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+        return wait
+
+
+class LoginThrottle:
+    """Per-email and per-client-address rate limiting of login attempts"""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._store = None
+
+    def init_app(self, app) -> None:
+        config = app.config
+        self.enabled = config.get("LOGIN_RATE_LIMIT_ENABLED", True)
+        self.email_limit = (
+            config.get("LOGIN_RATE_LIMIT_EMAIL_BURST", 5),
+            config.get("LOGIN_RATE_LIMIT_EMAIL_RATE", 5 / 60),
+        )
+        self.address_limit = (
+            config.get("LOGIN_RATE_LIMIT_ADDRESS_BURST", 20),
+            config.get("LOGIN_RATE_LIMIT_ADDRESS_RATE", 20 / 60),
+        )
+        max_keys = config.get("LOGIN_RATE_LIMIT_MAX_KEYS", 100000)
+        if config.get("LOGIN_RATE_LIMIT_BACKEND", "memory") == "shared":
+            self._store = SharedMemoryBucketStore(
+                max_keys,
+                config.get("LOGIN_RATE_LIMIT_SHARED_NAME", "login_throttle"),
+            )
+        else:
+            self._store = MemoryBucketStore(max_keys)
+
+    def check(self, email: str, address: Optional[str]) -> None:
+        """Takes a token from the email and the client address buckets
+
+        :param email: email the client tries to log in with
+        :type email: str
+        :param address: client address
+        :type address: Optional[str]
+        :return: None
+        :raises:
+            TooManyRequests: if either of the buckets is empty
+        """
+        if not self.enabled:
+            return
+        now = time.time()
+        wait = self._store.consume(
+            "address:{}".format(address), *self.address_limit, now
+        )
+        if not wait:
+            wait = self._store.consume(
+                "email:{}".format(email.lower()), *self.email_limit, now
+            )
+        if wait:
+            raise TooManyRequests(TOO_MANY_LOGIN_ATTEMPTS, retry_after=wait)
+
+
+login_throttle = LoginThrottle()
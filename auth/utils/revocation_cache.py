@@ -0,0 +1,218 @@
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class BloomFilter:
+    """Probabilistic set of revoked jtis without false negatives"""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        self.capacity = capacity
+        self.size = max(
+            8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (first + i * second) % self.size
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+
+class TTLCache:
+    """Bounded LRU mapping of keys to values that expire"""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+
+    def get(self, key: Hashable, now: float, default: Any = None) -> Any:
+        item = self._data.get(key, None)
+        if item is None:
+            return default
+        value, expires_at = item
+        if expires_at <= now:
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, expires_at: float) -> None:
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def keys(self):
+        return list(self._data.keys())
+
+
+class RevocationCache:
+    """In-process cache in front of the token blocklist table
+
+    Revoked jtis are kept in a Bloom filter and a bounded LRU until their
+    token expires. Tokens that are not revoked are cached only for
+    ``JWT_BLOCKLIST_NEGATIVE_TTL`` seconds, which bounds how long another
+    worker's logout can go unnoticed.
+    """
+
+    def __init__(self, maxsize: int = 10000, negative_ttl: float = 30) -> None:
+        self._lock = threading.Lock()
+        self.configure(maxsize, negative_ttl)
+
+    def init_app(self, app) -> None:
+        self.configure(
+            app.config.get("JWT_BLOCKLIST_CACHE_SIZE", self.maxsize),
+            app.config.get("JWT_BLOCKLIST_NEGATIVE_TTL", self.negative_ttl),
+        )
+
+    def configure(self, maxsize: int, negative_ttl: float) -> None:
+        with self._lock:
+            self.maxsize = maxsize
+            self.negative_ttl = negative_ttl
+            self._bloom = BloomFilter(maxsize * 2)
+            self._revoked = TTLCache(maxsize)
+            self._not_revoked = TTLCache(maxsize)
+
+    def is_revoked(
+        self,
+        jti: str,
+        expires_at: Optional[float],
+        loader: Callable[[str], object],
+    ) -> bool:
+        """Checks if the token is revoked, querying the loader on a miss
+
+        :param jti: unique token identifier
+        :type jti: str
+        :param expires_at: token "exp" claim (unix timestamp) or None
+        :type expires_at: Optional[float]
+        :param loader: callable that returns the blocklist row or None
+        :type loader: Callable[[str], object]
+        :return: True if the token is revoked, otherwise False
+        """
+        now = time.time()
+        cached = self._get_cached(jti, now)
+        if cached is not None:
+            return cached
+        revoked = loader(jti) is not None
+        if revoked:
+            self.revoke(jti, expires_at)
+        else:
+            self._cache_not_revoked(jti, expires_at, now)
+        return revoked
+
+    def _get_cached(self, jti: str, now: float) -> Optional[bool]:
+        """Gets the cached answer for the token, None on a miss"""
+        if jti in self._bloom:
+            cache, revoked = self._revoked, True
+        else:
+            cache, revoked = self._not_revoked, False
+        with self._lock:
+            return revoked if cache.get(jti, now) else None
+
+    def _cache_not_revoked(
+        self, jti: str, expires_at: Optional[float], now: float
+    ) -> None:
+        ttl_end = now + self.negative_ttl
+        if expires_at is not None:
+            ttl_end = min(ttl_end, expires_at)
+        with self._lock:
+            if not self._revoked.get(jti, now):
+                self._not_revoked.set(jti, True, ttl_end)
+
+    def revoke(self, jti: str, expires_at: Optional[float]) -> None:
+        """Marks the token as revoked until it expires
+
+        :param jti: unique token identifier
+        :type jti: str
+        :param expires_at: token "exp" claim (unix timestamp) or None
+        :type expires_at: Optional[float]
+        :return: None
+        """
+        with self._lock:
+            self._not_revoked.discard(jti)
+            self._revoked.set(
+                jti, True, expires_at if expires_at is not None else math.inf
+            )
+            if self._bloom.count >= self._bloom.capacity:
+                self._rebuild_bloom()
+            self._bloom.add(jti)
+
+    def _rebuild_bloom(self) -> None:
+        self._bloom = BloomFilter(self.maxsize * 2)
+        for key in self._revoked.keys():
+            self._bloom.add(key)
+
+
+class EpochCache:
+    """In-process cache of users' token revocation epochs
+
+    Every token carries the epoch of its user at the moment it was issued.
+    Bumping the epoch revokes all of them at once; other workers notice it
+    within ``JWT_EPOCH_CACHE_TTL`` seconds.
+    """
+
+    _missing = object()
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 30) -> None:
+        self._lock = threading.Lock()
+        self.configure(maxsize, ttl)
+
+    def init_app(self, app) -> None:
+        self.configure(
+            app.config.get("JWT_BLOCKLIST_CACHE_SIZE", self.maxsize),
+            app.config.get("JWT_EPOCH_CACHE_TTL", self.ttl),
+        )
+
+    def configure(self, maxsize: int, ttl: float) -> None:
+        with self._lock:
+            self.maxsize = maxsize
+            self.ttl = ttl
+            self._epochs = TTLCache(maxsize)
+
+    def get(
+        self, user_id: str, loader: Callable[[str], Optional[int]]
+    ) -> Optional[int]:
+        """Gets the current epoch of the user, querying the loader on a miss
+
+        :param user_id: user id (the "sub" claim)
+        :type user_id: str
+        :param loader: callable that returns the epoch or None
+        :type loader: Callable[[str], Optional[int]]
+        :return: epoch of the user or None if the user does not exist
+        """
+        with self._lock:
+            epoch = self._epochs.get(user_id, time.time(), self._missing)
+        if epoch is self._missing:
+            epoch = loader(user_id)
+            self.set(user_id, epoch)
+        return epoch
+
+    def set(self, user_id: str, epoch: Optional[int]) -> None:
+        with self._lock:
+            self._epochs.set(user_id, epoch, time.time() + self.ttl)
+
+
+revocation_cache = RevocationCache()
+epoch_cache = EpochCache()
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Tuple, Dict, Any
 
 from flask_jwt_extended import (
@@ -9,6 +10,8 @@ from flask_jwt_extended import (
 )
 
 from auth import schemas as auth_schemas
+from auth.utils.login_throttle import login_throttle
+from auth.utils.revocation_cache import revocation_cache
 from flask import request
 
 from users import models as user_models
@@ -18,7 +21,8 @@ from utils.constants import (
     PW_DO_NOT_MATCH,
 )
 from utils.custom_exceptions import SearchException, InvalidCredentials
-from utils.utils import check_password
+from utils.password_hasher import password_hasher
+from utils.utils import check_password, get_hashed_password
 
 login_schema = auth_schemas.LoginSchema()
 token_blocklist_schema = auth_schemas.TokenBlocklistSchema()
@@ -33,15 +37,25 @@ def login_user() -> Tuple[Dict[str, Any], int]:
 
     user_json = request.get_json()
     loaded_user = login_schema.load(user_json)
-    user = user_models.UserModel.get_by_email(loaded_user["email"])
+    login_throttle.check(loaded_user["email"], request.remote_addr)
+    user = user_models.UserModel.get_credentials_by_email(loaded_user["email"])
     if not user:
         raise SearchException(
             EMAIL_DOES_NOT_EXISTS.format(loaded_user["email"])
         )
     if not user.is_active:
-        raise SearchException(EMAIL_NOT_ACTIVE_USER.format(user.email))
+        raise SearchException(
+            EMAIL_NOT_ACTIVE_USER.format(loaded_user["email"])
+        )
     if not check_password(loaded_user["password"], user.password):
         raise InvalidCredentials(PW_DO_NOT_MATCH)
+    if password_hasher.needs_rehash(user.password):
+        user_models.UserModel.update_password_hash(
+            user.id,
+            get_hashed_password(
+                loaded_user["password"].encode("utf-8")
+            ).decode("utf-8"),
+        )
     access_token = create_access_token(identity=user.id, fresh=True)
     refresh_token = create_refresh_token(user.id)
     return {
@@ -59,12 +73,26 @@ def logout_user() -> Tuple[Dict[str, Any], int]:
 
     :return: Tuple with a dictionary that contains "status message" and status code
     """
-    jti = get_jwt()["jti"]
+    jwt_data = get_jwt()
+    jti = jwt_data["jti"]
     blocklist_obj = token_blocklist_schema.load({"jti": jti})
+    if "exp" in jwt_data:
+        blocklist_obj.expires_at = datetime.utcfromtimestamp(jwt_data["exp"])
     blocklist_obj.save_to_db()
+    revocation_cache.revoke(jti, jwt_data.get("exp", None))
     return {"message": "Successfully logged out"}, 200
 
 
+@jwt_required()
+def logout_user_everywhere() -> Tuple[Dict[str, Any], int]:
+    """Logout user from all devices, revoking every token issued to the user
+
+    :return: Tuple with a dictionary that contains "status message" and status code
+    """
+    user_models.UserModel.revoke_tokens_by_id(get_jwt_identity())
+    return {"message": "Successfully logged out everywhere"}, 200
+
+
 @jwt_required(refresh=True)
 def refresh() -> Tuple[Dict[str, Any], int]:
     """Refreshes expired access_token for User
@@ -0,0 +1,75 @@
+"""Bandwidth and CPU cost of compressing real responses.
+
+Fetches pages of nested subjects and teachers (and one subject alone)
+from a seeded database, then compresses every body the way
+``utils.compression`` does, with gzip at several levels and deflate.
+Run against a disposable database (it is dropped and re-created), e.g.::
+
+    python -m benchmarks.compression --subjects 1000 --teachers 300
+"""
+import argparse
+import statistics
+import time
+import zlib
+
+from application import create_app
+from benchmarks.seed import reset_database, seed_subjects, seed_users
+from utils import envelope
+from utils.compression import WBITS
+
+URLS = (
+    "/subjects?limit=1&fields=id,name,year,credits",
+    "/subjects?limit=50&expand=teachers",
+    "/subjects?limit=200&expand=teachers",
+    "/users/teachers/?limit=200&expand=subjects",
+)
+
+
+def compress(data, encoding, level):
+    compressor = zlib.compressobj(level, wbits=WBITS[encoding])
+    return compressor.compress(data) + compressor.flush()
+
+
+def measure(data, encoding, level, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        compressed = compress(data, encoding, level)
+        timings.append(time.perf_counter() - start)
+    return len(compressed), statistics.median(timings) * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--subjects", type=int, default=1000)
+    parser.add_argument("--teachers", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    app = create_app()
+    envelope.init_app(app)
+    with app.app_context():
+        reset_database()
+        _, teacher_ids = seed_users(0, args.teachers)
+        seed_subjects(args.subjects, teacher_ids)
+    client = app.test_client()
+    for url in URLS:
+        response = client.get(url)
+        assert response.status_code == 200, response.data
+        data = response.get_data()
+        print(f"{url} ({len(data)} bytes)")
+        for encoding, level in (
+            ("gzip", 1),
+            ("gzip", 6),
+            ("gzip", 9),
+            ("deflate", 6),
+        ):
+            size, elapsed = measure(data, encoding, level, args.repeat)
+            print(
+                f"    {encoding:8}{level:2}: {size:8} bytes "
+                f"({len(data) / size:5.1f}x){elapsed:8.2f} ms "
+                f"({len(data) / 2**20 / (elapsed / 1e3):6.1f} MiB/s)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Cost of enveloping large list responses.
+
+The former ``form_response`` hook let Flask serialize the view return
+value, parsed it back, passed it through a marshmallow schema and
+serialized it again. ``utils.envelope`` serializes the envelope once,
+with each JSON backend. All are timed on synthetic pages of subjects, without a database::
+
+    python -m benchmarks.envelope --rows 50 200 1000
+"""
+import argparse
+import json
+import statistics
+import time
+import uuid
+from datetime import datetime
+
+from marshmallow import Schema, fields
+
+from application import create_app
+from utils import envelope, json_backend
+
+
+class LegacyResponse(Schema):
+    class Meta:
+        ordered = True
+
+    status = fields.Dict()
+    data = fields.Raw(required=False)
+    errors = fields.List(fields.Dict(), required=False)
+
+
+legacy_schema = LegacyResponse()
+
+
+def legacy_form_response(response):
+    response_json = response.get_json()
+    if not response_json:
+        return response
+    message = response_json.get("message", None)
+    message = message if message else response._status
+    result_json = {
+        "status": {"message": message, "code": response._status_code}
+    }
+    data = response_json.get("data", None)
+    if data:
+        result_json["data"] = data
+    errors = response_json.get("errors", None)
+    if errors:
+        errors = errors if isinstance(errors, list) else [errors]
+        result_json["errors"] = errors
+    processed_response = legacy_schema.load(result_json)
+    response.data = json.dumps(legacy_schema.dump(processed_response))
+    return response
+
+
+def get_page(rows):
+    now = datetime.utcnow().isoformat()
+    subjects = [
+        {
+            "id": str(uuid.uuid4()),
+            "name": f"Subject {index}",
+            "year": 2020,
+            "credits": 5,
+            "created_at": now,
+            "updated_at": now,
+            "teachers": [
+                {"id": str(uuid.uuid4()), "first_name": "Teacher"}
+                for _ in range(3)
+            ],
+        }
+        for index in range(rows)
+    ]
+    return {"data": {"subjects": subjects, "next_cursor": "cursor"}}
+
+
+def measure(make_response, body, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        make_response(body)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1e3
+
+
+def create_enveloped_app(backend):
+    app = create_app()
+    app.config["JSON_BACKEND"] = backend
+    json_backend.init_app(app)
+    envelope.init_app(app)
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[50, 200])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    legacy_app = create_app()
+    apps = {name: create_enveloped_app(name) for name in json_backend.BACKENDS}
+    for rows in args.rows:
+        body = get_page(rows)
+        with legacy_app.test_request_context():
+            legacy = measure(
+                lambda rv: legacy_form_response(legacy_app.make_response(rv)),
+                body,
+                args.repeat,
+            )
+            legacy_bytes = legacy_form_response(
+                legacy_app.make_response(body)
+            ).get_data()
+        print(f"rows: {rows} ({len(legacy_bytes)} bytes)")
+        print(f"    {'form_response round trip:':34}{legacy:8.2f} ms")
+        for name, app in apps.items():
+            with app.test_request_context():
+                enveloped = measure(app.make_response, body, args.repeat)
+                enveloped_bytes = app.make_response(body).get_data()
+            assert json.loads(enveloped_bytes) == json.loads(legacy_bytes)
+            if name == "json":
+                assert enveloped_bytes == legacy_bytes
+            label = f"single serialization ({name}):"
+            print(f"    {label:34}{enveloped:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
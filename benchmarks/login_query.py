@@ -0,0 +1,78 @@
+"""Login lookup: full polymorphic entity vs. the lean credentials row.
+
+``UserModel.get_by_email(polymorphic=True)`` loads the whole entity,
+outer-joining the student and teacher tables.
+``UserModel.get_credentials_by_email`` selects only id, password,
+is_active and type from "user". Run against a disposable database (it is dropped and re-created), e.g.::
+
+    python -m benchmarks.login_query --students 50000 --teachers 2000
+"""
+import argparse
+import random
+import statistics
+import time
+
+from application import create_app
+from application.db import db
+from benchmarks.seed import reset_database, seed_users
+from users import models as user_models
+
+
+def measure(lookup, emails, repeat):
+    timings = []
+    for _ in range(repeat):
+        for email in emails:
+            start = time.perf_counter()
+            lookup(email)
+            timings.append(time.perf_counter() - start)
+            db.session.expunge_all()
+    return statistics.median(timings) * 1e6
+
+
+def explain(sql, email):
+    plan = db.session.execute(
+        db.text("EXPLAIN ANALYZE " + sql), {"email": email}
+    ).scalars()
+    return "\n".join("    " + line for line in plan)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--students", type=int, default=50000)
+    parser.add_argument("--teachers", type=int, default=2000)
+    parser.add_argument("--lookups", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    app = create_app()
+    with app.app_context():
+        reset_database()
+        student_ids, teacher_ids = seed_users(args.students, args.teachers)
+        emails = [
+            f"student-{user_id}@gmail.com"
+            for user_id in random.sample(student_ids, args.lookups // 2)
+        ] + [
+            f"teacher-{user_id}@gmail.com"
+            for user_id in random.sample(teacher_ids, args.lookups // 2)
+        ]
+        model = user_models.UserModel
+        full = measure(
+            lambda email: model.get_by_email(email, polymorphic=True),
+            emails,
+            args.repeat,
+        )
+        lean = measure(model.get_credentials_by_email, emails, args.repeat)
+        print(f"users: {args.students + args.teachers}")
+        print(f"get_by_email:             {full:8.1f} us/lookup")
+        print(f"get_credentials_by_email: {lean:8.1f} us/lookup")
+        print("plan of the lean query:")
+        print(
+            explain(
+                'SELECT id, password, is_active, type FROM "user" '
+                "WHERE lower(email) = lower(:email)",
+                emails[0],
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
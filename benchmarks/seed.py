@@ -0,0 +1,127 @@
+"""Bulk seeding helpers shared by the benchmarks."""
+import uuid
+
+from application.db import db
+from groups import models as group_models
+from positions import models as position_models
+from subjects import models as subject_models
+from users import models as user_models
+
+# bcrypt hash of "Awnafjfawga12@" with cost 4, so seeding stays fast
+PASSWORD_HASH = "$2b$04$VNOEgWoemOACHujFqQGhbuFY6ITy6VSNoNVHB/ByMCfM/7hc8yFZm"
+
+
+def reset_database():
+    db.session.remove()
+    db.drop_all()
+    db.create_all()
+
+
+def insert_users(table, rows, user_type, batch_size=5000):
+    user_table = user_models.UserModel.__table__
+    for start in range(0, len(rows), batch_size):
+        end = start + batch_size
+        batch = rows[start:end]
+        db.session.execute(
+            user_table.insert(),
+            [
+                {
+                    "id": row["id"],
+                    "email": f"{user_type}-{row['id']}@gmail.com",
+                    "first_name": user_type,
+                    "last_name": user_type,
+                    "password": PASSWORD_HASH,
+                    "age": 20,
+                    "is_active": True,
+                    "type": user_type,
+                }
+                for row in batch
+            ],
+        )
+        db.session.execute(table.insert(), batch)
+    db.session.commit()
+
+
+def seed_users(students, teachers):
+    """Inserts students, teachers and a position for the teachers
+
+    :return: lists of student ids and teacher ids
+    """
+    position_id = uuid.uuid4()
+    db.session.execute(
+        position_models.PositionModel.__table__.insert(),
+        {"id": position_id, "position_name": f"position-{position_id}"},
+    )
+    student_rows = [
+        {"id": uuid.uuid4(), "year_of_study": 1 + i % 8}
+        for i in range(students)
+    ]
+    teacher_rows = [
+        {"id": uuid.uuid4(), "position_id": position_id}
+        for _ in range(teachers)
+    ]
+    insert_users(user_models.StudentModel.__table__, student_rows, "student")
+    insert_users(user_models.TeacherModel.__table__, teacher_rows, "teacher")
+    return (
+        [row["id"] for row in student_rows],
+        [row["id"] for row in teacher_rows],
+    )
+
+
+def seed_subjects(subjects, teacher_ids, teachers_per_subject=3):
+    """Inserts subjects, each taught by some of the teachers
+
+    :return: list of subject ids
+    """
+    subject_table = subject_models.SubjectModel.__table__
+    subject_rows = [
+        {
+            "id": uuid.uuid4(),
+            "name": f"subject-{index}",
+            "year": 2000 + index % 20,
+            "credits": 1 + index % 6,
+        }
+        for index in range(subjects)
+    ]
+    db.session.execute(subject_table.insert(), subject_rows)
+    db.session.execute(
+        subject_models.subject_teacher.insert(),
+        [
+            {"subject_id": row["id"], "teacher_id": teacher_id}
+            for index, row in enumerate(subject_rows)
+            for teacher_id in {
+                teacher_ids[(index + offset) % len(teacher_ids)]
+                for offset in range(teachers_per_subject)
+            }
+        ],
+    )
+    db.session.commit()
+    return [row["id"] for row in subject_rows]
+
+
+def seed_groups(groups, student_ids, students_per_group=25):
+    """Inserts groups of consecutive students
+
+    :return: list of group ids
+    """
+    group_rows = [
+        {
+            "id": uuid.uuid4(),
+            "name": f"group-{index}",
+            "year": 2000 + index % 20,
+            "credits_per_student": 60,
+        }
+        for index in range(groups)
+    ]
+    db.session.execute(group_models.GroupModel.__table__.insert(), group_rows)
+    member_rows = []
+    for index, row in enumerate(group_rows):
+        start = index * students_per_group
+        stop = start + students_per_group
+        member_rows += [
+            {"group_id": row["id"], "student_id": student_id}
+            for student_id in student_ids[start:stop]
+        ]
+    db.session.execute(group_models.group_student.insert(), member_rows)
+    db.session.commit()
+    return [row["id"] for row in group_rows]
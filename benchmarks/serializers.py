@@ -0,0 +1,104 @@
+"""marshmallow dump vs. the compiled dump functions.
+
+Loads thousands of rows of the compiled schemas from a seeded database,
+with and without nested relations, and dumps them with ``Schema.dump``
+of marshmallow and with the function ``utils.schemas.compiler``
+generates (``Meta.compiled`` off and on), checking that both give the
+same output. Run against a
+disposable database (it is dropped and re-created), e.g.::
+
+    python -m benchmarks.serializers --students 5000 --rows 2000
+"""
+import argparse
+import statistics
+import time
+
+from application import create_app
+from benchmarks.seed import (
+    reset_database,
+    seed_groups,
+    seed_subjects,
+    seed_users,
+)
+from groups import models as group_models
+from groups import schemas as group_schemas
+from subjects import models as subject_models
+from subjects import schemas as subject_schemas
+from users import models as user_models
+from users import schemas as user_schemas
+from utils.schemas.projection import get_loader_options, get_schema
+
+CASES = (
+    (user_models.StudentModel, user_schemas.StudentSchema, ()),
+    (user_models.StudentModel, user_schemas.StudentSchema, ("groups",)),
+    (user_models.TeacherModel, user_schemas.TeacherSchema, ("subjects",)),
+    (subject_models.SubjectModel, subject_schemas.SubjectSchema, ()),
+    (
+        subject_models.SubjectModel,
+        subject_schemas.SubjectSchema,
+        ("teachers",),
+    ),
+    (group_models.GroupModel, group_schemas.GroupSchema, ("students",)),
+)
+
+
+COMPILED_SCHEMAS = (
+    user_schemas.StudentSchema,
+    user_schemas.TeacherSchema,
+    subject_schemas.SubjectSchema,
+    group_schemas.GroupSchema,
+)
+
+
+def set_compiled(compiled):
+    for schema_class in COMPILED_SCHEMAS:
+        schema_class.opts.compiled = compiled
+
+
+def measure(dump, records, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        dump(records)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--students", type=int, default=5000)
+    parser.add_argument("--teachers", type=int, default=500)
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    app = create_app()
+    with app.app_context():
+        reset_database()
+        student_ids, teacher_ids = seed_users(args.students, args.teachers)
+        seed_subjects(args.rows, teacher_ids)
+        seed_groups(args.students // 25, student_ids)
+        for model, schema_class, expand in CASES:
+            schema = get_schema(schema_class, expand=expand)
+            records, _ = model.get_page(
+                limit=args.rows, options=get_loader_options(model, expand)
+            )
+
+            def dump(rows):
+                return schema.dump(rows, many=True)
+
+            set_compiled(False)
+            expected = dump(records)
+            original = measure(dump, records, args.repeat)
+            set_compiled(True)
+            assert dump(records) == expected
+            generated = measure(dump, records, args.repeat)
+            label = f"{schema_class.__name__} {','.join(expand)}"
+            print(
+                f"{label:28}{len(records):6} rows: marshmallow "
+                f"{original:8.1f} ms, compiled {generated:7.1f} ms "
+                f"({original / generated:4.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
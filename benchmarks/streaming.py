@@ -0,0 +1,63 @@
+"""Exporting every student: one huge page vs. the streaming mode.
+
+A page holds all its dumped rows in memory and sends the first byte once
+everything is serialized. ``?stream=true`` reads, dumps and writes the
+rows in batches of STREAM_BATCH_SIZE. Run against a disposable database
+(it is dropped and re-created), e.g.::
+
+    python -m benchmarks.streaming --students 50000
+"""
+import argparse
+import json
+import time
+import tracemalloc
+
+from application import create_app
+from benchmarks.seed import reset_database, seed_users
+from utils import envelope
+
+
+def measure(client, url):
+    tracemalloc.start()
+    start = time.perf_counter()
+    response = client.get(url, buffered=False)
+    chunks = iter(response.response)
+    size = len(next(chunks))
+    first_byte = time.perf_counter() - start
+    size += sum(len(chunk) for chunk in chunks)
+    total = time.perf_counter() - start
+    response.close()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return first_byte * 1e3, total * 1e3, peak / 2**20, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--students", type=int, default=50000)
+    args = parser.parse_args()
+    app = create_app()
+    # a page as large as the table stands for the former export
+    app.config["MAX_PAGE_SIZE"] = args.students
+    envelope.init_app(app)
+    with app.app_context():
+        reset_database()
+        seed_users(args.students, 0)
+    client = app.test_client()
+    paged = f"/users/students?limit={args.students}"
+    streamed = "/users/students?stream=true"
+    page_rows = json.loads(client.get(paged).data)["data"]["students"]
+    stream_rows = json.loads(client.get(streamed).data)["data"]["students"]
+    assert page_rows == stream_rows
+    print(f"students: {args.students}")
+    print(f"{'':10}{'first byte':>14}{'total':>12}{'peak':>12}{'size':>12}")
+    for name, url in (("page", paged), ("stream", streamed)):
+        first_byte, total, peak, size = measure(client, url)
+        print(
+            f"{name:10}{first_byte:11.1f} ms{total:9.1f} ms"
+            f"{peak:8.1f} MiB{size / 2**20:8.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Lookup latency of the token blocklist as total logouts grow.
+
+Every round simulates ``--logouts`` logouts whose tokens expire before
+the next round starts, then measures ``TokenBlocklistModel.get_by_jti``
+with and without purging expired rows. Run against a disposable
+database, e.g.::
+
+    python -m benchmarks.token_blocklist --rounds 10 --logouts 20000
+"""
+import argparse
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from application import create_app
+from application.db import db
+from auth import models as auth_models
+
+
+def insert_logouts(count, expires_at):
+    table = auth_models.TokenBlocklistModel.__table__
+    rows = [
+        {"jti": str(uuid.uuid4()), "expires_at": expires_at}
+        for _ in range(count)
+    ]
+    db.session.execute(table.insert(), rows)
+    db.session.commit()
+    return rows[-1]["jti"]
+
+
+def measure_lookup(jtis, repeat):
+    timings = []
+    for _ in range(repeat):
+        for jti in jtis:
+            start = time.perf_counter()
+            auth_models.TokenBlocklistModel.get_by_jti(jti)
+            timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1e6
+
+
+def run(rounds, logouts, purge, repeat):
+    auth_models.TokenBlocklistModel.query.delete()
+    db.session.commit()
+    print(f"purge={purge}")
+    print(f"{'round':>5} {'total logouts':>14} {'rows':>10} {'lookup us':>10}")
+    for round_number in range(1, rounds + 1):
+        recent_jti = insert_logouts(
+            logouts, datetime.utcnow() - timedelta(seconds=1)
+        )
+        if purge:
+            auth_models.TokenBlocklistModel.purge_expired()
+        missing_jtis = [str(uuid.uuid4()) for _ in range(50)]
+        latency = measure_lookup(missing_jtis + [recent_jti], repeat)
+        rows = auth_models.TokenBlocklistModel.query.count()
+        print(
+            f"{round_number:>5} {round_number * logouts:>14} "
+            f"{rows:>10} {latency:>10.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--logouts", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        for purge in (False, True):
+            run(args.rounds, args.logouts, purge, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,8 @@ from sqlalchemy.dialects.postgresql import UUID
 from application.db import db
 from utils.constants import MAX_NAME_LENGTH
 from utils.base_model import BaseModel
+from utils.filters import AssociationFilter, ColumnFilter, RANGE_OPERATORS
+from utils.loading_profiles import SELECTIN
 
 group_student = db.Table(
     "group_student",
@@ -17,6 +19,7 @@ group_student = db.Table(
         UUID(as_uuid=True),
         db.ForeignKey("student.id"),
         primary_key=True,
+        index=True,
     ),
 )
 
@@ -28,21 +31,40 @@ class GroupModel(BaseModel):
     year = db.Column(db.Integer, nullable=False)
     credits_per_student = db.Column(db.SmallInteger, nullable=False)
     curator_id = db.Column(
-        UUID(as_uuid=True), db.ForeignKey("teacher.id", ondelete="SET NULL")
+        UUID(as_uuid=True),
+        db.ForeignKey("teacher.id", ondelete="SET NULL"),
+        index=True,
     )
     specialty_id = db.Column(
-        UUID(as_uuid=True), db.ForeignKey("specialty.id", ondelete="SET NULL")
+        UUID(as_uuid=True),
+        db.ForeignKey("specialty.id", ondelete="SET NULL"),
+        index=True,
     )
     students = db.relationship(
         "StudentModel",
         secondary=group_student,
-        lazy="subquery",
+        lazy=True,
         backref=db.backref("groups", lazy=True),
     )
     specialty = db.relationship(
         "SpecialtyModel", uselist=False, back_populates="groups"
     )
 
+    filter_fields = {
+        "year": ColumnFilter("year", RANGE_OPERATORS),
+        "specialty_id": ColumnFilter("specialty_id"),
+        "curator_id": ColumnFilter("curator_id"),
+        "student_id": AssociationFilter(
+            "group_student", "group_id", "student_id"
+        ),
+    }
+    sort_fields = ("name", "year")
+    natural_key = ("name", "year")
+    loading_profiles = {
+        "students": {"students": SELECTIN},
+        "subjects": {"subjects": SELECTIN},
+    }
+
     @classmethod
     def get_by_name_and_year(cls, name, year):
         return cls.query.filter_by(name=name, year=year).first()
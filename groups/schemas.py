@@ -1,9 +1,9 @@
 from marshmallow import EXCLUDE, validates, ValidationError
-from application.ma import ma
+from application.ma import AutoSchema, ma
 from groups import models as group_models
 
 
-class GroupSchema(ma.SQLAlchemyAutoSchema):
+class GroupSchema(AutoSchema):
     specialty = ma.Nested(
         "SpecialtySchema",
         many=False,
@@ -21,6 +21,8 @@ class GroupSchema(ma.SQLAlchemyAutoSchema):
         unknown = EXCLUDE
         dump_only = ("id", "created_on", "updated_on")
         include_fk = True
+        # see utils.schemas.compiler
+        compiled = True
 
     @validates("name")
     def validate_name(self, value):
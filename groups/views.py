@@ -16,20 +16,24 @@ from utils.constants import (
     EntityInfo,
 )
 from utils.utils import (
+    insert_with_name_and_year,
     is_active_user,
     update_obj_with_name_and_year,
 )
+from utils.conditional import get_headers, get_validators, is_modified
+from utils.schemas.pagination import PageSchema
+from utils.schemas.projection import get_projection
+from utils.streaming import stream_records
 
 
 group_schema = group_schemas.GroupSchema()
+page_schema = PageSchema()
 
 
-@create_obj_with_name_and_year(
-    group_models.GroupModel, GROUP, group_schema, request
-)
+@create_obj_with_name_and_year(group_schema, request)
 def create_group(group, group_json):
     is_active_user(group_json, CURATOR)
-    group.save_to_db()
+    insert_with_name_and_year(group, GROUP)
     group_json = group_schema.dump(group)
     return {
         "message": CREATED_SUCCESSFULLY.format(GROUP, group.id),
@@ -38,18 +42,41 @@ def create_group(group, group_json):
 
 
 def get_groups():
-    groups = [
-        group_schema.dump(group)
-        for group in group_models.GroupModel.get_all_records()
-    ]
-    return {"data": {"groups": groups}}, 200
+    schema, options = get_projection(group_schemas.GroupSchema, request.args)
+    page = page_schema.load(request.args)
+    if page.pop("stream"):
+        return stream_records(
+            group_models.GroupModel, "groups", schema, options, page
+        )
+    groups, next_cursor = group_models.GroupModel.get_page(
+        **page, options=options
+    )
+    validators = get_validators(
+        schema, groups, next_cursor, last_modified=False
+    )
+    if not is_modified(validators):
+        return "", 304, get_headers(validators)
+    return (
+        {
+            "data": {
+                "groups": schema.dump(groups, many=True),
+                "next_cursor": next_cursor,
+            }
+        },
+        200,
+        get_headers(validators),
+    )
 
 
 def get_group(group_id):
-    group = group_models.GroupModel.get_by_id(group_id)
+    schema, options = get_projection(group_schemas.GroupSchema, request.args)
+    group = group_models.GroupModel.get_by_id(group_id, options=options)
     if not group:
         return {"message": NOT_FOUND_BY_ID.format(GROUP, group_id)}, 400
-    return {"data": group_schema.dump(group)}, 200
+    validators = get_validators(schema, [group])
+    if not is_modified(validators):
+        return "", 304, get_headers(validators)
+    return {"data": schema.dump(group)}, 200, get_headers(validators)
 
 
 def update_group(group_id):
@@ -6,13 +6,13 @@ from utils.base_model import BaseModel
 class PositionModel(BaseModel):
     __tablename__ = "position"
 
-    position_name = db.Column(
-        db.String(MAX_NAME_LENGTH), nullable=False, unique=True
-    )
+    position_name = db.Column(db.String(MAX_NAME_LENGTH), nullable=False)
     teachers = db.relationship(
         "TeacherModel", uselist=True, back_populates="position"
     )
 
+    natural_key = ("position_name",)
+
     @classmethod
     def get_by_position_name(cls, position_name):
         return cls.query.filter_by(position_name=position_name).first()
@@ -1,9 +1,9 @@
 from marshmallow import EXCLUDE, validates, ValidationError
-from application.ma import ma
+from application.ma import AutoSchema, ma
 from positions import models as position_models
 
 
-class PositionSchema(ma.SQLAlchemyAutoSchema):
+class PositionSchema(AutoSchema):
     teachers = ma.Nested("TeacherSchema", many=True, exclude=("position",))
 
     class Meta:
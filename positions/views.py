@@ -10,21 +10,21 @@ from utils.constants import (
     SUCCESSFULLY_DELETED,
     ALREADY_EXISTS,
 )
+from utils.conditional import get_headers, get_validators, is_modified
+from utils.schemas.pagination import PageSchema
+from utils.schemas.projection import get_projection
+from utils.streaming import stream_records
 
 position_schema = position_schemas.PositionSchema()
+page_schema = PageSchema()
 
 
 def create_position():
-    position_json = request.get_json()
-    position = position_models.PositionModel.get_by_position_name(
-        str(position_json.get("position_name", None))
-    )
-    if position:
+    position = position_schema.load(request.get_json())
+    if not position.insert_unique():
         return {
             "message": ALREADY_EXISTS.format(POSITION, position.position_name)
         }, 400
-    position = position_schema.load(position_json)
-    position.save_to_db()
     position_json = position_schema.dump(position)
     return {
         "message": CREATED_SUCCESSFULLY.format(POSITION, position.id),
@@ -33,40 +33,66 @@ def create_position():
 
 
 def get_positions():
-    positions = [
-        position_schema.dump(position)
-        for position in position_models.PositionModel.get_all_records()
-    ]
-    return {"data": {"positions": positions}}, 200
+    schema, options = get_projection(
+        position_schemas.PositionSchema, request.args
+    )
+    page = page_schema.load(request.args)
+    if page.pop("stream"):
+        return stream_records(
+            position_models.PositionModel, "positions", schema, options, page
+        )
+    positions, next_cursor = position_models.PositionModel.get_page(
+        **page, options=options
+    )
+    validators = get_validators(
+        schema, positions, next_cursor, last_modified=False
+    )
+    if not is_modified(validators):
+        return "", 304, get_headers(validators)
+    return (
+        {
+            "data": {
+                "positions": schema.dump(positions, many=True),
+                "next_cursor": next_cursor,
+            }
+        },
+        200,
+        get_headers(validators),
+    )
 
 
 def get_position(position_id):
-    position = position_models.PositionModel.get_by_id(position_id)
+    schema, options = get_projection(
+        position_schemas.PositionSchema, request.args
+    )
+    position = position_models.PositionModel.get_by_id(
+        position_id, options=options
+    )
     if not position:
         return {"message": NOT_FOUND_BY_ID.format(POSITION, position_id)}, 400
-    return {"data": position_schema.dump(position)}, 200
+    validators = get_validators(schema, [position])
+    if not is_modified(validators):
+        return "", 304, get_headers(validators)
+    return {"data": schema.dump(position)}, 200, get_headers(validators)
 
 
 def update_position(position_id):
-    position = position_models.PositionModel.get_by_id(position_id)
+    changes = position_schema.load_changes(request.get_json())
+    position = position_models.PositionModel.update_returning(
+        position_id, changes
+    )
     if not position:
-        return {"message": NOT_FOUND_BY_ID.format(POSITION, position_id)}, 400
-    position_json = request.get_json()
-    position_name = position_json.get("position_name", None)
-    if position_name:
-        position_obj = position_models.PositionModel.get_by_position_name(
-            str(position_name)
-        )
-        if position_obj:
+        if "position_name" not in changes or not (
+            position_models.PositionModel.get_by_id(position_id, refresh=True)
+        ):
             return {
-                "message": ALREADY_EXISTS.format(
-                    POSITION, position_obj.position_name
-                )
+                "message": NOT_FOUND_BY_ID.format(POSITION, position_id)
             }, 400
-    position = position_schema.load(
-        position_json, instance=position, partial=True
-    )
-    position.save_to_db()
+        return {
+            "message": ALREADY_EXISTS.format(
+                POSITION, changes["position_name"]
+            )
+        }, 400
     position_json = position_schema.dump(position)
     return {
         "message": UPDATED_SUCCESSFULLY.format(POSITION, position_id),
@@ -2,6 +2,8 @@ from sqlalchemy.dialects.postgresql import UUID
 from application.db import db
 from utils.constants import MAX_NAME_LENGTH
 from utils.base_model import BaseModel
+from utils.filters import AssociationFilter, ColumnFilter, RANGE_OPERATORS
+from utils.loading_profiles import SELECTIN
 
 
 class SpecialtyModel(BaseModel):
@@ -10,12 +12,25 @@ class SpecialtyModel(BaseModel):
     name = db.Column(db.String(MAX_NAME_LENGTH), nullable=False)
     year = db.Column(db.Integer, nullable=False)
     teacher_id = db.Column(
-        UUID(as_uuid=True), db.ForeignKey("teacher.id", ondelete="SET NULL")
+        UUID(as_uuid=True),
+        db.ForeignKey("teacher.id", ondelete="SET NULL"),
+        index=True,
     )
     groups = db.relationship(
         "GroupModel", uselist=True, back_populates="specialty"
     )
 
+    filter_fields = {
+        "year": ColumnFilter("year", RANGE_OPERATORS),
+        "teacher_id": ColumnFilter("teacher_id"),
+        "subject_id": AssociationFilter(
+            "subject_specialty", "specialty_id", "subject_id"
+        ),
+    }
+    sort_fields = ("name", "year")
+    natural_key = ("name", "year")
+    loading_profiles = {"subjects": {"subjects": SELECTIN}}
+
     @classmethod
     def get_by_name_and_year(cls, name, year):
         return cls.query.filter_by(name=name, year=year).first()
@@ -1,9 +1,9 @@
 from marshmallow import EXCLUDE, validates, ValidationError
-from application.ma import ma
+from application.ma import AutoSchema, ma
 from specialties import models as specialty_models
 
 
-class SpecialtySchema(ma.SQLAlchemyAutoSchema):
+class SpecialtySchema(AutoSchema):
     teacher = ma.Nested("TeacherSchema", many=False, exclude=("specialty",))
 
     groups = ma.Nested("GroupSchema", many=True, exclude=("specialty",))
@@ -6,7 +6,11 @@ from unittest.mock import patch
 from utils import test_utils
 from users import models as user_models
 from specialties import models as specialty_models
-from utils.constants import NOT_FOUND_BY_ID, SPECIALTY
+from utils.constants import (
+    ALREADY_EXISTS_WITH_YEAR,
+    NOT_FOUND_BY_ID,
+    SPECIALTY,
+)
 from utils.custom_exceptions import SearchException
 
 
@@ -27,26 +31,26 @@ class SpecialtyTestCase(test_utils.BaseTestCase):
         data_specialty, specialty_models.SpecialtyModel
     )
 
-    @patch("specialties.models.SpecialtyModel.save_to_db")
+    @patch("specialties.models.SpecialtyModel.insert_unique")
     @patch("users.models.UserModel.get_by_id")
     @patch("specialties.models.SpecialtyModel.get_by_id")
     def test_create_specialty(
         self,
         mock_specialty_get_by_id,
         mock_teacher_get_by_id,
-        mock_specialty_save_to_db,
+        mock_specialty_insert_unique,
     ):
         mock_specialty_get_by_id.return_value = None
         mock_teacher_get_by_id.return_value = self.teacher
-        mock_specialty_save_to_db.return_value = None
+        mock_specialty_insert_unique.return_value = True
         response = self.client.post(
             "/specialties/create", json=self.data_specialty
         )
         self.assertEqual(response.status_code, 201)
 
-    @patch("specialties.models.SpecialtyModel.get_all_records")
-    def test_get_specialties(self, mock_specialty_get_all_records):
-        mock_specialty_get_all_records.return_value = [self.specialty]
+    @patch("specialties.models.SpecialtyModel.get_page")
+    def test_get_specialties(self, mock_specialty_get_page):
+        mock_specialty_get_page.return_value = [self.specialty], None
         response = self.client.get("/specialties")
         response_data = json.loads(response.data.decode("utf-8"))["data"]
         self.assertEqual(response.status_code, 200)
@@ -73,29 +77,47 @@ class SpecialtyTestCase(test_utils.BaseTestCase):
             NOT_FOUND_BY_ID.format(SPECIALTY, wrong_specialty_id),
         )
 
-    @patch("specialties.models.SpecialtyModel.save_to_db")
+    @patch("specialties.models.SpecialtyModel.update_returning")
     @patch("users.models.TeacherModel.get_by_id")
-    @patch("specialties.models.SpecialtyModel.get_by_id")
     def test_update_specialty_success(
-        self,
-        mock_specialty_get_by_id,
-        mock_teacher_get_by_id,
-        mock_specialty_save_to_db,
+        self, mock_teacher_get_by_id, mock_specialty_update_returning
     ):
-        mock_specialty_get_by_id.return_value = self.specialty
         mock_teacher_get_by_id.return_value = self.teacher
-        mock_specialty_save_to_db.return_value = None
+        mock_specialty_update_returning.return_value = self.specialty
         data = {"name": "IKTA"}
         response = self.client.put(
             f"/specialties/{self.specialty_id}", json=data
         )
-        response_data = json.loads(response.data.decode("utf-8"))["data"]
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response_data["name"], data["name"])
+        mock_specialty_update_returning.assert_called_once_with(
+            self.specialty_id, data
+        )
 
+    @patch("specialties.models.SpecialtyModel.update_returning")
     @patch("specialties.models.SpecialtyModel.get_by_id")
-    def test_update_specialty_fail(self, mock_specialty_get_by_id):
+    def test_update_specialty_taken_name(
+        self, mock_specialty_get_by_id, mock_specialty_update_returning
+    ):
+        mock_specialty_get_by_id.return_value = self.specialty
+        mock_specialty_update_returning.return_value = None
+        data = {"name": "IKTA"}
+        with self.assertRaises(SearchException) as context:
+            self.client.put(f"/specialties/{self.specialty_id}", json=data)
+        self.assertEqual(context.exception.status_code, 400)
+        self.assertEqual(
+            str(context.exception),
+            ALREADY_EXISTS_WITH_YEAR.format(
+                SPECIALTY, data["name"], self.specialty.year
+            ),
+        )
+
+    @patch("specialties.models.SpecialtyModel.update_returning")
+    @patch("specialties.models.SpecialtyModel.get_by_id")
+    def test_update_specialty_fail(
+        self, mock_specialty_get_by_id, mock_specialty_update_returning
+    ):
         mock_specialty_get_by_id.return_value = None
+        mock_specialty_update_returning.return_value = None
         data = {"name": "IKTA"}
         wrong_specialty_id = uuid.uuid4()
         with self.assertRaises(SearchException) as context:
@@ -17,20 +17,24 @@ from utils.custom_decorators import (
 )
 from utils.custom_exceptions import SearchException
 from utils.utils import (
+    insert_with_name_and_year,
     is_active_user,
     update_obj_with_name_and_year,
 )
+from utils.conditional import get_headers, get_validators, is_modified
+from utils.schemas.pagination import PageSchema
+from utils.schemas.projection import get_projection
+from utils.streaming import stream_records
 
 
 specialty_schema = specialty_schemas.SpecialtySchema()
+page_schema = PageSchema()
 
 
-@create_obj_with_name_and_year(
-    specialty_models.SpecialtyModel, SPECIALTY, specialty_schema, request
-)
+@create_obj_with_name_and_year(specialty_schema, request)
 def create_specialty(specialty, specialty_json):
     is_active_user(specialty_json, TEACHER)
-    specialty.save_to_db()
+    insert_with_name_and_year(specialty, SPECIALTY)
     specialty_json = specialty_schema.dump(specialty)
     return {
         "message": CREATED_SUCCESSFULLY.format(SPECIALTY, specialty.id),
@@ -39,18 +43,51 @@ def create_specialty(specialty, specialty_json):
 
 
 def get_specialties():
-    specialties = [
-        specialty_schema.dump(specialty)
-        for specialty in specialty_models.SpecialtyModel.get_all_records()
-    ]
-    return {"data": {"specialties": specialties}}, 200
+    schema, options = get_projection(
+        specialty_schemas.SpecialtySchema, request.args
+    )
+    page = page_schema.load(request.args)
+    if page.pop("stream"):
+        return stream_records(
+            specialty_models.SpecialtyModel,
+            "specialties",
+            schema,
+            options,
+            page,
+        )
+    specialties, next_cursor = specialty_models.SpecialtyModel.get_page(
+        **page, options=options
+    )
+    validators = get_validators(
+        schema, specialties, next_cursor, last_modified=False
+    )
+    if not is_modified(validators):
+        return "", 304, get_headers(validators)
+    return (
+        {
+            "data": {
+                "specialties": schema.dump(specialties, many=True),
+                "next_cursor": next_cursor,
+            }
+        },
+        200,
+        get_headers(validators),
+    )
 
 
 def get_specialty(specialty_id):
-    specialty = specialty_models.SpecialtyModel.get_by_id(specialty_id)
+    schema, options = get_projection(
+        specialty_schemas.SpecialtySchema, request.args
+    )
+    specialty = specialty_models.SpecialtyModel.get_by_id(
+        specialty_id, options=options
+    )
     if not specialty:
         raise SearchException(NOT_FOUND_BY_ID.format(SPECIALTY, specialty_id))
-    return {"data": specialty_schema.dump(specialty)}, 200
+    validators = get_validators(schema, [specialty])
+    if not is_modified(validators):
+        return "", 304, get_headers(validators)
+    return {"data": schema.dump(specialty)}, 200, get_headers(validators)
 
 
 def update_specialty(specialty_id):
@@ -3,6 +3,8 @@ from sqlalchemy.dialects.postgresql import UUID
 from application.db import db
 from utils.constants import MAX_NAME_LENGTH
 from utils.base_model import BaseModel
+from utils.filters import AssociationFilter, ColumnFilter, RANGE_OPERATORS
+from utils.loading_profiles import SELECTIN
 
 
 subject_specialty = db.Table(
@@ -18,6 +20,7 @@ subject_specialty = db.Table(
         UUID(as_uuid=True),
         db.ForeignKey("specialty.id"),
         primary_key=True,
+        index=True,
     ),
 )
 
@@ -34,6 +37,7 @@ subject_teacher = db.Table(
         UUID(as_uuid=True),
         db.ForeignKey("teacher.id"),
         primary_key=True,
+        index=True,
     ),
 )
 
@@ -50,6 +54,7 @@ subject_group = db.Table(
         UUID(as_uuid=True),
         db.ForeignKey("group.id"),
         primary_key=True,
+        index=True,
     ),
 )
 
@@ -63,25 +68,45 @@ class SubjectModel(BaseModel):
     specialties = db.relationship(
         "SpecialtyModel",
         secondary=subject_specialty,
-        lazy="subquery",
+        lazy=True,
         backref=db.backref("subjects", lazy=True),
     )
     teachers = db.relationship(
         "TeacherModel",
         secondary=subject_teacher,
-        lazy="subquery",
+        lazy=True,
         backref=db.backref("subjects", lazy=True),
     )
     groups = db.relationship(
         "GroupModel",
         secondary=subject_group,
-        lazy="subquery",
+        lazy=True,
         backref=db.backref("subjects", lazy=True),
     )
     assignments = db.relationship(
         "AssignmentModel", uselist=True, back_populates="subject"
     )
 
+    filter_fields = {
+        "year": ColumnFilter("year", RANGE_OPERATORS),
+        "specialty_id": AssociationFilter(
+            "subject_specialty", "subject_id", "specialty_id"
+        ),
+        "teacher_id": AssociationFilter(
+            "subject_teacher", "subject_id", "teacher_id"
+        ),
+        "group_id": AssociationFilter(
+            "subject_group", "subject_id", "group_id"
+        ),
+    }
+    sort_fields = ("name", "year")
+    natural_key = ("name", "year")
+    loading_profiles = {
+        "assignments": {"assignments": SELECTIN},
+        # ownership check of the teacher managing the assignments
+        "owned_assignments": {"teachers": SELECTIN, "assignments": SELECTIN},
+    }
+
     @classmethod
     def get_by_name_and_year(cls, name, year):
         return cls.query.filter_by(name=name, year=year).first()
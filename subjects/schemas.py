@@ -1,9 +1,9 @@
 from marshmallow import EXCLUDE, validates, ValidationError
-from application.ma import ma
+from application.ma import AutoSchema, ma
 from subjects import models as subject_models
 
 
-class SubjectSchema(ma.SQLAlchemyAutoSchema):
+class SubjectSchema(AutoSchema):
     teachers = ma.Nested("TeacherSchema", many=True, exclude=("subjects",))
     specialties = ma.Nested("SpecialtySchema", many=True)
     groups = ma.Nested("GroupSchema", many=True)
@@ -17,6 +17,8 @@ class SubjectSchema(ma.SQLAlchemyAutoSchema):
         unknown = EXCLUDE
         dump_only = ("id", "created_on", "updated_on")
         include_fk = True
+        # see utils.schemas.compiler
+        compiled = True
 
     @validates("name")
     def validate_name(self, value):
@@ -2,7 +2,9 @@ import json
 import uuid
 
 import unittest
-from unittest.mock import patch
+from unittest.mock import ANY, patch
+
+from marshmallow import ValidationError
 
 from utils import test_utils
 from users import models as user_models
@@ -13,8 +15,10 @@ from utils.constants import (
     SUBJECT,
     ITEM_NOT_FOUND_IN_ARRAY,
     TEACHER,
+    INVALID_CURSOR,
 )
 from utils.custom_exceptions import SearchException
+from utils.schemas.pagination import encode_cursor
 
 
 class SubjectTestCase(test_utils.BaseTestCase):
@@ -38,20 +42,17 @@ class SubjectTestCase(test_utils.BaseTestCase):
     )
 
     @patch("users.models.TeacherModel.save_to_db")
-    @patch("subjects.models.SubjectModel.save_to_db")
-    @patch("subjects.models.SubjectModel.get_by_name_and_year")
+    @patch("subjects.models.SubjectModel.insert_unique")
     @patch("users.models.UserModel.get_by_id")
     def test_create_subject(
         self,
         mock_teacher_get_by_id,
-        mock_subject_get_by_name_and_year,
-        mock_subject_save_to_db,
+        mock_subject_insert_unique,
         mock_teacher_save_to_db,
     ):
 
         mock_teacher_get_by_id.return_value = self.teacher
-        mock_subject_get_by_name_and_year.return_value = None
-        mock_subject_save_to_db.return_value = None
+        mock_subject_insert_unique.return_value = True
         mock_teacher_save_to_db.return_value = None
         headers = test_utils.get_headers(self.teacher_id)
         response = self.client.post(
@@ -61,15 +62,47 @@ class SubjectTestCase(test_utils.BaseTestCase):
         )
         self.assertEqual(response.status_code, 201)
 
-    @patch("subjects.models.SubjectModel.get_all_records")
-    def test_get_subjects(self, mock_subject_get_all_records):
-        mock_subject_get_all_records.return_value = [self.subject1]
+    @patch("subjects.models.SubjectModel.get_page")
+    def test_get_subjects(self, mock_subject_get_page):
+        mock_subject_get_page.return_value = [self.subject1], None
         response = self.client.get("/subjects")
         response_data = json.loads(response.data.decode("utf-8"))["data"]
         self.assertEqual(response.status_code, 200)
         self.assertEqual(
             response_data["subjects"][0]["id"], str(self.subject1_id)
         )
+        self.assertIsNone(response_data["next_cursor"])
+        mock_subject_get_page.assert_called_once_with(
+            cursor=None, limit=50, options=ANY, sort=(), filters={}
+        )
+
+    @patch("subjects.models.SubjectModel.get_page")
+    def test_get_subjects_page(self, mock_subject_get_page):
+        mock_subject_get_page.return_value = [self.subject1], "next"
+        cursor = encode_cursor(["-year", 2021, str(self.subject1_id)])
+        response = self.client.get(
+            f"/subjects?cursor={cursor}&limit=1000&sort=-year"
+            f"&filter[year][gte]=2020&filter[teacher_id]={self.teacher_id}"
+        )
+        response_data = json.loads(response.data.decode("utf-8"))["data"]
+        self.assertEqual(response_data["next_cursor"], "next")
+        mock_subject_get_page.assert_called_once_with(
+            cursor=["-year", 2021, str(self.subject1_id)],
+            limit=200,
+            options=ANY,
+            sort=("-year",),
+            filters={
+                ("year", "gte"): "2020",
+                ("teacher_id", "eq"): str(self.teacher_id),
+            },
+        )
+
+    def test_get_subjects_invalid_cursor(self):
+        with self.assertRaises(ValidationError) as context:
+            self.client.get("/subjects?cursor=invalid")
+        self.assertDictEqual(
+            context.exception.messages, {"cursor": [INVALID_CURSOR]}
+        )
 
     @patch("subjects.models.SubjectModel.get_by_id")
     def test_get_subject_success(self, mock_subject_get_by_id):
@@ -79,6 +112,17 @@ class SubjectTestCase(test_utils.BaseTestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response_data["id"], str(self.subject1_id))
 
+    @patch("subjects.models.SubjectModel.get_by_id")
+    def test_get_subject_not_modified(self, mock_subject_get_by_id):
+        mock_subject_get_by_id.return_value = self.subject1
+        etag = self.client.get(f"/subjects/{self.subject1_id}").headers["ETag"]
+        response = self.client.get(
+            f"/subjects/{self.subject1_id}", headers={"If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b"")
+        self.assertEqual(response.headers["ETag"], etag)
+
     @patch("subjects.models.SubjectModel.get_by_id")
     def test_get_subject_fail(self, mock_subject_get_by_id):
         mock_subject_get_by_id.return_value = None
@@ -19,18 +19,22 @@ from utils.custom_exceptions import SearchException
 from utils.utils import (
     get_item_from_entity,
     check_accessibility_for_name_and_year,
+    insert_with_name_and_year,
 )
+from utils.conditional import get_headers, get_validators, is_modified
+from utils.schemas.pagination import PageSchema
+from utils.schemas.projection import get_projection
+from utils.streaming import stream_records
 
 subject_schema = subject_schemas.SubjectSchema()
+page_schema = PageSchema()
 
 
 @jwt_required(fresh=True)
-@find_active_user(TEACHER, check_jwt=True)
-@create_obj_with_name_and_year(
-    subject_models.SubjectModel, SUBJECT, subject_schema, request
-)
+@find_active_user(TEACHER, check_jwt=True, profile="subjects")
+@create_obj_with_name_and_year(subject_schema, request)
 def create_subject(subject, subject_json, teacher):
-    subject.save_to_db()
+    insert_with_name_and_year(subject, SUBJECT)
     teacher.subjects.append(subject)
     teacher.save_to_db()
     return {
@@ -40,16 +44,38 @@ def create_subject(subject, subject_json, teacher):
 
 
 def get_subjects():
-    subjects = [
-        subject_schema.dump(subject)
-        for subject in subject_models.SubjectModel.get_all_records()
-    ]
-    return {"data": {"subjects": subjects}}, 200
+    schema, options = get_projection(
+        subject_schemas.SubjectSchema, request.args
+    )
+    page = page_schema.load(request.args)
+    if page.pop("stream"):
+        return stream_records(
+            subject_models.SubjectModel, "subjects", schema, options, page
+        )
+    subjects, next_cursor = subject_models.SubjectModel.get_page(
+        **page, options=options
+    )
+    validators = get_validators(
+        schema, subjects, next_cursor, last_modified=False
+    )
+    if not is_modified(validators):
+        return "", 304, get_headers(validators)
+    return (
+        {
+            "data": {
+                "subjects": schema.dump(subjects, many=True),
+                "next_cursor": next_cursor,
+            }
+        },
+        200,
+        get_headers(validators),
+    )
 
 
-@find_active_user(TEACHER)
+@find_active_user(TEACHER, profile="subjects")
 def get_teacher_subjects(teacher):
-    subjects = [subject_schema.dump(subject) for subject in teacher.subjects]
+    schema, _ = get_projection(subject_schemas.SubjectSchema, request.args)
+    subjects = schema.dump(teacher.subjects, many=True)
     return {
         "message": "{} for {} <id={}>".format("Subjects", TEACHER, teacher.id),
         "data": {"subjects": subjects},
@@ -57,25 +83,34 @@ def get_teacher_subjects(teacher):
 
 
 def get_subject(subject_id):
-    subject = subject_models.SubjectModel.get_by_id(subject_id)
+    schema, options = get_projection(
+        subject_schemas.SubjectSchema, request.args
+    )
+    subject = subject_models.SubjectModel.get_by_id(
+        subject_id, options=options
+    )
     if not subject:
         raise SearchException(NOT_FOUND_BY_ID.format(SUBJECT, subject_id))
-    return {"data": subject_schema.dump(subject)}, 200
+    validators = get_validators(schema, [subject])
+    if not is_modified(validators):
+        return "", 304, get_headers(validators)
+    return {"data": schema.dump(subject)}, 200, get_headers(validators)
 
 
-@find_active_user(TEACHER)
+@find_active_user(TEACHER, profile="subjects")
 def get_teacher_subject(teacher, subject_id):
+    schema, _ = get_projection(subject_schemas.SubjectSchema, request.args)
     subject = get_item_from_entity(
         teacher.id, teacher.subjects, subject_id, TEACHER, SUBJECT
     )
     return {
         "message": "{} for {} <id={}>".format(SUBJECT, TEACHER, teacher.id),
-        "data": subject_schema.dump(subject),
+        "data": schema.dump(subject),
     }, 200
 
 
 @jwt_required(fresh=True)
-@find_active_user(TEACHER)
+@find_active_user(TEACHER, profile="subjects")
 def update_subject(teacher, subject_id):
     subject_json = request.get_json()
     subject = get_item_from_entity(
@@ -94,7 +129,7 @@ def update_subject(teacher, subject_id):
 
 
 @jwt_required(fresh=True)
-@find_active_user(TEACHER)
+@find_active_user(TEACHER, profile="subjects")
 def delete_subject(teacher, subject_id):
     subject = get_item_from_entity(
         teacher.id, teacher.subjects, subject_id, TEACHER, SUBJECT
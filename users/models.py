@@ -1,37 +1,155 @@
+from functools import partial
+
+from sqlalchemy import exc
 from sqlalchemy.dialects.postgresql import UUID, VARCHAR
+from sqlalchemy.ext.declarative import declared_attr, has_inherited_table
+from sqlalchemy.orm import with_polymorphic
+from sqlalchemy.orm.attributes import set_committed_value
+
 from application.db import db
-from utils.base_model import BaseModel
+from auth.utils.revocation_cache import epoch_cache
+from utils.base_model import BaseModel, keyset_indexes
 from utils.constants import (
     MAX_EMAIL_LENGTH,
     MAX_FIRST_NAME_LENGTH,
     MAX_LAST_NAME_LENGTH,
+    SOMETHING_WENT_WRONG,
 )
+from utils import unit_of_work
+from utils.filters import AssociationFilter, ColumnFilter, RANGE_OPERATORS
+from utils.loading_profiles import SELECTIN
 
 
 class UserModel(BaseModel):
     __tablename__ = "user"
 
-    email = db.Column(db.String(MAX_EMAIL_LENGTH), nullable=False, unique=True)
+    email = db.Column(db.String(MAX_EMAIL_LENGTH), nullable=False)
     first_name = db.Column(db.String(MAX_FIRST_NAME_LENGTH), nullable=False)
     last_name = db.Column(db.String(MAX_LAST_NAME_LENGTH), nullable=False)
     password = db.Column(VARCHAR(), nullable=False)
     age = db.Column(db.SmallInteger)
     is_active = db.Column(db.Boolean, default=True)
     type = db.Column(db.String(MAX_FIRST_NAME_LENGTH))
+    token_epoch = db.Column(
+        db.Integer, nullable=False, default=0, server_default="0"
+    )
+
+    filter_fields = {"is_active": ColumnFilter("is_active", default=True)}
+    sort_fields = ("last_name",)
+    # unique case-insensitively, see get_conflict_target
+    natural_key = ("email",)
+
+    @declared_attr
+    def __table_args__(cls):
+        if has_inherited_table(cls):
+            return tuple(keyset_indexes(cls))
+        return (
+            db.Index(
+                "ix_user_email_lower", db.func.lower(cls.email), unique=True
+            ),
+            *keyset_indexes(cls),
+        )
 
     __mapper_args__ = {
         "polymorphic_on": type,
         "polymorphic_identity": "user",
-        "with_polymorphic": "*",
     }
 
     @classmethod
-    def get_all_records(cls):
-        return cls.query.filter_by(is_active=True)
+    def get_conflict_target(cls):
+        # the expression of ix_user_email_lower
+        return [db.func.lower(UserModel.__table__.c.email)]
 
     @classmethod
-    def get_by_email(cls, email):
-        return cls.query.filter_by(email=email).first()
+    def get_polymorphic_query(cls):
+        """Query that outer-joins the tables of every subtype
+
+        Users load just the "user" row (or a subtype with its own table)
+        by default; callers that need the columns of an unknown subtype
+        up front opt in with this query.
+        """
+        return db.session.query(with_polymorphic(cls, "*"))
+
+    @classmethod
+    def get_by_email(cls, email, polymorphic=False):
+        query = cls.get_polymorphic_query() if polymorphic else cls.query
+        return query.filter(db.func.lower(cls.email) == email.lower()).first()
+
+    @classmethod
+    def get_credentials_by_email(cls, email):
+        """Gets just what login needs, without joining the subtype tables
+
+        :param email: email of the user (case-insensitive)
+        :type email: str
+        :return: row with id, password, is_active and type or None
+        """
+        table = UserModel.__table__
+        statement = db.select(
+            table.c.id, table.c.password, table.c.is_active, table.c.type
+        ).where(db.func.lower(table.c.email) == email.lower())
+        return db.session.execute(statement).first()
+
+    @classmethod
+    def update_password_hash(cls, user_id, password_hash):
+        table = UserModel.__table__
+        statement = (
+            table.update()
+            .where(table.c.id == user_id)
+            .values(password=password_hash)
+        )
+        try:
+            db.session.execute(statement)
+        except exc.SQLAlchemyError as err:
+            db.session.rollback()
+            raise exc.SQLAlchemyError(SOMETHING_WENT_WRONG.format(str(err)))
+        unit_of_work.save_changes()
+
+    @classmethod
+    def get_token_epoch(cls, user_id):
+        return (
+            db.session.query(UserModel.token_epoch)
+            .filter(UserModel.id == user_id)
+            .scalar()
+        )
+
+    @classmethod
+    def revoke_tokens_by_id(cls, user_id, **values):
+        """Revokes every token of the user with a single UPDATE
+
+        The token epoch is cached once the UPDATE is committed.
+
+        :param user_id: id of the user
+        :param values: other "user" columns to set in the same UPDATE
+        :return: new token epoch or None if the user does not exist
+        """
+        table = UserModel.__table__
+        statement = (
+            table.update()
+            .where(table.c.id == user_id)
+            .values(token_epoch=table.c.token_epoch + 1, **values)
+            .returning(table.c.token_epoch)
+        )
+        try:
+            epoch = db.session.execute(statement).scalar()
+        except exc.SQLAlchemyError as err:
+            db.session.rollback()
+            raise exc.SQLAlchemyError(SOMETHING_WENT_WRONG.format(str(err)))
+        unit_of_work.save_changes()
+        # the cache must not revoke tokens the database still accepts
+        unit_of_work.after_commit(
+            partial(epoch_cache.set, str(user_id), epoch)
+        )
+        return epoch
+
+    def revoke_tokens(self, **values):
+        epoch = self.revoke_tokens_by_id(self.id, **values)
+        for key, value in dict(values, token_epoch=epoch).items():
+            set_committed_value(self, key, value)
+        return epoch
+
+    def deactivate(self):
+        """Soft-deletes the user and revokes all of its tokens"""
+        return self.revoke_tokens(is_active=False)
 
 
 class StudentModel(UserModel):
@@ -45,6 +163,15 @@ class StudentModel(UserModel):
     year_of_study = db.Column(db.SmallInteger, nullable=False)
     __mapper_args__ = {"polymorphic_identity": "student"}
 
+    filter_fields = {
+        **UserModel.filter_fields,
+        "year_of_study": ColumnFilter("year_of_study", RANGE_OPERATORS),
+        "group_id": AssociationFilter(
+            "group_student", "student_id", "group_id"
+        ),
+    }
+    sort_fields = (*UserModel.sort_fields, "year_of_study")
+
 
 class TeacherModel(UserModel):
     __tablename__ = "teacher"
@@ -56,6 +183,7 @@ class TeacherModel(UserModel):
         UUID(as_uuid=True),
         db.ForeignKey("position.id", ondelete="SET NULL"),
         nullable=False,
+        index=True,
     )
     position = db.relationship(
         "PositionModel", uselist=False, back_populates="teachers"
@@ -72,3 +200,12 @@ class TeacherModel(UserModel):
         backref="teacher",
     )
     __mapper_args__ = {"polymorphic_identity": "teacher"}
+
+    filter_fields = {
+        **UserModel.filter_fields,
+        "position_id": ColumnFilter("position_id"),
+        "subject_id": AssociationFilter(
+            "subject_teacher", "teacher_id", "subject_id"
+        ),
+    }
+    loading_profiles = {"subjects": {"subjects": SELECTIN}}
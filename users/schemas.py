@@ -1,5 +1,5 @@
 from marshmallow import EXCLUDE, validates, ValidationError
-from application.ma import ma
+from application.ma import AutoSchema, ma
 from users import models as user_models
 from utils.constants import (
     HAS_UPPERCASE_LETTERS,
@@ -53,16 +53,17 @@ class UserValidation:
             raise ValidationError("Too Big Number Provided For Age")
 
 
-class UserSchema(ma.SQLAlchemyAutoSchema, UserValidation):
+class UserSchema(AutoSchema, UserValidation):
     class Meta:
         model = user_models.UserModel
         load_instance = True
         unknown = EXCLUDE
         load_only = ("password",)
+        exclude = ("token_epoch",)
         dump_only = ("id", "created_on", "updated_on")
 
 
-class StudentSchema(ma.SQLAlchemyAutoSchema, UserValidation):
+class StudentSchema(AutoSchema, UserValidation):
     groups = ma.Nested("GroupSchema", many=True)
 
     class Meta:
@@ -71,7 +72,10 @@ class StudentSchema(ma.SQLAlchemyAutoSchema, UserValidation):
         unknown = EXCLUDE
         include_fk = True
         load_only = ("password",)
+        exclude = ("token_epoch",)
         dump_only = ("id", "is_active", "created_on", "updated_on")
+        # see utils.schemas.compiler
+        compiled = True
 
     @validates("year_of_study")
     def validate_year_of_study(self, value):
@@ -79,7 +83,7 @@ class StudentSchema(ma.SQLAlchemyAutoSchema, UserValidation):
             raise ValidationError("Year of Study should be between 1 and 8")
 
 
-class TeacherSchema(ma.SQLAlchemyAutoSchema, UserValidation):
+class TeacherSchema(AutoSchema, UserValidation):
     position = ma.Nested("PositionSchema", many=False, exclude=("teachers",))
     specialty = ma.Nested(
         "SpecialtySchema", many=False, exclude=("teacher", "teacher_id")
@@ -93,4 +97,6 @@ class TeacherSchema(ma.SQLAlchemyAutoSchema, UserValidation):
         unknown = EXCLUDE
         include_fk = True
         load_only = ("password",)
+        exclude = ("token_epoch",)
         dump_only = ("id", "is_active", "created_on", "updated_on")
+        compiled = True
@@ -0,0 +1,23 @@
+import unittest
+
+from users import models as user_models
+from utils.test_utils import BaseTestCase
+
+
+class PolymorphicLoadingTestCase(BaseTestCase):
+    def test_subtype_tables_are_not_joined_by_default(self):
+        query = str(user_models.UserModel.query)
+        self.assertNotIn("student", query)
+        self.assertNotIn("teacher", query)
+        query = str(user_models.StudentModel.query)
+        self.assertIn('FROM "user" JOIN student', query)
+        self.assertNotIn("teacher", query)
+
+    def test_polymorphic_query(self):
+        query = str(user_models.UserModel.get_polymorphic_query())
+        self.assertIn("LEFT OUTER JOIN student", query)
+        self.assertIn("LEFT OUTER JOIN teacher", query)
+
+
+if __name__ == "__main__":
+    unittest.main()
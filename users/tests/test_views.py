@@ -22,6 +22,7 @@ from utils.constants import (
     SUCCESSFULLY_DELETED,
     TEACHER,
     SUBJECT,
+    ITEM_NOT_FOUND_IN_ARRAY,
 )
 from utils.custom_exceptions import (
     CreateException,
@@ -42,12 +43,10 @@ class StudentTestCase(BaseTestCase):
     student_id, student = create_obj(data, user_models.StudentModel)
     student.is_active = True
 
-    @patch("users.models.StudentModel.save_to_db")
-    @patch("users.models.UserModel.get_by_email")
-    def test_create_student_success(self, mock_get_by_email, mock_save_to_db):
+    @patch("users.models.StudentModel.insert_unique")
+    def test_create_student_success(self, mock_insert_unique):
         self.data["password1"] = "Awnafjfawga12@"
-        mock_get_by_email.return_value = []
-        mock_save_to_db.return_value = self.student
+        mock_insert_unique.return_value = True
         response = self.client.post("/users/students/create", json=self.data)
         data = json.loads(response.data.decode("utf-8"))["data"]
         self.assertEqual(response.status_code, 201)
@@ -59,19 +58,19 @@ class StudentTestCase(BaseTestCase):
         self.assertEqual(data["type"], "student")
         self.assertEqual(data["year_of_study"], self.data["year_of_study"])
 
-    @patch("users.models.UserModel.get_by_email")
-    def test_create_student_fail_user_already_exists(self, mock_get_by_email):
-        mock_get_by_email.return_value = self.student
+    @patch("users.models.StudentModel.insert_unique")
+    def test_create_student_fail_user_already_exists(self, mock_insert_unique):
+        mock_insert_unique.return_value = False
+        data = deepcopy(self.data)
+        data["password1"] = data["password"]
         with self.assertRaises(CreateException) as context:
-            self.client.post("/users/students/create", json=self.data)
+            self.client.post("/users/students/create", json=data)
         self.assertEqual(
             str(context.exception),
             ALREADY_EXISTS.format(STUDENT, self.student.email),
         )
 
-    @patch("users.models.UserModel.get_by_email")
-    def test_create_student_fail_user_wrong_password(self, mock_get_by_email):
-        mock_get_by_email.return_value = None
+    def test_create_student_fail_user_wrong_password(self):
         data = deepcopy(self.data)
         with self.assertRaises(CreateException) as context:
             self.client.post("/users/students/create", json=data)
@@ -133,23 +132,68 @@ class StudentTestCase(BaseTestCase):
             NOT_ACTIVE_USER.format(STUDENT, self.student_id),
         )
 
-    @patch("users.models.StudentModel.save_to_db")
+    @patch("users.models.StudentModel.update_returning")
     @patch("users.models.UserModel.get_by_id")
     def test_update_student_success(
-        self, mock_student_get_by_id, mock_student_save_to_db
+        self, mock_student_get_by_id, mock_student_update_returning
     ):
         headers = get_headers(self.student.id)
         mock_student_get_by_id.return_value = self.student
-        mock_student_save_to_db.return_value = None
+        mock_student_update_returning.return_value = self.student
         data = {"year_of_study": 1}
         response = self.client.put(
             f"users/students/{self.student_id}",
             headers=headers,
             json=data,
         )
-        response_data = json.loads(response.data.decode("utf-8"))["data"]
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response_data["year_of_study"], data["year_of_study"])
+        mock_student_update_returning.assert_called_once_with(
+            self.student_id, data
+        )
+
+    @patch("users.models.StudentModel.update_returning")
+    @patch("users.models.UserModel.get_by_id")
+    def test_update_student_fail_taken_email(
+        self, mock_student_get_by_id, mock_student_update_returning
+    ):
+        headers = get_headers(self.student.id)
+        mock_student_get_by_id.return_value = self.student
+        mock_student_update_returning.return_value = None
+        data = {"email": "taken@gmail.com"}
+        with self.assertRaises(CreateException) as context:
+            self.client.put(
+                f"users/students/{self.student_id}",
+                headers=headers,
+                json=data,
+            )
+        self.assertEqual(
+            str(context.exception),
+            ALREADY_EXISTS.format(STUDENT, data["email"]),
+        )
+
+    @patch("users.models.StudentModel.update_returning")
+    @patch("users.models.UserModel.get_by_id")
+    def test_update_student_fail_deleted_meanwhile(
+        self, mock_student_get_by_id, mock_student_update_returning
+    ):
+        headers = get_headers(self.student.id)
+        mock_student_get_by_id.side_effect = [self.student, None]
+        mock_student_update_returning.return_value = None
+        for data in ({"year_of_study": 1}, {"email": "new@gmail.com"}):
+            with self.assertRaises(SearchException) as context:
+                self.client.put(
+                    f"users/students/{self.student_id}",
+                    headers=headers,
+                    json=data,
+                )
+            self.assertEqual(
+                str(context.exception),
+                NOT_FOUND_BY_ID.format(STUDENT, self.student_id),
+            )
+            mock_student_get_by_id.side_effect = [self.student, None]
+        mock_student_get_by_id.assert_called_with(
+            self.student_id, refresh=True
+        )
 
     @patch("users.models.UserModel.get_by_id")
     def test_update_student_fail_wrong_student_id(
@@ -284,13 +328,13 @@ class StudentTestCase(BaseTestCase):
         )
         self.student.id = self.student_id
 
-    @patch("users.models.StudentModel.save_to_db")
+    @patch("users.models.StudentModel.deactivate")
     @patch("users.models.UserModel.get_by_id")
     def test_soft_delete_student_success(
-        self, mock_student_get_by_id, mock_student_save_to_db
+        self, mock_student_get_by_id, mock_student_deactivate
     ):
         mock_student_get_by_id.return_value = self.student
-        mock_student_save_to_db.return_value = None
+        mock_student_deactivate.return_value = 1
         headers = get_headers(self.student.id)
         response = self.client.delete(
             f"users/students/{self.student.id}", headers=headers
@@ -372,19 +416,14 @@ class TeacherTestCase(BaseTestCase):
     position.id = position_id
     position.position_name = "Professor"
 
-    @patch("users.models.TeacherModel.save_to_db")
+    @patch("users.models.TeacherModel.insert_unique")
     @patch("positions.models.PositionModel.get_by_id")
-    @patch("users.models.UserModel.get_by_email")
     def test_create_teacher_success(
-        self,
-        mock_get_user_by_email,
-        mock_get_position_by_id,
-        mock_teacher_save_to_db,
+        self, mock_get_position_by_id, mock_teacher_insert_unique
     ):
         self.data["password1"] = "Awnafjfawga12@"
-        mock_get_user_by_email.return_value = None
         mock_get_position_by_id.return_value = self.position
-        mock_teacher_save_to_db.return_value = None
+        mock_teacher_insert_unique.return_value = True
         response = self.client.post("/users/teachers/create", json=self.data)
         data = json.loads(response.data.decode("utf-8"))["data"]
         self.assertEqual(response.status_code, 201)
@@ -396,19 +435,23 @@ class TeacherTestCase(BaseTestCase):
         self.assertEqual(data["type"], "teacher")
         self.assertEqual(data["position_id"], str(self.data["position_id"]))
 
-    @patch("users.models.UserModel.get_by_email")
-    def test_create_teacher_fail_user_already_exists(self, mock_get_by_email):
-        mock_get_by_email.return_value = self.teacher
+    @patch("users.models.TeacherModel.insert_unique")
+    @patch("positions.models.PositionModel.get_by_id")
+    def test_create_teacher_fail_user_already_exists(
+        self, mock_get_position_by_id, mock_teacher_insert_unique
+    ):
+        mock_get_position_by_id.return_value = self.position
+        mock_teacher_insert_unique.return_value = False
+        data = deepcopy(self.data)
+        data["password1"] = data["password"]
         with self.assertRaises(CreateException) as context:
-            self.client.post("/users/teachers/create", json=self.data)
+            self.client.post("/users/teachers/create", json=data)
         self.assertEqual(
             str(context.exception),
             ALREADY_EXISTS.format(TEACHER, self.teacher.email),
         )
 
-    @patch("users.models.UserModel.get_by_email")
-    def test_create_teacher_fail_user_wrong_password(self, mock_get_by_email):
-        mock_get_by_email.return_value = None
+    def test_create_teacher_fail_user_wrong_password(self):
         data = deepcopy(self.data)
         with self.assertRaises(CreateException) as context:
             self.client.post("/users/teachers/create", json=data)
@@ -429,15 +472,13 @@ class TeacherTestCase(BaseTestCase):
         self.assertEqual(str(context.exception), exception_message)
 
     @patch("positions.models.PositionModel.get_by_id")
-    @patch("users.models.UserModel.get_by_email")
     def test_create_teacher_fail_wrong_position_id(
-        self, mock_get_user_by_email, mock_get_position_by_id
+        self, mock_get_position_by_id
     ):
         wrong_position_id = uuid.uuid4()
         data = deepcopy(self.data)
         data["password1"] = "Awnafjfawga12@"
         data["position_id"] = wrong_position_id
-        mock_get_user_by_email.return_value = None
         mock_get_position_by_id.return_value = None
         with self.assertRaises(SearchException) as context:
             self.client.post("/users/teachers/create", json=data)
@@ -489,13 +530,13 @@ class TeacherTestCase(BaseTestCase):
         )
         self.teacher.is_active = True
 
-    @patch("users.models.TeacherModel.save_to_db")
+    @patch("users.models.TeacherModel.update_returning")
     @patch("users.models.UserModel.get_by_id")
     def test_update_teacher_success(
-        self, mock_teacher_get_by_id, mock_teacher_save_to_db
+        self, mock_teacher_get_by_id, mock_teacher_update_returning
     ):
         mock_teacher_get_by_id.return_value = self.teacher
-        mock_teacher_save_to_db.return_value = None
+        mock_teacher_update_returning.return_value = self.teacher
         headers = get_headers(self.teacher.id)
         data = {"first_name": "teacher2"}
         response = self.client.put(
@@ -503,22 +544,23 @@ class TeacherTestCase(BaseTestCase):
             headers=headers,
             json=data,
         )
-        response_data = json.loads(response.data.decode("utf-8"))["data"]
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response_data["first_name"], data["first_name"])
+        mock_teacher_update_returning.assert_called_once_with(
+            self.teacher_id, data
+        )
 
-    @patch("users.models.TeacherModel.save_to_db")
+    @patch("users.models.TeacherModel.update_returning")
     @patch("positions.models.PositionModel.get_by_id")
     @patch("users.models.UserModel.get_by_id")
     def test_update_teacher_success_update_position_id(
         self,
         mock_teacher_get_by_id,
         mock_position_get_by_id,
-        mock_teacher_save_to_db,
+        mock_teacher_update_returning,
     ):
         mock_teacher_get_by_id.return_value = self.teacher
         mock_position_get_by_id.return_value = self.position
-        mock_teacher_save_to_db.return_value = None
+        mock_teacher_update_returning.return_value = self.teacher
         headers = get_headers(self.teacher.id)
         data = {"position_id": uuid.uuid4()}
         response = self.client.put(
@@ -526,10 +568,9 @@ class TeacherTestCase(BaseTestCase):
             headers=headers,
             json=data,
         )
-        response_data = json.loads(response.data.decode("utf-8"))["data"]
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(
-            response_data["position_id"], str(data["position_id"])
+        mock_teacher_update_returning.assert_called_once_with(
+            self.teacher_id, data
         )
 
     @patch("positions.models.PositionModel.get_by_id")
@@ -686,13 +727,13 @@ class TeacherTestCase(BaseTestCase):
         )
         self.teacher.id = self.teacher_id
 
-    @patch("users.models.TeacherModel.save_to_db")
+    @patch("users.models.TeacherModel.deactivate")
     @patch("users.models.UserModel.get_by_id")
     def test_soft_delete_teacher_success(
-        self, mock_teacher_get_by_id, mock_teacher_save_to_db
+        self, mock_teacher_get_by_id, mock_teacher_deactivate
     ):
         mock_teacher_get_by_id.return_value = self.teacher
-        mock_teacher_save_to_db.return_value = None
+        mock_teacher_deactivate.return_value = 1
         headers = get_headers(self.teacher.id)
         response = self.client.delete(
             f"users/teachers/{self.teacher.id}/", headers=headers
@@ -799,18 +840,19 @@ class AppointItemsTestCase(BaseTestCase):
     group_id, group = create_obj(data_group, group_models.GroupModel)
     teacher.is_active = True
 
-    @patch("users.models.TeacherModel.save_to_db")
+    @patch("users.models.TeacherModel.appoint_items")
     @patch("subjects.models.SubjectModel.get_by_id")
     @patch("users.models.UserModel.get_by_id")
     def test_appoint_subject_to_teacher_success(
         self,
         mock_teacher_get_by_id,
         mock_subject_get_by_id,
-        mock_teacher_save_to_db,
+        mock_teacher_appoint_items,
     ):
         mock_teacher_get_by_id.return_value = self.teacher
+        self.teacher.subjects = [self.subject1]
         mock_subject_get_by_id.return_value = self.subject1
-        mock_teacher_save_to_db.return_value = None
+        mock_teacher_appoint_items.return_value = []
         headers = get_headers(self.teacher.id)
         response = self.client.post(
             f"users/teachers/{self.teacher_id}/appoint-subjects/{self.subject1_id}",
@@ -821,6 +863,9 @@ class AppointItemsTestCase(BaseTestCase):
         self.assertEqual(data["subjects"][0]["id"], str(self.subject1_id))
         self.assertEqual(data["subjects"][0]["name"], self.subject1.name)
         self.assertEqual(data["id"], str(self.teacher.id))
+        mock_teacher_appoint_items.assert_called_once_with(
+            "subjects", [self.subject1_id], replace=False
+        )
 
     @patch("users.models.TeacherModel.get_by_id")
     def test_test_appoint_subject_to_teacher_fail_teacher_not_found(
@@ -876,20 +921,17 @@ class AppointItemsTestCase(BaseTestCase):
             NOT_FOUND_BY_ID.format(SUBJECT, wrong_subject_id),
         )
 
-    @patch("users.models.TeacherModel.save_to_db")
-    @patch("subjects.models.SubjectModel.get_by_ids")
+    @patch("users.models.TeacherModel.appoint_items")
     @patch("users.models.UserModel.get_by_id")
     def test_appoint_subjects_to_teacher_success(
         self,
         mock_teacher_get_by_id,
-        mock_subject_get_by_ids,
-        mock_teacher_save_to_db,
+        mock_teacher_appoint_items,
     ):
         mock_teacher_get_by_id.return_value = self.teacher
-        mock_subject_get_by_ids.return_value = [self.subject1, self.subject2]
-        initial_subjects_len = len(self.teacher.subjects)
+        self.teacher.subjects = [self.subject1, self.subject2]
         data = {"subject_ids": [self.subject1_id, self.subject2_id]}
-        mock_teacher_save_to_db.return_value = None
+        mock_teacher_appoint_items.return_value = []
         headers = get_headers(self.teacher_id)
         response = self.client.post(
             f"users/teachers/{self.teacher_id}/appoint-subjects-to-teacher",
@@ -899,26 +941,46 @@ class AppointItemsTestCase(BaseTestCase):
         response_data = json.loads(response.data.decode("utf-8"))["data"]
         self.assertEqual(response.status_code, 200)
         self.assertEqual(
-            len(response_data["subjects"]) - initial_subjects_len,
-            len(data["subject_ids"]),
+            len(response_data["subjects"]), len(data["subject_ids"])
+        )
+        mock_teacher_appoint_items.assert_called_once_with(
+            "subjects", data["subject_ids"], replace=False
         )
 
-    @patch("groups.models.GroupModel.save_to_db")
-    @patch("users.models.StudentModel.get_by_ids")
+    @patch("users.models.TeacherModel.appoint_items")
+    @patch("users.models.UserModel.get_by_id")
+    def test_appoint_subjects_to_teacher_fail_subject_not_found(
+        self, mock_teacher_get_by_id, mock_teacher_appoint_items
+    ):
+        wrong_subject_id = uuid.uuid4()
+        mock_teacher_get_by_id.return_value = self.teacher
+        mock_teacher_appoint_items.return_value = [wrong_subject_id]
+        data = {"subject_ids": [self.subject1_id, wrong_subject_id]}
+        headers = get_headers(self.teacher_id)
+        with self.assertRaises(SearchException) as context:
+            self.client.post(
+                f"users/teachers/{self.teacher_id}/appoint-subjects-to-teacher",
+                json=data,
+                headers=headers,
+            )
+        self.assertEqual(
+            str(context.exception),
+            NOT_FOUND_BY_ID.format(SUBJECT, [wrong_subject_id]),
+        )
+
+    @patch("groups.models.GroupModel.appoint_items")
     @patch("groups.models.GroupModel.get_by_id")
     @patch("users.models.UserModel.get_by_id")
     def test_appoint_student_to_group(
         self,
         mock_teacher_get_by_id,
         mock_group_get_by_id,
-        mock_student_get_by_ids,
-        mock_group_save_to_db,
+        mock_group_appoint_items,
     ):
         data = {"student_ids": [self.student_id]}
         mock_teacher_get_by_id.return_value = self.teacher
         mock_group_get_by_id.return_value = self.group
-        mock_student_get_by_ids.return_value = [self.student]
-        mock_group_save_to_db.return_value = None
+        mock_group_appoint_items.return_value = []
         headers = get_headers(self.teacher_id)
         response = self.client.post(
             f"users/teachers/{self.teacher_id}/appoint-student-to-group/groups/{self.group_id}",
@@ -929,23 +991,23 @@ class AppointItemsTestCase(BaseTestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response_data["id"], str(self.group_id))
         self.assertEqual(response_data["curator_id"], str(self.teacher_id))
+        mock_group_appoint_items.assert_called_once_with(
+            "students", [self.student_id], replace=False
+        )
 
-    @patch("specialties.models.SpecialtyModel.save_to_db")
-    @patch("subjects.models.SubjectModel.get_by_ids")
+    @patch("specialties.models.SpecialtyModel.appoint_items")
     @patch("specialties.models.SpecialtyModel.get_by_id")
     @patch("users.models.UserModel.get_by_id")
     def test_appoint_subject_to_specialty(
         self,
         mock_teacher_get_by_id,
         mock_specialty_get_by_id,
-        mock_subject_get_by_ids,
-        mock_specialty_save_to_db,
+        mock_specialty_appoint_items,
     ):
         data = {"subject_ids": [self.subject1_id, self.subject2_id]}
         mock_teacher_get_by_id.return_value = self.teacher
         mock_specialty_get_by_id.return_value = self.specialty
-        mock_subject_get_by_ids.return_value = [self.subject1, self.subject2]
-        mock_specialty_save_to_db.return_value = None
+        mock_specialty_appoint_items.return_value = []
         headers = get_headers(self.teacher_id)
         response = self.client.post(
             f"users/teachers/{self.teacher_id}/appoint-subjects-to-specialty/specialties/{self.specialty_id}",
@@ -955,23 +1017,23 @@ class AppointItemsTestCase(BaseTestCase):
         response_data = json.loads(response.data.decode("utf-8"))["data"]
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response_data["id"], str(self.specialty_id))
+        mock_specialty_appoint_items.assert_called_once_with(
+            "subjects", data["subject_ids"], replace=False
+        )
 
-    @patch("groups.models.GroupModel.save_to_db")
-    @patch("subjects.models.SubjectModel.get_by_ids")
+    @patch("groups.models.GroupModel.appoint_items")
     @patch("groups.models.GroupModel.get_by_id")
     @patch("users.models.UserModel.get_by_id")
     def test_appoint_subject_to_group(
         self,
         mock_teacher_get_by_id,
         mock_group_get_by_id,
-        mock_subject_get_by_ids,
-        mock_group_save_to_db,
+        mock_group_appoint_items,
     ):
         data = {"subject_ids": [self.subject1_id, self.subject2_id]}
         mock_teacher_get_by_id.return_value = self.teacher
         mock_group_get_by_id.return_value = self.group
-        mock_subject_get_by_ids.return_value = [self.subject1, self.subject2]
-        mock_group_save_to_db.return_value = None
+        mock_group_appoint_items.return_value = []
         headers = get_headers(self.teacher_id)
         response = self.client.post(
             f"users/teachers/{self.teacher_id}/appoint-subject-to-group/groups/{self.group_id}",
@@ -981,20 +1043,73 @@ class AppointItemsTestCase(BaseTestCase):
         response_data = json.loads(response.data.decode("utf-8"))["data"]
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response_data["id"], str(self.group_id))
+        mock_group_appoint_items.assert_called_once_with(
+            "subjects", data["subject_ids"], replace=False
+        )
+
+    @patch("groups.models.GroupModel.appoint_items")
+    @patch("groups.models.GroupModel.get_by_id")
+    @patch("users.models.UserModel.get_by_id")
+    def test_replace_students_of_group(
+        self,
+        mock_teacher_get_by_id,
+        mock_group_get_by_id,
+        mock_group_appoint_items,
+    ):
+        data = {"student_ids": [self.student_id]}
+        mock_teacher_get_by_id.return_value = self.teacher
+        mock_group_get_by_id.return_value = self.group
+        self.group.students = [self.student]
+        mock_group_appoint_items.return_value = []
+        headers = get_headers(self.teacher_id)
+        response = self.client.put(
+            f"users/teachers/{self.teacher_id}/appoint-student-to-group/groups/{self.group_id}",
+            json=data,
+            headers=headers,
+        )
+        response_data = json.loads(response.data.decode("utf-8"))["data"]
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response_data["students"][0]["id"], str(self.student_id)
+        )
+        mock_group_appoint_items.assert_called_once_with(
+            "students", data["student_ids"], replace=True
+        )
 
-    @patch("users.models.TeacherModel.save_to_db")
+    @patch("users.models.TeacherModel.appoint_items")
+    @patch("users.models.UserModel.get_by_id")
+    def test_replace_subjects_of_teacher_with_none(
+        self, mock_teacher_get_by_id, mock_teacher_appoint_items
+    ):
+        mock_teacher_get_by_id.return_value = self.teacher
+        self.teacher.subjects = []
+        mock_teacher_appoint_items.return_value = []
+        headers = get_headers(self.teacher_id)
+        response = self.client.put(
+            f"users/teachers/{self.teacher_id}/appoint-subjects-to-teacher",
+            json={"subject_ids": []},
+            headers=headers,
+        )
+        response_data = json.loads(response.data.decode("utf-8"))["data"]
+        self.assertEqual(response.status_code, 200)
+        self.assertListEqual(response_data["subjects"], [])
+        mock_teacher_appoint_items.assert_called_once_with(
+            "subjects", [], replace=True
+        )
+
+    @patch("users.models.TeacherModel.disappoint_items")
     @patch("subjects.models.SubjectModel.get_by_id")
     @patch("users.models.UserModel.get_by_id")
     def test_remove_subject_from_teacher_success(
         self,
         mock_teacher_get_by_id,
         mock_subject_get_by_id,
-        mock_teacher_save_to_db,
+        mock_teacher_disappoint_items,
     ):
         mock_teacher_get_by_id.return_value = self.teacher
-        self.teacher.subjects = [self.subject1]
+        self.teacher.subjects = []
         mock_subject_get_by_id.return_value = self.subject1
-        mock_teacher_save_to_db.return_value = None
+        mock_teacher_disappoint_items.return_value = [], []
         headers = get_headers(self.teacher_id)
         response = self.client.delete(
             f"users/teachers/{self.teacher_id}/disappoint-subject/subjects/{self.subject1_id}",
@@ -1025,20 +1140,17 @@ class AppointItemsTestCase(BaseTestCase):
             NOT_FOUND_BY_ID.format(SUBJECT, wrong_subject_id),
         )
 
-    @patch("users.models.TeacherModel.save_to_db")
-    @patch("subjects.models.SubjectModel.get_by_ids")
+    @patch("users.models.TeacherModel.disappoint_items")
     @patch("users.models.UserModel.get_by_id")
     def test_remove_subjects_from_teacher(
         self,
         mock_teacher_get_by_id,
-        mock_subject_get_by_ids,
-        mock_teacher_save_to_db,
+        mock_teacher_disappoint_items,
     ):
         data = {"subject_ids": [self.subject1_id]}
         mock_teacher_get_by_id.return_value = self.teacher
-        self.teacher.subjects = [self.subject1]
-        mock_subject_get_by_ids.return_value = [self.subject1]
-        mock_teacher_save_to_db.return_value = None
+        self.teacher.subjects = []
+        mock_teacher_disappoint_items.return_value = [], []
         headers = get_headers(self.teacher_id)
         response = self.client.delete(
             f"users/teachers/{self.teacher_id}/disappoint-subjects-from-teacher",
@@ -1049,24 +1161,46 @@ class AppointItemsTestCase(BaseTestCase):
         response_data = json.loads(response.data.decode("utf-8"))["data"]
         self.assertEqual(response_data["id"], str(self.teacher_id))
         self.assertListEqual(response_data["subjects"], [])
+        mock_teacher_disappoint_items.assert_called_once_with(
+            "subjects", data["subject_ids"]
+        )
 
-    @patch("groups.models.GroupModel.save_to_db")
-    @patch("users.models.StudentModel.get_by_ids")
+    @patch("users.models.TeacherModel.disappoint_items")
+    @patch("users.models.UserModel.get_by_id")
+    def test_remove_subjects_from_teacher_fail_not_appointed(
+        self, mock_teacher_get_by_id, mock_teacher_disappoint_items
+    ):
+        data = {"subject_ids": [self.subject1_id, self.subject2_id]}
+        mock_teacher_get_by_id.return_value = self.teacher
+        mock_teacher_disappoint_items.return_value = [], [self.subject2_id]
+        headers = get_headers(self.teacher_id)
+        with self.assertRaises(SearchException) as context:
+            self.client.delete(
+                f"users/teachers/{self.teacher_id}/disappoint-subjects-from-teacher",
+                json=data,
+                headers=headers,
+            )
+        self.assertEqual(
+            str(context.exception),
+            ITEM_NOT_FOUND_IN_ARRAY.format(
+                SUBJECT, self.subject2_id, TEACHER, self.teacher_id
+            ),
+        )
+
+    @patch("groups.models.GroupModel.disappoint_items")
     @patch("groups.models.GroupModel.get_by_id")
     @patch("users.models.UserModel.get_by_id")
     def test_remove_student_from_group(
         self,
         mock_teacher_get_by_id,
         mock_group_get_by_id,
-        mock_student_get_by_ids,
-        mock_group_save_to_db,
+        mock_group_disappoint_items,
     ):
         data = {"student_ids": [self.student_id]}
         mock_teacher_get_by_id.return_value = self.teacher
         mock_group_get_by_id.return_value = self.group
-        self.group.students = [self.student]
-        mock_student_get_by_ids.return_value = [self.student]
-        mock_group_save_to_db.return_value = None
+        self.group.students = []
+        mock_group_disappoint_items.return_value = [], []
         headers = get_headers(self.teacher_id)
         response = self.client.delete(
             f"users/teachers/{self.teacher_id}/disappoint-student-from-group/groups/{self.group_id}",
@@ -1077,24 +1211,24 @@ class AppointItemsTestCase(BaseTestCase):
         response_data = json.loads(response.data.decode("utf-8"))["data"]
         self.assertEqual(response_data["id"], str(self.group_id))
         self.assertListEqual(response_data["students"], [])
+        mock_group_disappoint_items.assert_called_once_with(
+            "students", data["student_ids"]
+        )
 
-    @patch("specialties.models.SpecialtyModel.save_to_db")
-    @patch("subjects.models.SubjectModel.get_by_ids")
+    @patch("specialties.models.SpecialtyModel.disappoint_items")
     @patch("specialties.models.SpecialtyModel.get_by_id")
     @patch("users.models.UserModel.get_by_id")
     def test_remove_subject_from_specialty(
         self,
         mock_teacher_get_by_id,
         mock_specialty_get_by_id,
-        mock_subject_get_by_ids,
-        mock_specialty_save_to_db,
+        mock_specialty_disappoint_items,
     ):
         data = {"subject_ids": [self.subject1_id]}
         mock_teacher_get_by_id.return_value = self.teacher
         mock_specialty_get_by_id.return_value = self.specialty
-        self.specialty.subjects = [self.subject1]
-        mock_subject_get_by_ids.return_value = [self.subject1]
-        mock_specialty_save_to_db.return_value = None
+        self.specialty.subjects = []
+        mock_specialty_disappoint_items.return_value = [], []
         headers = get_headers(self.teacher_id)
         response = self.client.delete(
             f"users/teachers/{self.teacher_id}/disappoint-subjects-from-specialty/"
@@ -1106,24 +1240,24 @@ class AppointItemsTestCase(BaseTestCase):
         response_data = json.loads(response.data.decode("utf-8"))["data"]
         self.assertEqual(response_data["id"], str(self.specialty_id))
         self.assertListEqual(response_data["subjects"], [])
+        mock_specialty_disappoint_items.assert_called_once_with(
+            "subjects", data["subject_ids"]
+        )
 
-    @patch("groups.models.GroupModel.save_to_db")
-    @patch("subjects.models.SubjectModel.get_by_ids")
+    @patch("groups.models.GroupModel.disappoint_items")
     @patch("groups.models.GroupModel.get_by_id")
     @patch("users.models.UserModel.get_by_id")
     def test_remove_subject_from_group(
         self,
         mock_teacher_get_by_id,
         mock_group_get_by_id,
-        mock_subject_get_by_ids,
-        mock_group_save_to_db,
+        mock_group_disappoint_items,
     ):
         data = {"subject_ids": [self.subject1_id]}
         mock_teacher_get_by_id.return_value = self.teacher
         mock_group_get_by_id.return_value = self.group
-        self.group.subjects = [self.subject1]
-        mock_subject_get_by_ids.return_value = [self.subject1]
-        mock_group_save_to_db.return_value = None
+        self.group.subjects = []
+        mock_group_disappoint_items.return_value = [], []
         headers = get_headers(self.teacher_id)
         response = self.client.delete(
             f"users/teachers/{self.teacher_id}/disappoint-subjects-from-group/groups/{self.group_id}",
@@ -1134,6 +1268,9 @@ class AppointItemsTestCase(BaseTestCase):
         response_data = json.loads(response.data.decode("utf-8"))["data"]
         self.assertEqual(response_data["id"], str(self.group_id))
         self.assertListEqual(response_data["subjects"], [])
+        mock_group_disappoint_items.assert_called_once_with(
+            "subjects", data["subject_ids"]
+        )
 
 
 if __name__ == "__main__":
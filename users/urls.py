@@ -84,6 +84,11 @@ teacher_mod_with_uuid.add_url_rule(
     view_func=views.appoint_subjects_to_teacher,
     methods=["POST"],
 )
+teacher_mod_with_uuid.add_url_rule(
+    "/appoint-subjects-to-teacher",
+    view_func=views.replace_subjects_of_teacher,
+    methods=["PUT"],
+)
 
 # /users/teachers/<uuid:teacher_id>/appoint-student-to-group/groups/<uuid:group_id>
 teacher_mod_with_uuid.add_url_rule(
@@ -91,6 +96,11 @@ teacher_mod_with_uuid.add_url_rule(
     view_func=views.appoint_student_to_group,
     methods=["POST"],
 )
+teacher_mod_with_uuid.add_url_rule(
+    "/appoint-student-to-group/groups/<uuid:group_id>",
+    view_func=views.replace_students_of_group,
+    methods=["PUT"],
+)
 
 # /users/teachers/<uuid:teacher_id>/appoint-subjects-to-specialty/specialties/<uuid:specialty_id>
 teacher_mod_with_uuid.add_url_rule(
@@ -98,6 +108,11 @@ teacher_mod_with_uuid.add_url_rule(
     view_func=views.appoint_subject_to_specialty,
     methods=["POST"],
 )
+teacher_mod_with_uuid.add_url_rule(
+    "/appoint-subjects-to-specialty/specialties/<uuid:specialty_id>",
+    view_func=views.replace_subjects_of_specialty,
+    methods=["PUT"],
+)
 
 # /users/teachers/<uuid:teacher_id>/appoint-subject-to-group/groups/<uuid:group_id>
 teacher_mod_with_uuid.add_url_rule(
@@ -105,6 +120,11 @@ teacher_mod_with_uuid.add_url_rule(
     view_func=views.appoint_subject_to_group,
     methods=["POST"],
 )
+teacher_mod_with_uuid.add_url_rule(
+    "/appoint-subject-to-group/groups/<uuid:group_id>",
+    view_func=views.replace_subjects_of_group,
+    methods=["PUT"],
+)
 
 # /users/teachers/<uuid:teacher_id>/disappoint-subject/<uuid:subject_id>
 teacher_mod_with_uuid.add_url_rule(
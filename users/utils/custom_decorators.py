@@ -1,7 +1,6 @@
 from functools import wraps
 
 from positions import models as position_models
-from users import models as user_models
 from utils.constants import (
     ALREADY_EXISTS,
     PW_DO_NOT_MATCH,
@@ -18,13 +17,6 @@ def process_user_json(user_schema, user_type, request):
         def wrapper():
             user_json = request.get_json()
             user = user_schema.load(user_json)
-            user_obj = user_models.UserModel.get_by_email(
-                user_json.get("email", None)
-            )
-            if user_obj:
-                raise CreateException(
-                    ALREADY_EXISTS.format(user_type, user_obj.email)
-                )
             if user_json["password"] != user_json.get("password1", None):
                 raise CreateException(PW_DO_NOT_MATCH)
             position_id = request.get_json().get("position_id", None)
@@ -38,7 +30,11 @@ def process_user_json(user_schema, user_type, request):
             user.password = get_hashed_password(
                 user.password.encode("utf8")
             ).decode("utf-8")
-            user.save_to_db()
+            # the unique index of the email rejects a taken one
+            if not user.insert_unique():
+                raise CreateException(
+                    ALREADY_EXISTS.format(user_type, user.email)
+                )
             return func(user)
 
         return wrapper
@@ -1,18 +1,22 @@
-from typing import Union, List, Dict, Type
+from typing import Union, List, Dict
 from uuid import UUID
 from flask.wrappers import Request
 
-from subjects import models as subject_models
+from groups import models as group_models
+from specialties import models as specialty_models
 from users import models as user_models
 from users import schemas as user_schemas
 from utils.constants import (
+    ALREADY_EXISTS,
     NOT_FOUND_BY_ID,
-    ITEM_NOT_PROVIDED,
     STUDENT,
     SUBJECT,
     ITEM_NOT_FOUND_IN_ARRAY,
 )
-from utils.custom_exceptions import SearchException, NotProvided
+from utils.custom_exceptions import (
+    CreateException,
+    SearchException,
+)
 
 
 def update_specific_user(
@@ -30,41 +34,94 @@ def update_specific_user(
     :type specific_schema: Union[StudentModel, TeacherModel]
     :param request: request from Flask
     :type request: Request
-    :return:
+    :return: json of the updated user
+    :raises:
+        SearchException: if the user does not exist anymore
+        CreateException: if the new email is already taken
     """
-    specific_user_json = request.get_json()
-    specific_user = specific_schema.load(
-        specific_user_json, instance=specific_user, partial=True
-    )
-    specific_user.save_to_db()
-    return specific_schema.dump(specific_user)
+    user_model, user_type = type(specific_user), specific_user.type.title()
+    changes = specific_schema.load_changes(request.get_json())
+    updated_user = user_model.update_returning(specific_user.id, changes)
+    if not updated_user:
+        if "email" not in changes or not user_model.get_by_id(
+            specific_user.id, refresh=True
+        ):
+            raise SearchException(
+                NOT_FOUND_BY_ID.format(user_type, specific_user.id)
+            )
+        # the row was kept because the email is taken
+        raise CreateException(
+            ALREADY_EXISTS.format(user_type, changes["email"])
+        )
+    return specific_schema.dump(updated_user)
 
 
-def get_items(
+def appoint_items(
+    entity: Union[
+        user_models.TeacherModel,
+        group_models.GroupModel,
+        specialty_models.SpecialtyModel,
+    ],
+    key: str,
     item_type: Union[STUDENT, SUBJECT],
     item_ids: List[UUID],
-    item_model: Union[
-        Type[user_models.StudentModel], Type[subject_models.SubjectModel]
-    ],
-) -> List[Union[user_models.StudentModel, subject_models.SubjectModel]]:
-    items = item_model.get_by_ids(item_ids)
-    if not items:
-        raise SearchException(NOT_FOUND_BY_ID.format(item_type, item_ids))
-    not_found_ids = [item.id for item in items if item.id not in item_ids]
-    if not_found_ids:
-        raise SearchException(NOT_FOUND_BY_ID.format(item_type, not_found_ids))
-    return items
+    replace: bool = False,
+) -> None:
+    """Adds the items to the many-to-many collection of the entity
 
+    :param entity: the entity with the collection
+    :type entity: Union[TeacherModel, GroupModel, SpecialtyModel]
+    :param key: name of the collection (subjects, students)
+    :type key: str
+    :param item_type: item type (Student, Subject)
+    :type item_type: str
+    :param item_ids: ids of the items
+    :type item_ids: List[UUID]
+    :param replace: whether the collection should become exactly the items
+    :type replace: bool
+    :return: None
+    :raises:
+        SearchException: if some of the items do not exist
+    """
+    missing_ids = entity.appoint_items(key, item_ids, replace=replace)
+    if missing_ids:
+        raise SearchException(NOT_FOUND_BY_ID.format(item_type, missing_ids))
 
-def remove_items_from_entity(
-    entity_items, entity_type, entity_id, items, item_type
-):
-    for item in items:
-        if item in entity_items:
-            entity_items.remove(item)
-        else:
-            raise SearchException(
-                ITEM_NOT_FOUND_IN_ARRAY.format(
-                    item_type, item.id, entity_type, entity_id
-                )
+
+def disappoint_items(
+    entity: Union[
+        user_models.TeacherModel,
+        group_models.GroupModel,
+        specialty_models.SpecialtyModel,
+    ],
+    entity_type: str,
+    key: str,
+    item_type: Union[STUDENT, SUBJECT],
+    item_ids: List[UUID],
+) -> None:
+    """Removes the items from the many-to-many collection of the entity
+
+    :param entity: the entity with the collection
+    :type entity: Union[TeacherModel, GroupModel, SpecialtyModel]
+    :param entity_type: entity type (Teacher, Group, Specialty)
+    :type entity_type: str
+    :param key: name of the collection (subjects, students)
+    :type key: str
+    :param item_type: item type (Student, Subject)
+    :type item_type: str
+    :param item_ids: ids of the items
+    :type item_ids: List[UUID]
+    :return: None
+    :raises:
+        SearchException: if some of the items do not exist or are not
+         in the collection
+    """
+    missing_ids, unlinked_ids = entity.disappoint_items(key, item_ids)
+    if missing_ids:
+        raise SearchException(NOT_FOUND_BY_ID.format(item_type, missing_ids))
+    if unlinked_ids:
+        raise SearchException(
+            ITEM_NOT_FOUND_IN_ARRAY.format(
+                item_type, unlinked_ids[0], entity_type, entity.id
             )
+        )
@@ -29,6 +29,7 @@ from utils.constants import (
     SPECIALTY,
     NOT_FOUND_BY_ID,
     DISAPPOINT_ITEM,
+    REPLACE_ITEMS,
 )
 from utils.schemas import uuid_list_validator
 from utils.utils import (
@@ -37,10 +38,14 @@ from utils.utils import (
 from utils.custom_exceptions import (
     SearchException,
 )
+from utils.conditional import get_headers, get_validators, is_modified
+from utils.schemas.pagination import PageSchema
+from utils.schemas.projection import get_projection, get_schema
+from utils.streaming import stream_records
 from users.utils.utils import (
-    get_items,
+    appoint_items,
     update_specific_user,
-    remove_items_from_entity,
+    disappoint_items,
 )
 from users.utils.custom_decorators import process_user_json
 
@@ -48,10 +53,11 @@ from users.utils.custom_decorators import process_user_json
 user_schema = user_schemas.UserSchema()
 student_schema = user_schemas.StudentSchema()
 teacher_schema = user_schemas.TeacherSchema()
-group_schema = group_schemas.GroupSchema()
-specialty_schema = specialty_schemas.SpecialtySchema()
 student_uuid_list_schema = uuid_list_validator.StudentsUuidListSchema()
 subject_uuid_list_schema = uuid_list_validator.SubjectsUuidListSchemas()
+student_uuid_set_schema = uuid_list_validator.StudentsUuidSetSchema()
+subject_uuid_set_schema = uuid_list_validator.SubjectsUuidSetSchema()
+page_schema = PageSchema()
 
 
 @process_user_json(student_schema, STUDENT, request)
@@ -74,16 +80,35 @@ def create_student(
 
 
 def get_students():
-    """Shows active students and their data
+    """Shows a page of active students and their data
 
-    :return: Tuple with a dictionary that contains "data" of the teachers
-     and status code for the Response
+    :return: Tuple with a dictionary that contains "data" of the students
+     with the "next_cursor" and status code for the Response
     """
-    students = [
-        student_schema.dump(student)
-        for student in user_models.StudentModel.get_all_records()
-    ]
-    return {"data": {"students": students}}, 200
+    schema, options = get_projection(user_schemas.StudentSchema, request.args)
+    page = page_schema.load(request.args)
+    if page.pop("stream"):
+        return stream_records(
+            user_models.StudentModel, "students", schema, options, page
+        )
+    students, next_cursor = user_models.StudentModel.get_page(
+        **page, options=options
+    )
+    validators = get_validators(
+        schema, students, next_cursor, last_modified=False
+    )
+    if not is_modified(validators):
+        return "", 304, get_headers(validators)
+    return (
+        {
+            "data": {
+                "students": schema.dump(students, many=True),
+                "next_cursor": next_cursor,
+            }
+        },
+        200,
+        get_headers(validators),
+    )
 
 
 @find_active_user(STUDENT)
@@ -98,7 +123,8 @@ def get_student(
     :return: Tuple with a dictionary that contains "data" of the teacher
      and status code for the Response
     """
-    return {"data": student_schema.dump(student)}, 200
+    schema, _ = get_projection(user_schemas.StudentSchema, request.args)
+    return {"data": schema.dump(student)}, 200
 
 
 @jwt_required(fresh=True)
@@ -150,8 +176,7 @@ def soft_delete_student(
     :type student: StudentModel
     :return: Tuple with a dictionary that contains "message" and status code
     """
-    student.is_active = False
-    student.save_to_db()
+    student.deactivate()
     return {"message": SUCCESSFULLY_DELETED.format(STUDENT, student.id)}, 200
 
 
@@ -175,16 +200,35 @@ def create_teacher(
 
 
 def get_teachers() -> Tuple[Dict[str, Any], int]:
-    """Shows active teachers and their data
+    """Shows a page of active teachers and their data
 
     :return: Tuple with a dictionary that contains "data" of the teachers
-     and status code for the Response
+     with the "next_cursor" and status code for the Response
     """
-    teachers = [
-        teacher_schema.dump(teacher)
-        for teacher in user_models.TeacherModel.get_all_records()
-    ]
-    return {"data": {"teachers": teachers}}, 200
+    schema, options = get_projection(user_schemas.TeacherSchema, request.args)
+    page = page_schema.load(request.args)
+    if page.pop("stream"):
+        return stream_records(
+            user_models.TeacherModel, "teachers", schema, options, page
+        )
+    teachers, next_cursor = user_models.TeacherModel.get_page(
+        **page, options=options
+    )
+    validators = get_validators(
+        schema, teachers, next_cursor, last_modified=False
+    )
+    if not is_modified(validators):
+        return "", 304, get_headers(validators)
+    return (
+        {
+            "data": {
+                "teachers": schema.dump(teachers, many=True),
+                "next_cursor": next_cursor,
+            }
+        },
+        200,
+        get_headers(validators),
+    )
 
 
 @find_active_user(TEACHER)
@@ -199,7 +243,8 @@ def get_teacher(
     :return: Tuple with a dictionary that contains "data" of the teacher
      and status code for the Response
     """
-    return {"data": teacher_schema.dump(teacher)}, 200
+    schema, _ = get_projection(user_schemas.TeacherSchema, request.args)
+    return {"data": schema.dump(teacher)}, 200
 
 
 @jwt_required(fresh=True)
@@ -255,8 +300,7 @@ def soft_delete_teacher(
     :type teacher: TeacherModel
     :return: Tuple with a dictionary that contains "message" and status code
     """
-    teacher.is_active = False
-    teacher.save_to_db()
+    teacher.deactivate()
     return {"message": SUCCESSFULLY_DELETED.format(TEACHER, teacher.id)}, 200
 
 
@@ -280,9 +324,10 @@ def appoint_subject_to_teacher(
         raise SearchException(
             NOT_FOUND_BY_ID.format(SUBJECT, subject_id), status_code=400
         )
-    teacher.subjects.append(subject)
-    teacher.save_to_db()
-    teacher_json = teacher_schema.dump(teacher)
+    appoint_items(teacher, "subjects", SUBJECT, [subject.id])
+    teacher_json = get_schema(
+        user_schemas.TeacherSchema, expand=("subjects",)
+    ).dump(teacher)
     return {
         "message": APPOINT_ITEM.format(subject.name, teacher.first_name),
         "data": teacher_json,
@@ -304,10 +349,10 @@ def appoint_subjects_to_teacher(
     """
     data = request.get_json()
     subject_ids = subject_uuid_list_schema.load(data)["subject_ids"]
-    subjects = get_items(SUBJECT, subject_ids, subject_models.SubjectModel)
-    teacher.subjects.extend(subjects)
-    teacher.save_to_db()
-    teacher_json = teacher_schema.dump(teacher)
+    appoint_items(teacher, "subjects", SUBJECT, subject_ids)
+    teacher_json = get_schema(
+        user_schemas.TeacherSchema, expand=("subjects",)
+    ).dump(teacher)
     return {
         "message": APPOINT_ITEM.format(subject_ids, teacher.first_name),
         "data": teacher_json,
@@ -334,10 +379,10 @@ def appoint_student_to_group(
     group = get_entity_with_teacher(
         teacher, group_id, group_models.GroupModel, GROUP
     )
-    students = get_items(STUDENT, student_ids, user_models.StudentModel)
-    group.students.extend(students)
-    group.save_to_db()
-    group_json = group_schema.dump(group)
+    appoint_items(group, "students", STUDENT, student_ids)
+    group_json = get_schema(
+        group_schemas.GroupSchema, expand=("students",)
+    ).dump(group)
     return {
         "message": APPOINT_ITEM.format(student_ids, group.name),
         "data": group_json,
@@ -362,12 +407,15 @@ def appoint_subject_to_specialty(
     data = request.get_json()
     subject_ids = subject_uuid_list_schema.load(data)["subject_ids"]
     specialty = get_entity_with_teacher(
-        teacher, specialty_id, specialty_models.SpecialtyModel, SPECIALTY
+        teacher,
+        specialty_id,
+        specialty_models.SpecialtyModel,
+        SPECIALTY,
     )
-    subjects = get_items(SUBJECT, subject_ids, subject_models.SubjectModel)
-    specialty.subjects.extend(subjects)
-    specialty.save_to_db()
-    specialty_json = specialty_schema.dump(specialty)
+    appoint_items(specialty, "subjects", SUBJECT, subject_ids)
+    specialty_json = get_schema(
+        specialty_schemas.SpecialtySchema, expand=("subjects",)
+    ).dump(specialty)
     return {
         "message": APPOINT_ITEM.format(subject_ids, specialty.name),
         "data": specialty_json,
@@ -394,16 +442,134 @@ def appoint_subject_to_group(
     group = get_entity_with_teacher(
         teacher, group_id, group_models.GroupModel, GROUP
     )
-    subjects = get_items(SUBJECT, subject_ids, subject_models.SubjectModel)
-    group.subjects.extend(subjects)
-    group.save_to_db()
-    group_json = group_schema.dump(group)
+    appoint_items(group, "subjects", SUBJECT, subject_ids)
+    group_json = get_schema(
+        group_schemas.GroupSchema, expand=("subjects",)
+    ).dump(group)
     return {
         "message": APPOINT_ITEM.format(subject_ids, group.name),
         "data": group_json,
     }, 200
 
 
+@jwt_required()
+@find_active_user(TEACHER, check_jwt=True)
+def replace_subjects_of_teacher(
+    teacher: user_models.TeacherModel,
+) -> Tuple[Dict[str, Any], int]:
+    """Allow the Teacher to set the exact list of own subjects
+
+    :param teacher: an object of existing teacher,
+     received from @find_active_user by a UUID from url
+    :type teacher: TeacherModel
+    :return: Tuple with a dictionary that contains 'message',
+     "data" of the present state and status code for the Response
+    """
+    data = request.get_json()
+    subject_ids = subject_uuid_set_schema.load(data)["subject_ids"]
+    appoint_items(teacher, "subjects", SUBJECT, subject_ids, replace=True)
+    teacher_json = get_schema(
+        user_schemas.TeacherSchema, expand=("subjects",)
+    ).dump(teacher)
+    return {
+        "message": REPLACE_ITEMS.format(teacher.first_name, subject_ids),
+        "data": teacher_json,
+    }, 200
+
+
+@jwt_required()
+@find_active_user(TEACHER, check_jwt=True)
+def replace_students_of_group(
+    teacher: user_models.TeacherModel, group_id: UUID
+) -> Tuple[Dict[str, Any], int]:
+    """Allow the Curator of group to set the exact list of students
+
+    :param teacher: an object of existing teacher,
+     received from @find_active_user by a UUID from url
+    :type teacher: TeacherModel
+    :param group_id: UUID of Group from url
+    :type group_id: UUID
+    :return: Tuple with a dictionary that contains 'message',
+     "data" of the present state and status code for the Response
+    """
+    data = request.get_json()
+    student_ids = student_uuid_set_schema.load(data)["student_ids"]
+    group = get_entity_with_teacher(
+        teacher, group_id, group_models.GroupModel, GROUP
+    )
+    appoint_items(group, "students", STUDENT, student_ids, replace=True)
+    group_json = get_schema(
+        group_schemas.GroupSchema, expand=("students",)
+    ).dump(group)
+    return {
+        "message": REPLACE_ITEMS.format(group.name, student_ids),
+        "data": group_json,
+    }, 200
+
+
+@jwt_required()
+@find_active_user(TEACHER, check_jwt=True)
+def replace_subjects_of_specialty(
+    teacher: user_models.TeacherModel, specialty_id: UUID
+) -> Tuple[Dict[str, Any], int]:
+    """Allow the Head Teacher of specialty to set the exact list of subjects
+
+    :param teacher: an object of existing teacher,
+     received from @find_active_user by a UUID from url
+    :type teacher: TeacherModel
+    :param specialty_id: UUID of Specialty from url
+    :type specialty_id: UUID
+    :return: Tuple with a dictionary that contains 'message',
+     "data" of the present state and status code for the Response
+    """
+    data = request.get_json()
+    subject_ids = subject_uuid_set_schema.load(data)["subject_ids"]
+    specialty = get_entity_with_teacher(
+        teacher,
+        specialty_id,
+        specialty_models.SpecialtyModel,
+        SPECIALTY,
+    )
+    appoint_items(specialty, "subjects", SUBJECT, subject_ids, replace=True)
+    specialty_json = get_schema(
+        specialty_schemas.SpecialtySchema, expand=("subjects",)
+    ).dump(specialty)
+    return {
+        "message": REPLACE_ITEMS.format(specialty.name, subject_ids),
+        "data": specialty_json,
+    }, 200
+
+
+@jwt_required()
+@find_active_user(TEACHER, check_jwt=True)
+def replace_subjects_of_group(
+    teacher: user_models.TeacherModel, group_id: UUID
+) -> Tuple[Dict[str, Any], int]:
+    """Allow the Curator of group to set the exact list of subjects
+
+    :param teacher: an object of existing teacher,
+     received from @find_active_user by a UUID from url
+    :type teacher: TeacherModel
+    :param group_id: UUID of Group from url
+    :type group_id: UUID
+    :return: Tuple with a dictionary that contains 'message',
+     "data" of the present state and status code for the Response
+    """
+    data = request.get_json()
+    subject_ids = subject_uuid_set_schema.load(data)["subject_ids"]
+    group = get_entity_with_teacher(
+        teacher, group_id, group_models.GroupModel, GROUP
+    )
+    appoint_items(group, "subjects", SUBJECT, subject_ids, replace=True)
+    group_json = get_schema(
+        group_schemas.GroupSchema, expand=("subjects",)
+    ).dump(group)
+    return {
+        "message": REPLACE_ITEMS.format(group.name, subject_ids),
+        "data": group_json,
+    }, 200
+
+
 # TODO: add remove endpoints for the many-to-many
 
 
@@ -427,11 +593,10 @@ def remove_subject_from_teacher(
         raise SearchException(
             NOT_FOUND_BY_ID.format(SUBJECT, subject_id), status_code=400
         )
-    remove_items_from_entity(
-        teacher.subjects, TEACHER, teacher.id, [subject], SUBJECT
-    )
-    teacher.save_to_db()
-    teacher_json = teacher_schema.dump(teacher)
+    disappoint_items(teacher, TEACHER, "subjects", SUBJECT, [subject.id])
+    teacher_json = get_schema(
+        user_schemas.TeacherSchema, expand=("subjects",)
+    ).dump(teacher)
     return {
         "message": DISAPPOINT_ITEM.format(subject.name, teacher.first_name),
         "data": teacher_json,
@@ -453,12 +618,10 @@ def remove_subjects_from_teacher(
     """
     data = request.get_json()
     subject_ids = subject_uuid_list_schema.load(data)["subject_ids"]
-    subjects = get_items(SUBJECT, subject_ids, subject_models.SubjectModel)
-    remove_items_from_entity(
-        teacher.subjects, TEACHER, teacher.id, subjects, SUBJECT
-    )
-    teacher.save_to_db()
-    teacher_json = teacher_schema.dump(teacher)
+    disappoint_items(teacher, TEACHER, "subjects", SUBJECT, subject_ids)
+    teacher_json = get_schema(
+        user_schemas.TeacherSchema, expand=("subjects",)
+    ).dump(teacher)
     return {
         "message": DISAPPOINT_ITEM.format(subject_ids, teacher.first_name),
         "data": teacher_json,
@@ -485,12 +648,10 @@ def remove_student_from_group(
     group = get_entity_with_teacher(
         teacher, group_id, group_models.GroupModel, GROUP
     )
-    students = get_items(STUDENT, student_ids, user_models.StudentModel)
-    remove_items_from_entity(
-        group.students, GROUP, group.id, students, STUDENT
-    )
-    group.save_to_db()
-    group_json = group_schema.dump(group)
+    disappoint_items(group, GROUP, "students", STUDENT, student_ids)
+    group_json = get_schema(
+        group_schemas.GroupSchema, expand=("students",)
+    ).dump(group)
     return {
         "message": DISAPPOINT_ITEM.format(student_ids, group.name),
         "data": group_json,
@@ -515,14 +676,15 @@ def remove_subject_from_specialty(
     data = request.get_json()
     subject_ids = subject_uuid_list_schema.load(data)["subject_ids"]
     specialty = get_entity_with_teacher(
-        teacher, specialty_id, specialty_models.SpecialtyModel, SPECIALTY
-    )
-    subjects = get_items(SUBJECT, subject_ids, subject_models.SubjectModel)
-    remove_items_from_entity(
-        specialty.subjects, SPECIALTY, specialty.id, subjects, SUBJECT
+        teacher,
+        specialty_id,
+        specialty_models.SpecialtyModel,
+        SPECIALTY,
     )
-    specialty.save_to_db()
-    specialty_json = specialty_schema.dump(specialty)
+    disappoint_items(specialty, SPECIALTY, "subjects", SUBJECT, subject_ids)
+    specialty_json = get_schema(
+        specialty_schemas.SpecialtySchema, expand=("subjects",)
+    ).dump(specialty)
     return {
         "message": DISAPPOINT_ITEM.format(subject_ids, specialty.name),
         "data": specialty_json,
@@ -549,12 +711,10 @@ def remove_subject_from_group(
     group = get_entity_with_teacher(
         teacher, group_id, group_models.GroupModel, GROUP
     )
-    subjects = get_items(SUBJECT, subject_ids, subject_models.SubjectModel)
-    remove_items_from_entity(
-        group.subjects, GROUP, group.id, subjects, SUBJECT
-    )
-    group.save_to_db()
-    group_json = group_schema.dump(group)
+    disappoint_items(group, GROUP, "subjects", SUBJECT, subject_ids)
+    group_json = get_schema(
+        group_schemas.GroupSchema, expand=("subjects",)
+    ).dump(group)
     return {
         "message": DISAPPOINT_ITEM.format(subject_ids, group.name),
         "data": group_json,
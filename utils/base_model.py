@@ -1,46 +1,625 @@
 import uuid
 
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy import exc
+from marshmallow import ValidationError
+from sqlalchemy.dialects.postgresql import UUID, insert
+from sqlalchemy import (
+    Column,
+    delete,
+    event,
+    exc,
+    exists,
+    false,
+    inspect,
+    literal,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.ext.declarative import declared_attr, has_inherited_table
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.sql.util import ClauseAdapter
+from sqlalchemy.sql.visitors import replacement_traverse
 
 from application.db import db
-from utils.constants import SOMETHING_WENT_WRONG
+from utils import identity_cache, unit_of_work
+from utils.constants import INVALID_CURSOR, SOMETHING_WENT_WRONG
+from utils.filters import (
+    DEFAULT_SORT,
+    get_cursor_values,
+    get_filter_predicates,
+    get_keyset_predicate,
+    get_order_by,
+    get_sort_keys,
+)
+from utils.schemas.pagination import encode_cursor
+
+
+def as_uuid(value):
+    """Converts an id to UUID, returning None if it is not a valid one"""
+    if isinstance(value, uuid.UUID) or value is None:
+        return value
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return None
+
+
+def keyset_indexes(cls):
+    """Indexes that serve pages ordered by (<sort field>, id)
+
+    A table of joined inheritance gets the indexes of its own sort fields,
+    the base table gets created_at and the rest.
+    """
+    if has_inherited_table(cls):
+        names = [name for name in cls.sort_fields if name in vars(cls)]
+    else:
+        names = [DEFAULT_SORT, *cls.sort_fields]
+    return [
+        db.Index(f"ix_{cls.__tablename__}_{name}_id", name, "id")
+        for name in names
+    ]
+
+
+def unique_constraints(cls):
+    """Unique constraint of the natural key, see ``BaseModel.insert_unique``"""
+    if not cls.natural_key or has_inherited_table(cls):
+        return []
+    name = f"uq_{cls.__tablename__}_{'_'.join(cls.natural_key)}"
+    return [db.UniqueConstraint(*cls.natural_key, name=name)]
+
+
+def update_subtable(statement, base, table, values):
+    """Updates the subtable row of the one the statement updated
+
+    :param statement: UPDATE ... RETURNING of the base table
+    :param base: base table of the joined inheritance
+    :param table: subtable to update
+    :param values: new values of the columns of the subtable
+    :return: the statement returning the columns of both tables, a SELECT
+     if there are no values to update
+    """
+    updated = statement.cte(f"updated_{base.name}")
+    columns = (*updated.c, *(c for c in table.c if c.name != "id"))
+    if not values:
+        return select(*columns).where(table.c.id == updated.c.id)
+    return (
+        update(table)
+        .where(table.c.id == updated.c.id)
+        .values(**values)
+        .returning(*columns)
+    )
+
+
+def get_conflicts(cls, table, new_values):
+    """SELECT of the other rows with the natural key the row would have
+
+    The conflict target is compared as it is, e.g. the lowercased email
+    of users, with the new values in place of the columns they change.
+    """
+    other = table.alias("other")
+
+    def put_new_value(element):
+        if isinstance(element, Column) and element.table is table:
+            if element.name in new_values:
+                return literal(new_values[element.name], element.type)
+        return None
+
+    adapter = ClauseAdapter(other)
+    conditions = []
+    for expression in cls.get_conflict_target():
+        new_expression = replacement_traverse(expression, {}, put_new_value)
+        conditions.append(adapter.traverse(expression) == new_expression)
+    return select(other.c.id).where(other.c.id != table.c.id, *conditions)
+
+
+def get_ids_cte(ids):
+    """CTE of the ids, a VALUES list"""
+    if not ids:
+        # VALUES needs a row
+        return (
+            select(db.cast(None, UUID(as_uuid=True)).label("id"))
+            .where(false())
+            .cte("ids")
+        )
+    rows = values(db.column("id", UUID(as_uuid=True)), name="item_ids").data(
+        [(item_id,) for item_id in ids]
+    )
+    return select(rows.c.id).cte("ids")
+
+
+def add_touch_ctes(statement, entity, relationship, changed):
+    """Adds UPDATEs of updated_at of the entity and of the changed items
+
+    The counterpart of ``touch_changed_collections`` for association rows
+    written with SQL, the entity is touched only if some item changed.
+
+    :param statement: the statement that changes the association rows
+    :param entity: the entity that owns the collection
+    :param relationship: the many-to-many relationship
+    :param changed: SELECT of the ids of the changed items
+    :return: the statement with the UPDATEs as data modifying CTEs
+    """
+    entity_table = inspect(type(entity)).columns["updated_at"].table
+    item_table = relationship.mapper.columns["updated_at"].table
+    for table, predicates, name in (
+        (
+            entity_table,
+            (entity_table.c.id == entity.id, exists(changed)),
+            "touched_entity",
+        ),
+        (item_table, (item_table.c.id.in_(changed),), "touched_items"),
+    ):
+        statement = statement.add_cte(
+            update(table)
+            .where(*predicates)
+            .values(updated_at=db.func.now())
+            .returning(table.c.id)
+            .cte(name)
+        )
+    return statement
 
 
 class BaseModel(db.Model):
     __abstract__ = True
     id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     created_at = db.Column(db.DateTime, server_default=db.func.now())
+    # onupdate puts updated_at into every UPDATE the ORM or Core emits,
+    # server_onupdate would only expect a trigger to set it
     updated_at = db.Column(
         db.DateTime,
         server_default=db.func.now(),
-        server_onupdate=db.func.now(),
+        onupdate=db.func.now(),
     )
 
+    # see utils.filters
+    filter_fields = {}
+    sort_fields = ()
+    # see utils.loading_profiles
+    loading_profiles = {}
+    # columns that identify an entity besides its id, see insert_unique
+    natural_key = ()
+
+    @declared_attr
+    def __table_args__(cls):
+        return (*keyset_indexes(cls), *unique_constraints(cls))
+
+    @classmethod
+    def get_conflict_target(cls):
+        """Columns of the unique constraint or index of the natural key"""
+        return [cls.__table__.c[name] for name in cls.natural_key]
+
+    @classmethod
+    def get_records_query(cls):
+        return cls.query
+
     @classmethod
     def get_all_records(cls):
-        return cls.query.all()
+        return cls.get_records_query().all()
+
+    @classmethod
+    def get_page(
+        cls, cursor=None, limit=50, options=(), sort=(), filters=None
+    ):
+        """Gets a filtered page of the records after the cursor
+
+        Seeks past the cursor instead of using OFFSET, so every page costs
+        the same no matter how deep it is.
+
+        :param cursor: values decoded from the cursor of the previous page
+         or None for the first page
+        :param limit: max number of records on the page
+        :param options: ORM loader options
+        :param sort: fields of ``sort_fields`` to order by, "-" prefixed for
+         descending order; (created_at, id) by default
+        :param filters: raw values by (field, operator) of ``filter_fields``
+        :return: Tuple with the records and the cursor of the next page
+         (None on the last page)
+        :raises:
+            ValidationError: if the sort, the filters or the cursor are
+             invalid
+        """
+        query, keys, signature = cls._get_ordered_query(
+            cursor, options, sort, filters
+        )
+        records = query.limit(limit + 1).all()
+        if len(records) <= limit:
+            return records, None
+        last = records[limit - 1]
+        next_cursor = [signature, *get_cursor_values(keys, last)]
+        return records[:limit], encode_cursor(next_cursor)
+
+    @classmethod
+    def get_stream(
+        cls, cursor=None, options=(), sort=(), filters=None, batch_size=1000
+    ):
+        """Gets all filtered records after the cursor, read in batches
+
+        The query is built (and validated) at once, but runs only when
+        iterated: rows are fetched from a server-side cursor
+        ``batch_size`` at a time, so memory does not grow with the table.
+
+        :param cursor: values decoded from a page cursor or None
+        :param options: ORM loader options, no joined eager loading of
+         collections
+        :param sort: the same as of ``get_page``
+        :param filters: the same as of ``get_page``
+        :param batch_size: number of rows fetched at a time
+        :return: iterable Query of the records
+        :raises:
+            ValidationError: if the sort, the filters or the cursor are
+             invalid
+        """
+        query, _, _ = cls._get_ordered_query(cursor, options, sort, filters)
+        return query.yield_per(batch_size)
 
     @classmethod
-    def get_by_id(cls, searched_id):
-        return cls.query.filter_by(id=searched_id).first()
+    def _get_ordered_query(cls, cursor, options, sort, filters):
+        keys = get_sort_keys(cls, sort)
+        query = cls.get_records_query().options(*options)
+        query = query.filter(*get_filter_predicates(cls, filters or {}))
+        signature = ",".join(sort)
+        if cursor is not None:
+            if not cursor or cursor[0] != signature:
+                raise ValidationError({"cursor": [INVALID_CURSOR]})
+            query = query.filter(get_keyset_predicate(keys, cursor[1:]))
+        return query.order_by(*get_order_by(keys)), keys, signature
+
+    @classmethod
+    def get_by_id(cls, searched_id, options=(), refresh=False):
+        """Gets the entity by id, skipping SQL if the session already has it
+
+        ``refresh=True`` queries the row anyway, to know it still exists.
+        """
+        searched_id = as_uuid(searched_id)
+        if searched_id is None:
+            return None
+        return db.session.get(
+            cls, searched_id, options=options, populate_existing=refresh
+        )
 
     @classmethod
     def get_by_ids(cls, ids):
-        return cls.query.filter(cls.id.in_(ids)).all()
+        """Gets entities by ids, querying only those the session does not have
 
-    def save_to_db(self):
+        :param ids: searched ids
+        :return: found entities in the order of ``ids``, without duplicates
+        """
+        ids = [
+            searched_id
+            for searched_id in dict.fromkeys(map(as_uuid, ids))
+            if searched_id is not None
+        ]
+        found = {}
+        for searched_id in ids:
+            entity = db.session.identity_map.get(
+                identity_key(cls, searched_id)
+            )
+            if isinstance(entity, cls) and entity not in db.session.deleted:
+                found[searched_id] = entity
+        missing_ids = [
+            searched_id for searched_id in ids if searched_id not in found
+        ]
+        if missing_ids:
+            for entity in cls.query.filter(cls.id.in_(missing_ids)):
+                found[entity.id] = entity
+        return [
+            found[searched_id] for searched_id in ids if searched_id in found
+        ]
+
+    def insert_unique(self):
+        """Inserts the entity unless its natural key is already taken
+
+        A single INSERT ... ON CONFLICT DO NOTHING RETURNING per table
+        replaces the SELECT that used to check the key first, which
+        concurrent requests could both pass. The generated values are
+        set on the entity, which becomes persistent.
+
+        :return: False if another entity has the same natural key
+        :raises:
+            SQLAlchemyError: if the entity cannot be inserted
+        """
+        state = inspect(self)
+        if state.pending:
+            db.session.expunge(self)
+        mappers = list(state.mapper.iterate_to_root())[::-1]
+        try:
+            for mapper in mappers:
+                # the natural key is on the base table, inserted first
+                if not self._insert_row(mapper, mapper is mappers[0]):
+                    return False
+        except exc.SQLAlchemyError as err:
+            db.session.rollback()
+            raise exc.SQLAlchemyError(SOMETHING_WENT_WRONG.format(str(err)))
+        make_transient_to_detached(self)
         db.session.add(self)
+        unit_of_work.save_changes()
+        return True
+
+    def _insert_row(self, mapper, on_conflict_do_nothing):
+        """Inserts the row of the entity into the table of the mapper
+
+        :return: False if the row conflicted with another one
+        """
+        state = inspect(self)
+        keys = {
+            column: mapper.get_property_by_column(column).key
+            for column in mapper.local_table.columns
+        }
+        values = {
+            column.name: state.dict[key]
+            for column, key in keys.items()
+            if key in state.dict
+        }
+        statement = insert(mapper.local_table).values(values).returning(*keys)
+        if on_conflict_do_nothing:
+            statement = statement.on_conflict_do_nothing(
+                index_elements=self.get_conflict_target()
+            )
+        row = db.session.execute(statement).first()
+        if row is None:
+            return False
+        for column, key in keys.items():
+            set_committed_value(self, key, row._mapping[column])
+        return True
+
+    @classmethod
+    def update_returning(cls, entity_id, changes, *criteria):
+        """Updates columns of the entity with a single UPDATE ... RETURNING
+
+        Only the given columns and updated_at are written and nothing is
+        loaded before. The base table of a joined inheritance is updated
+        in a CTE. A natural key is changed only if no other entity has
+        the new one. The returned row refreshes the entity in the session.
+
+        :param entity_id: id of the entity
+        :type entity_id: UUID
+        :param changes: new values by attribute name
+        :type changes: Dict[str, Any]
+        :param criteria: other conditions the row has to meet
+        :return: the updated entity, None if no row matched: the entity
+         does not exist, does not meet the criteria or its natural key
+         is taken
+        :raises:
+            SQLAlchemyError: if the row cannot be updated
+        """
+        statement = cls._get_update_statement(entity_id, changes, criteria)
         try:
-            db.session.commit()
+            entity = (
+                db.session.execute(
+                    select(cls)
+                    .from_statement(statement)
+                    .execution_options(populate_existing=True)
+                )
+                .scalars()
+                .first()
+            )
         except exc.SQLAlchemyError as err:
             db.session.rollback()
             raise exc.SQLAlchemyError(SOMETHING_WENT_WRONG.format(str(err)))
+        if entity is not None:
+            unit_of_work.save_changes()
+        return entity
 
-    def remove_from_db(self):
-        db.session.delete(self)
+    @classmethod
+    def _get_update_statement(cls, entity_id, changes, criteria):
+        """Builds the UPDATE ... RETURNING of update_returning
+
+        The UPDATE of the base table is chained to the ones of the
+        subtables in CTEs and the last statement returns all columns.
+        """
+        mapper = inspect(cls)
+        tables = [
+            inherited.local_table for inherited in mapper.iterate_to_root()
+        ]
+        base, *subtables = reversed(tables)
+        values = {table: {} for table in tables}
+        for key, value in changes.items():
+            column = mapper.columns[key]
+            values[column.table][column.name] = value
+        statement = (
+            update(base)
+            .where(
+                base.c.id == entity_id,
+                *criteria,
+                *(
+                    exists(select(table.c.id).where(table.c.id == base.c.id))
+                    for table in subtables
+                ),
+            )
+            .values({**values[base], "updated_at": db.func.now()})
+        )
+        if any(name in values[base] for name in cls.natural_key):
+            statement = statement.where(
+                ~exists(get_conflicts(cls, base, values[base]))
+            )
+        statement = statement.returning(*base.c)
+        for table in subtables:
+            statement = update_subtable(statement, base, table, values[table])
+        return statement
+
+    def appoint_items(self, key, item_ids, replace=False):
+        """Adds the entities with the ids to the many-to-many collection
+
+        A single statement checks that every id exists and, only if all
+        of them do, inserts the association rows ON CONFLICT DO NOTHING
+        and touches updated_at of both sides. The collection is not
+        loaded, it is expired for the response.
+
+        :param key: name of the many-to-many relationship
+        :type key: str
+        :param item_ids: ids of the entities to add
+        :type item_ids: List[UUID]
+        :param replace: whether to also remove the entities that are not
+         in ``item_ids``, so the collection ends up being exactly them
+        :type replace: bool
+        :return: ids that do not exist, nothing is changed if there are any
+        :raises:
+            SQLAlchemyError: if the association rows cannot be written
+        """
+        relationship, owner_column, item_column, target = self._get_secondary(
+            key
+        )
+        ids = get_ids_cte(item_ids)
+        found = select(target).where(target.in_(select(ids.c.id))).cte("found")
+        missing = select(ids.c.id).where(ids.c.id.not_in(select(found.c.id)))
+        inserted = (
+            insert(relationship.secondary)
+            .from_select(
+                [owner_column, item_column],
+                select(literal(self.id, UUID(as_uuid=True)), found.c.id).where(
+                    ~exists(missing)
+                ),
+            )
+            .on_conflict_do_nothing()
+            .returning(item_column)
+            .cte("inserted")
+        )
+        statement = missing.add_cte(inserted)
+        changed = select(inserted.c[item_column.name])
+        if replace:
+            deleted = (
+                delete(relationship.secondary)
+                .where(
+                    owner_column == self.id,
+                    item_column.not_in(select(ids.c.id)),
+                    ~exists(missing),
+                )
+                .returning(item_column)
+                .cte("deleted")
+            )
+            statement = statement.add_cte(deleted)
+            changes = changed.union_all(
+                select(deleted.c[item_column.name])
+            ).subquery()
+            changed = select(changes.c[item_column.name])
+        statement = add_touch_ctes(statement, self, relationship, changed)
+        rows = self._execute_in_collection(key, statement)
+        missing_ids = {item_id for (item_id,) in rows}
+        return [item_id for item_id in item_ids if item_id in missing_ids]
+
+    def disappoint_items(self, key, item_ids):
+        """Removes the entities with the ids from the many-to-many collection
+
+        A single statement checks that every id is in the collection and,
+        only if all of them are, deletes the association rows and touches
+        updated_at of both sides. The collection is not loaded, it is
+        expired for the response.
+
+        :param key: name of the many-to-many relationship
+        :type key: str
+        :param item_ids: ids of the entities to remove
+        :type item_ids: List[UUID]
+        :return: ids that do not exist and ids of the entities that are
+         not in the collection, nothing is removed if there are any
+        :raises:
+            SQLAlchemyError: if the association rows cannot be deleted
+        """
+        relationship, owner_column, item_column, target = self._get_secondary(
+            key
+        )
+        ids = get_ids_cte(item_ids)
+        linked = (
+            select(item_column)
+            .where(owner_column == self.id, item_column.in_(select(ids.c.id)))
+            .cte("linked")
+        )
+        linked_ids = select(linked.c[item_column.name])
+        unlinked = select(ids.c.id).where(ids.c.id.not_in(linked_ids))
+        deleted = (
+            delete(relationship.secondary)
+            .where(
+                owner_column == self.id,
+                item_column.in_(linked_ids),
+                ~exists(unlinked),
+            )
+            .returning(item_column)
+            .cte("deleted")
+        )
+        changed = select(deleted.c[item_column.name])
+        statement = add_touch_ctes(
+            unlinked.add_columns(
+                exists(select(target).where(target == ids.c.id)).label("found")
+            ).add_cte(deleted),
+            self,
+            relationship,
+            changed,
+        )
+        rows = dict(self._execute_in_collection(key, statement))
+        missing_ids, unlinked_ids = [], []
+        for item_id in item_ids:
+            if item_id in rows:
+                (unlinked_ids if rows[item_id] else missing_ids).append(
+                    item_id
+                )
+        return missing_ids, unlinked_ids
+
+    @classmethod
+    def _get_secondary(cls, key):
+        """The many-to-many relationship, its secondary table columns that
+        reference the entity and the item, and the id of the item"""
+        relationship = inspect(cls).relationships[key]
+        ((_, owner_column),) = relationship.synchronize_pairs
+        ((_, item_column),) = relationship.secondary_synchronize_pairs
+        (foreign_key,) = item_column.foreign_keys
+        return relationship, owner_column, item_column, foreign_key.column
+
+    def _execute_in_collection(self, key, statement):
         try:
-            db.session.commit()
+            rows = db.session.execute(statement).all()
         except exc.SQLAlchemyError as err:
             db.session.rollback()
             raise exc.SQLAlchemyError(SOMETHING_WENT_WRONG.format(str(err)))
+        # the rows changed behind the session
+        db.session.expire(self, [key, "updated_at"])
+        item_mapper = inspect(type(self)).relationships[key].mapper
+        for entity in list(db.session.identity_map.values()):
+            if inspect(entity).mapper.isa(item_mapper):
+                db.session.expire(entity)
+        unit_of_work.save_changes()
+        return rows
+
+    def save_to_db(self):
+        """Writes the entity, committed at the end of the request
+
+        See ``utils.unit_of_work``.
+        """
+        db.session.add(self)
+        unit_of_work.save_changes()
+
+    def remove_from_db(self):
+        identity_cache.discard(self.id)
+        db.session.delete(self)
+        unit_of_work.save_changes()
+
+
+def get_changed_members(entity):
+    """The members added to or removed from the many-to-many collections
+
+    :return: the members and the entity itself, nothing if none changed
+    """
+    state = inspect(entity)
+    changed = []
+    for relationship in state.mapper.relationships:
+        if relationship.secondary is not None:
+            history = state.attrs[relationship.key].history
+            # None for a collection that is not loaded
+            changed += [*(history.added or ()), *(history.deleted or ())]
+    return [entity, *changed] if changed else []
+
+
+@event.listens_for(db.session, "before_flush")
+def touch_changed_collections(session, flush_context, instances):
+    """Bumps updated_at of both sides of changed many-to-many collections
+
+    Appointing or removing members only writes association rows, which
+    would leave the Last-Modified of the entities as it was.
+    """
+    touched = set()
+    for entity in session.dirty:
+        if isinstance(entity, BaseModel):
+            touched.update(get_changed_members(entity))
+    for entity in touched:
+        if entity not in session.new and entity not in session.deleted:
+            entity.updated_at = db.func.now()
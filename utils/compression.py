@@ -0,0 +1,88 @@
+"""Content-Encoding of responses
+
+Responses are compressed with gzip or deflate (zlib), whichever the
+client prefers in Accept-Encoding, when:
+
+* their mimetype is one of COMPRESS_MIMETYPES,
+* they have no Content-Encoding yet,
+* they are at least COMPRESS_MIN_SIZE bytes; streamed responses are
+  compressed chunk by chunk whatever their size, which is not known.
+
+The ETag of a compressed response is made weak: the encodings differ
+byte by byte, but If-None-Match compares weakly, so the client still
+gets 304 for the encoding it stored.
+"""
+import zlib
+
+from flask import current_app, request
+from werkzeug.http import quote_etag, unquote_etag
+
+# wbits of zlib.compressobj per content coding, in order of preference
+WBITS = {"gzip": 16 + zlib.MAX_WBITS, "deflate": zlib.MAX_WBITS}
+
+
+def init_app(app) -> None:
+    if app.config["COMPRESS_ENABLED"]:
+        app.after_request(compress_response)
+
+
+def _compress_chunks(chunks, compressor):
+    try:
+        for chunk in chunks:
+            data = compressor.compress(chunk)
+            # sends what the chunk compressed to without waiting for more
+            yield data + compressor.flush(zlib.Z_SYNC_FLUSH)
+        yield compressor.flush()
+    finally:
+        if hasattr(chunks, "close"):
+            chunks.close()
+
+
+def _weaken_etag(response) -> None:
+    etag, weak = unquote_etag(response.headers.get("ETag", None))
+    if etag is not None and not weak:
+        response.headers["ETag"] = quote_etag(etag, weak=True)
+
+
+def _should_compress(response, encoding) -> bool:
+    """Whether the response of an allowed mimetype is to be compressed"""
+    skipped = (
+        encoding is None,
+        "Content-Encoding" in response.headers,
+        response.status_code < 200,
+        response.status_code in (204, 206),
+        response.direct_passthrough,
+    )
+    if any(skipped):
+        return False
+    min_size = current_app.config["COMPRESS_MIN_SIZE"]
+    return response.is_streamed or len(response.get_data()) >= min_size
+
+
+def _compress(response, encoding) -> None:
+    compressor = zlib.compressobj(
+        current_app.config["COMPRESS_LEVEL"], wbits=WBITS[encoding]
+    )
+    if response.is_streamed:
+        response.response = _compress_chunks(response.response, compressor)
+        response.headers.pop("Content-Length", None)
+    else:
+        data = response.get_data()
+        response.set_data(compressor.compress(data) + compressor.flush())
+    response.headers["Content-Encoding"] = encoding
+    _weaken_etag(response)
+
+
+def compress_response(response):
+    encoding = request.accept_encodings.best_match(WBITS)
+    if response.status_code == 304:
+        # the ETag of the stored representation
+        if encoding is not None:
+            _weaken_etag(response)
+        return response
+    if response.mimetype not in current_app.config["COMPRESS_MIMETYPES"]:
+        return response
+    response.vary.add("Accept-Encoding")
+    if _should_compress(response, encoding):
+        _compress(response, encoding)
+    return response
@@ -0,0 +1,109 @@
+"""Conditional GET of read endpoints
+
+A representation changes only if one of the rows it serializes does, so
+its validators are computed from the ids and ``updated_at`` of the loaded
+entity and of every nested row the schema dumps. A client that already
+has the representation gets 304 before anything is serialized::
+
+    validators = get_validators(schema, [subject])
+    if not is_modified(validators):
+        return "", 304, get_headers(validators)
+    return {"data": schema.dump(subject)}, 200, get_headers(validators)
+
+A row deleted from a nested collection leaves no newer ``updated_at``
+behind, so such representations are validated by their ETag only.
+``updated_at`` is stored without time zone and read as UTC.
+"""
+import hashlib
+from collections import namedtuple
+
+from flask import request
+from marshmallow import fields
+from werkzeug.http import http_date, is_resource_modified, quote_etag
+
+Validators = namedtuple("Validators", ("etag", "last_modified"))
+
+
+def _as_rows(field, value):
+    if value is None:
+        return ()
+    return value if field.many else (value,)
+
+
+def _get_related(schema, entity):
+    """Pairs of the nested schema and each row it dumps of the entity"""
+    for name, field in schema.fields.items():
+        if isinstance(field, fields.Nested):
+            value = getattr(entity, field.attribute or name)
+            for row in _as_rows(field, value):
+                yield field.schema, row
+
+
+def _get_rows(schema, entities):
+    """The entities and, depth first, every nested row the schema dumps"""
+    for entity in entities:
+        yield entity
+        for nested, row in _get_related(schema, entity):
+            yield from _get_rows(nested, (row,))
+
+
+def _get_signature(schema):
+    return [
+        (name, _get_signature(field.schema))
+        if isinstance(field, fields.Nested)
+        else name
+        for name, field in schema.fields.items()
+    ]
+
+
+def _dumps_collection(schema):
+    return any(
+        field.many or _dumps_collection(field.schema)
+        for field in schema.fields.values()
+        if isinstance(field, fields.Nested)
+    )
+
+
+def get_validators(schema, entities, *extra, last_modified=True):
+    """Computes the strong ETag and the Last-Modified of a representation
+
+    :param schema: schema instance that dumps the entities
+    :type schema: Schema
+    :param entities: entities of the representation, in dump order
+    :param extra: other values of the representation, e.g. next cursor
+    :param last_modified: False to leave out Last-Modified, which cannot
+     tell that a row left the representation (lists); it is left out of
+     a schema dumping a nested collection as well
+    :type last_modified: bool
+    :return: Validators
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    # the same rows projected to other fields are another representation
+    digest.update(repr(_get_signature(schema)).encode("utf-8"))
+    updated = []
+    for row in _get_rows(schema, entities):
+        digest.update(f"{row.id}:{row.updated_at};".encode("utf-8"))
+        updated.append(row.updated_at)
+    for value in extra:
+        digest.update(f"{value};".encode("utf-8"))
+    if not last_modified or _dumps_collection(schema):
+        return Validators(digest.hexdigest(), None)
+    return Validators(
+        digest.hexdigest(), max(filter(None, updated), default=None)
+    )
+
+
+def is_modified(validators):
+    """Checks If-None-Match and If-Modified-Since of the current request"""
+    return is_resource_modified(
+        request.environ,
+        etag=validators.etag,
+        last_modified=validators.last_modified,
+    )
+
+
+def get_headers(validators):
+    headers = {"ETag": quote_etag(validators.etag)}
+    if validators.last_modified:
+        headers["Last-Modified"] = http_date(validators.last_modified)
+    return headers
@@ -23,6 +23,7 @@ DATA_NOT_PROVIDED = " {} Is Not Provided"
 PERMISSION_DENIED = "Permission Denied <id={}>"
 APPOINT_ITEM = "{} appointed to {}"
 DISAPPOINT_ITEM = "{} disappointed from {}"
+REPLACE_ITEMS = "Items of {} replaced with {}"
 ITEM_NOT_PROVIDED = "{} Field Is Not Provided."
 EMAIL_DOES_NOT_EXISTS = "User <email={}> Does Not Exist."
 EMAIL_NOT_ACTIVE_USER = "User with <email={}> is not Active."
@@ -31,6 +32,14 @@ ASSIGNMENT_NOT_FOUND_IN_SUBJECT = (
     "Assignment <id={}> not found in Subject <id={}>"
 )
 IMPOSSIBLE_TO_UPDATE = "Impossible to update {} field"
+SERVER_IS_BUSY = "Server Is Busy, Try Again Later."
+TOO_MANY_LOGIN_ATTEMPTS = "Too Many Login Attempts, Try Again Later."
+INVALID_CURSOR = "Invalid Cursor."
+FILTER_NOT_ALLOWED = "Filtering By <{}> With <{}> Is Not Allowed."
+SORT_NOT_ALLOWED = "Sorting By <{}> Is Not Allowed."
+UNKNOWN_FIELDS = "Unknown Fields: {}."
+EXPAND_TOO_DEEP = "Relations Can Be Expanded At Most {} Levels Deep."
+NOT_EXPANDED = "Relations Have To Be Expanded To Be Dumped: {}."
 
 STUDENT = "Student"
 TEACHER = "Teacher"
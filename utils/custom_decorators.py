@@ -4,44 +4,32 @@ from functools import wraps
 from flask_jwt_extended import get_jwt_identity
 
 from users import models as user_models
+from utils import identity_cache
+from utils.loading_profiles import get_profile_options
 from utils.constants import (
     NOT_FOUND_BY_ID,
     NOT_ACTIVE_USER,
-    ALREADY_EXISTS_WITH_YEAR,
     STUDENT,
     PERMISSION_DENIED,
 )
-from utils.custom_exceptions import (
-    SearchException,
-    CreateException,
-)
+from utils.custom_exceptions import SearchException
+
 
+def find_active_user(user_type, *, check_jwt=False, profile=None):
+    if user_type == STUDENT:
+        user_model, id_argument = user_models.StudentModel, "student_id"
+    else:
+        user_model, id_argument = user_models.TeacherModel, "teacher_id"
 
-def find_active_user(user_type, *, check_jwt=False):
     def decorator(func):
         @wraps(func)
         def wrapper(**kwargs):
-            if user_type == STUDENT:
-                user_id = kwargs.pop("student_id")
-            else:
-                user_id = kwargs.pop("teacher_id")
-            specific_user = user_models.UserModel.get_by_id(user_id)
-            if not specific_user:
-                raise SearchException(
-                    message=NOT_FOUND_BY_ID.format(user_type, user_id),
-                    status_code=400,
-                )
-            if not specific_user.is_active:
-                raise SearchException(
-                    message=NOT_ACTIVE_USER.format(user_type, user_id),
-                    status_code=403,
-                )
+            user_id = kwargs.pop(id_argument)
+            specific_user = _get_active_user(
+                user_model, user_type, user_id, profile
+            )
             if check_jwt:
-                current_user_id = uuid.UUID(get_jwt_identity())
-                if specific_user.id != current_user_id:
-                    raise PermissionError(
-                        PERMISSION_DENIED.format(str(current_user_id))
-                    )
+                _check_jwt_identity(specific_user)
             return func(specific_user, **kwargs)
 
         return wrapper
@@ -49,21 +37,53 @@ def find_active_user(user_type, *, check_jwt=False):
     return decorator
 
 
-def create_obj_with_name_and_year(model, model_type, schema, request):
+def _get_active_user(user_model, user_type, user_id, profile=None):
+    """Gets the user, loading the relations of the profile
+
+    :raises:
+        SearchException: if the user does not exist or is not active
+    """
+    specific_user = identity_cache.get_by_id(
+        user_model,
+        user_id,
+        options=get_profile_options(user_model, profile),
+    )
+    if not specific_user:
+        raise SearchException(
+            message=NOT_FOUND_BY_ID.format(user_type, user_id),
+            status_code=400,
+        )
+    if not specific_user.is_active:
+        raise SearchException(
+            message=NOT_ACTIVE_USER.format(user_type, user_id),
+            status_code=403,
+        )
+    return specific_user
+
+
+def _check_jwt_identity(specific_user):
+    """Checks that the user is the one the access token was issued to
+
+    :raises:
+        PermissionError: if it is another user
+    """
+    current_user_id = uuid.UUID(get_jwt_identity())
+    if specific_user.id != current_user_id:
+        raise PermissionError(PERMISSION_DENIED.format(str(current_user_id)))
+
+
+def create_obj_with_name_and_year(schema, request):
+    """Loads the entity to create from the request JSON
+
+    The view inserts it with ``insert_with_name_and_year``, which rejects
+    a taken name and year.
+    """
+
     def decorator(func):
         @wraps(func)
         def wrapper(*args):
             requested_json = request.get_json()
             schema_obj = schema.load(requested_json)
-            obj = model.get_by_name_and_year(
-                str(requested_json["name"]), int(requested_json["year"])
-            )
-            if obj:
-                raise CreateException(
-                    ALREADY_EXISTS_WITH_YEAR.format(
-                        model_type, obj.name, obj.year
-                    )
-                )
             return func(schema_obj, requested_json, *args)
 
         return wrapper
@@ -25,3 +25,16 @@ class InvalidCredentials(Exception):
     def __init__(self, message, status_code=400):
         super(InvalidCredentials, self).__init__(message)
         self.status_code = status_code
+
+
+class Overloaded(Exception):
+    def __init__(self, message, status_code=503):
+        super(Overloaded, self).__init__(message)
+        self.status_code = status_code
+
+
+class TooManyRequests(Exception):
+    def __init__(self, message, status_code=429, retry_after=1):
+        super(TooManyRequests, self).__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
@@ -0,0 +1,128 @@
+"""Response envelope of the API
+
+Every JSON response has the shape::
+
+    {"status": {"message": ..., "code": ...}, "data": ..., "errors": [...]}
+
+Views and error handlers return plain dictionaries with "message", "data"
+and "errors" keys; the envelope is serialized once, straight from that
+dictionary, when Flask makes the response. JSON responses that were
+serialized elsewhere (e.g. by extensions) are wrapped after the request.
+"""
+import uuid
+
+from flask import current_app
+
+
+def dumps_envelope(backend, body, status, status_code, sort_keys=True):
+    """Serializes the envelope of a view return value
+
+    Keys of "data" and "errors" are sorted if ``sort_keys``, the envelope
+    keeps the status, data, errors order.
+
+    :param backend: JSON backend, see ``utils.json_backend``
+    :param body: dictionary returned by a view
+    :type body: Dict
+    :param status: status line, e.g. "200 OK", the default message
+    :type status: str
+    :param status_code: status code
+    :type status_code: int
+    :param sort_keys: whether to sort the keys of "data" and "errors"
+    :type sort_keys: bool
+    :return: JSON bytes
+    """
+    message = body.get("message", None) or status
+    status_json = backend.dumps({"message": message, "code": status_code})
+    members = [b'"status"' + backend.key_separator + status_json]
+    data = body.get("data", None)
+    if data:
+        data_json = backend.dumps(data, sort_keys=sort_keys)
+        members.append(b'"data"' + backend.key_separator + data_json)
+    errors = body.get("errors", None)
+    if errors:
+        errors = errors if isinstance(errors, list) else [errors]
+        errors_json = backend.dumps(errors, sort_keys=sort_keys)
+        members.append(b'"errors"' + backend.key_separator + errors_json)
+    return b"{" + backend.item_separator.join(members) + b"}"
+
+
+def iter_list_envelope(
+    backend, name, chunks, status, status_code, sort_keys=True
+):
+    """Serializes the envelope of a whole list chunk by chunk
+
+    Renders the same bytes as ``dumps_envelope`` of
+    ``{"data": {name: [*items], "next_cursor": None}}``, but yields the
+    envelope around the list at once and the items as they come.
+
+    :param backend: JSON backend, see ``utils.json_backend``
+    :param name: key of the list in "data", e.g. "students"
+    :type name: str
+    :param chunks: iterable of lists of dumped items
+    :param status: status line, the message of the envelope
+    :type status: str
+    :param status_code: status code
+    :type status_code: int
+    :param sort_keys: whether to sort the keys of "data" and the items
+    :type sort_keys: bool
+    :return: generator of JSON bytes
+    """
+    placeholder = uuid.uuid4().hex
+    body = {"data": {name: placeholder, "next_cursor": None}}
+    head, tail = dumps_envelope(
+        backend, body, status, status_code, sort_keys
+    ).split(backend.dumps(placeholder))
+    yield head + b"["
+    separator = backend.item_separator
+    first = True
+    for chunk in chunks:
+        if not chunk:
+            continue
+        items = separator.join(
+            backend.dumps(item, sort_keys=sort_keys) for item in chunk
+        )
+        yield items if first else separator + items
+        first = False
+    yield b"]" + tail
+
+
+def init_app(app):
+    make_response = app.make_response
+    backend = app.extensions["json_backend"]
+    sort_keys = app.config["JSON_SORT_KEYS"]
+
+    def make_enveloped_response(rv):
+        body, rest = (rv[0], rv[1:]) if isinstance(rv, tuple) else (rv, ())
+        if not isinstance(body, dict) or not body:
+            return make_response(rv)
+        response = app.response_class(mimetype=app.config["JSONIFY_MIMETYPE"])
+        if rest:
+            response = make_response((response, *rest))
+        response.set_data(
+            dumps_envelope(
+                backend, body, response.status, response.status_code, sort_keys
+            )
+        )
+        response.enveloped = True
+        return response
+
+    app.make_response = make_enveloped_response
+    app.after_request(envelope_json_response)
+
+
+def envelope_json_response(response):
+    if getattr(response, "enveloped", False) or not response.is_json:
+        return response
+    body = response.get_json(silent=True)
+    if not isinstance(body, dict) or not body:
+        return response
+    response.set_data(
+        dumps_envelope(
+            current_app.extensions["json_backend"],
+            body,
+            response.status,
+            response.status_code,
+            current_app.config["JSON_SORT_KEYS"],
+        )
+    )
+    return response
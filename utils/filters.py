@@ -0,0 +1,254 @@
+"""Declarative filtering and sorting of list endpoints
+
+Models whitelist what clients may narrow and order their lists by::
+
+    filter_fields = {
+        "year": ColumnFilter("year", RANGE_OPERATORS),
+        "teacher_id": AssociationFilter(
+            "subject_teacher", "subject_id", "teacher_id"
+        ),
+    }
+    sort_fields = ("name", "year")
+
+``?filter[year][gte]=2020&filter[teacher_id]=<id>&sort=-year,name`` then
+compiles to SQL predicates and an ORDER BY that the indexes of the model
+serve. Every sort field gets a (field, id) index, see ``keyset_indexes``.
+"""
+import operator
+import uuid
+from datetime import datetime
+
+from marshmallow import ValidationError, fields
+from sqlalchemy.dialects.postgresql import UUID
+
+from application.db import db
+from utils.constants import (
+    FILTER_NOT_ALLOWED,
+    INVALID_CURSOR,
+    SORT_NOT_ALLOWED,
+)
+
+OPERATORS = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "lte": operator.le,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "in": lambda column, values: column.in_(values),
+}
+EQUALITY_OPERATORS = ("eq", "in")
+RANGE_OPERATORS = ("eq", "in", "lt", "lte", "gt", "gte")
+
+VALUE_FIELDS = {
+    bool: fields.Boolean(),
+    int: fields.Integer(),
+    str: fields.String(),
+    uuid.UUID: fields.UUID(),
+    datetime: fields.DateTime(),
+}
+
+DEFAULT_SORT = "created_at"
+
+
+def deserialize_value(column, value, operator_name):
+    """Converts a query string value to the python type of the column"""
+    if isinstance(column.type, UUID):
+        field = VALUE_FIELDS[uuid.UUID]
+    else:
+        field = VALUE_FIELDS[column.type.python_type]
+    if operator_name == "in":
+        return [field.deserialize(item) for item in value.split(",")]
+    return field.deserialize(value)
+
+
+class ColumnFilter:
+    """Filters by a column of the model
+
+    :param column_name: name of the column attribute of the model
+    :param operators: names of the allowed operators
+    :param default: value the column is compared to when the client does
+     not filter by it, None to not filter by default
+    """
+
+    def __init__(
+        self, column_name, operators=EQUALITY_OPERATORS, default=None
+    ):
+        self.column_name = column_name
+        self.operators = operators
+        self.default = default
+
+    def get_predicate(self, model, operator_name, value):
+        column = getattr(model, self.column_name)
+        value = deserialize_value(column, value, operator_name)
+        return OPERATORS[operator_name](column, value)
+
+
+class AssociationFilter:
+    """Filters by the ids of related entities of a many-to-many relation
+
+    :param table_name: name of the association table
+    :param parent_column_name: column that references the model
+    :param related_column_name: column that references the related entity,
+     it should be indexed
+    :param operators: names of the allowed operators
+    """
+
+    default = None
+
+    def __init__(
+        self,
+        table_name,
+        parent_column_name,
+        related_column_name,
+        operators=EQUALITY_OPERATORS,
+    ):
+        self.table_name = table_name
+        self.parent_column_name = parent_column_name
+        self.related_column_name = related_column_name
+        self.operators = operators
+
+    @property
+    def related_column(self):
+        table = db.metadata.tables[self.table_name]
+        return table.c[self.related_column_name]
+
+    def get_predicate(self, model, operator_name, value):
+        table = db.metadata.tables[self.table_name]
+        related_column = table.c[self.related_column_name]
+        value = deserialize_value(related_column, value, operator_name)
+        related_ids = db.select(table.c[self.parent_column_name]).where(
+            OPERATORS[operator_name](related_column, value)
+        )
+        return model.id.in_(related_ids)
+
+
+def get_filter_predicates(model, filters):
+    """Compiles query string filters to SQL predicates
+
+    :param model: a specific model
+    :type model: Type[BaseModel]
+    :param filters: dictionary of raw values by (field, operator)
+    :type filters: Dict[Tuple[str, str], str]
+    :return: List of predicates
+    :raises:
+        ValidationError: if a filter is not allowed or its value is invalid
+    """
+    predicates = [
+        _get_filter_predicate(model, name, operator_name, value)
+        for (name, operator_name), value in filters.items()
+    ]
+    return predicates + _get_default_predicates(model, filters)
+
+
+def _get_filter_predicate(model, name, operator_name, value):
+    model_filter = model.filter_fields.get(name, None)
+    if not model_filter or operator_name not in model_filter.operators:
+        raise ValidationError(
+            {"filter": [FILTER_NOT_ALLOWED.format(name, operator_name)]}
+        )
+    try:
+        return model_filter.get_predicate(model, operator_name, value)
+    except ValidationError as err:
+        raise ValidationError({f"filter[{name}]": err.messages})
+
+
+def _get_default_predicates(model, filters):
+    """Predicates of the defaults of the fields the filters leave out"""
+    filtered_names = {name for name, _ in filters}
+    return [
+        getattr(model, model_filter.column_name) == model_filter.default
+        for name, model_filter in model.filter_fields.items()
+        if name not in filtered_names and model_filter.default is not None
+    ]
+
+
+def get_sort_keys(model, sort):
+    """Gets the columns and directions of the ORDER BY
+
+    The id of the table of the last sort column is appended to make the order
+    total; it follows the direction of that column, so a (field, id) index
+    serves the query in either direction.
+
+    :param model: a specific model
+    :type model: Type[BaseModel]
+    :param sort: sort fields, "-" prefixed for descending order
+    :type sort: Tuple[str, ...]
+    :return: List of (column, descending) tuples
+    :raises:
+        ValidationError: if a field is not in ``model.sort_fields``
+    """
+    keys = []
+    for key in sort or (DEFAULT_SORT,):
+        name = key.lstrip("-")
+        if name != DEFAULT_SORT and name not in model.sort_fields:
+            raise ValidationError({"sort": [SORT_NOT_ALLOWED.format(name)]})
+        column = getattr(model, name).property.columns[0]
+        keys.append((column, key.startswith("-")))
+    last_column, descending = keys[-1]
+    keys.append((last_column.table.c.id, descending))
+    return keys
+
+
+def get_order_by(keys):
+    return [
+        column.desc() if descending else column.asc()
+        for column, descending in keys
+    ]
+
+
+def get_cursor_values(keys, record):
+    """Gets the values of the sort keys of the last record of a page"""
+    values = []
+    for column, _ in keys:
+        value = getattr(record, column.key)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif isinstance(value, uuid.UUID):
+            value = str(value)
+        values.append(value)
+    return values
+
+
+def get_keyset_predicate(keys, cursor_values):
+    """Compiles the cursor of the previous page to a seek predicate
+
+    :param keys: result of ``get_sort_keys``
+    :param cursor_values: result of ``get_cursor_values``
+    :return: predicate that selects the records after the cursor
+    :raises:
+        ValidationError: if the cursor does not match the sort keys
+    """
+    if not isinstance(cursor_values, list) or len(cursor_values) != len(keys):
+        raise ValidationError({"cursor": [INVALID_CURSOR]})
+    try:
+        values = [
+            deserialize_value(column, value, "eq")
+            for (column, _), value in zip(keys, cursor_values)
+        ]
+    except ValidationError:
+        raise ValidationError({"cursor": [INVALID_CURSOR]})
+    columns = [column for column, _ in keys]
+    directions = {descending for _, descending in keys}
+    if len(directions) == 1:
+        compare = operator.lt if directions.pop() else operator.gt
+        return compare(db.tuple_(*columns), db.tuple_(*values))
+    return _get_mixed_keyset_predicate(keys, values)
+
+
+def _get_mixed_keyset_predicate(keys, values):
+    """Seek predicate of keys of mixed directions
+
+    (a > x) or (a = x and b < y) or ...
+    """
+    predicates = []
+    for index, (column, descending) in enumerate(keys):
+        compare = operator.lt if descending else operator.gt
+        equal_before = [
+            previous_column == value
+            for (previous_column, _), value in zip(keys[:index], values)
+        ]
+        predicates.append(
+            db.and_(*equal_before, compare(column, values[index]))
+        )
+    return db.or_(*predicates)
@@ -0,0 +1,65 @@
+"""Request-scoped memo of primary key lookups
+
+Views resolve the same rows several times per request (the decorated
+user, the curator of a group, the teacher of a subject...). Lookups made
+through ``get_by_id`` hit the database once per model and id within a
+request, misses included.
+"""
+from typing import Any, Dict, Tuple, Type
+
+from flask import g, has_app_context
+
+_missing = object()
+
+
+def init_app(app) -> None:
+    app.before_request(reset)
+    if app.config.get("IDENTITY_CACHE_STATS_HEADER", False):
+        app.after_request(add_stats_header)
+
+
+def reset() -> None:
+    g.identity_cache = {}
+    g.identity_cache_stats = {"hits": 0, "misses": 0}
+
+
+def get_by_id(
+    model: Type[Any], entity_id: Any, options: Tuple[Any, ...] = ()
+) -> Any:
+    """Gets the entity by id, calling ``model.get_by_id`` once per request
+
+    :param model: a specific model
+    :type model: Type[BaseModel]
+    :param entity_id: id of the entity
+    :param options: ORM loader options of the first lookup
+    :type options: Tuple
+    :return: the entity or None if it does not exist
+    """
+    if not has_app_context() or "identity_cache" not in g:
+        return model.get_by_id(entity_id, options=options)
+    entities = g.identity_cache.setdefault(str(entity_id), {})
+    entity = entities.get(model, _missing)
+    if entity is _missing:
+        g.identity_cache_stats["misses"] += 1
+        entity = entities[model] = model.get_by_id(entity_id, options=options)
+    else:
+        g.identity_cache_stats["hits"] += 1
+    return entity
+
+
+def discard(entity_id: Any) -> None:
+    if has_app_context() and "identity_cache" in g:
+        g.identity_cache.pop(str(entity_id), None)
+
+
+def stats() -> Dict[str, int]:
+    """Returns hits and misses of the current request"""
+    if not has_app_context() or "identity_cache_stats" not in g:
+        return {"hits": 0, "misses": 0}
+    return dict(g.identity_cache_stats)
+
+
+def add_stats_header(response):
+    hits_and_misses = "hits={hits}, misses={misses}".format(**stats())
+    response.headers["X-Identity-Cache"] = hits_and_misses
+    return response
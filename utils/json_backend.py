@@ -0,0 +1,103 @@
+"""JSON backend of request parsing and response rendering
+
+``JSON_BACKEND`` selects it: "orjson" (C, several times faster than the
+standard library), "json" (standard library) or "auto", which takes orjson
+when it is installed. Both serialize UUID, date/time and Decimal values
+themselves, so schemas dump them as they are (see ``application.ma``).
+
+The "json" backend renders exactly what the standard library always did;
+orjson renders compact UTF-8.
+"""
+import datetime
+import decimal
+import json
+import uuid
+
+from flask.json import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def _default(value):
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (uuid.UUID, decimal.Decimal)):
+        return str(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+class NativeJSONEncoder(JSONEncoder):
+    """Flask encoder with the value conversions of the backends"""
+
+    def default(self, o):
+        try:
+            return _default(o)
+        except TypeError:
+            return super().default(o)
+
+
+class StdlibBackend:
+    name = "json"
+    item_separator = b", "
+    key_separator = b": "
+
+    @staticmethod
+    def dumps(obj, sort_keys=False, **kwargs):
+        return json.dumps(obj, default=_default, sort_keys=sort_keys).encode(
+            "utf-8"
+        )
+
+    @staticmethod
+    def loads(s, **kwargs):
+        return json.loads(s)
+
+
+class OrjsonBackend:
+    name = "orjson"
+    item_separator = b","
+    key_separator = b":"
+
+    @staticmethod
+    def dumps(obj, sort_keys=False, **kwargs):
+        # marshmallow keys errors of list items by their int index, the
+        # standard library renders them as strings
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=_default, option=option)
+
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
+
+
+BACKENDS = {"json": StdlibBackend, "orjson": OrjsonBackend}
+
+
+def get_backend(name):
+    """Gets the backend class by name, "auto" for the fastest installed one
+
+    :raises:
+        ImportError: if the backend is not installed
+    """
+    if name == "auto":
+        name = "orjson" if orjson is not None else "json"
+    if name == "orjson" and orjson is None:
+        raise ImportError("JSON_BACKEND is 'orjson', but it is not installed")
+    return BACKENDS[name]
+
+
+def init_app(app):
+    backend = get_backend(app.config["JSON_BACKEND"])
+    app.extensions["json_backend"] = backend
+    app.json_encoder = NativeJSONEncoder
+    # request.get_json() and response.get_json() parse with the backend
+    app.request_class = type(
+        "Request", (app.request_class,), {"json_module": backend}
+    )
+    app.response_class = type(
+        "Response", (app.response_class,), {"json_module": backend}
+    )
@@ -0,0 +1,50 @@
+"""Named relationship loading profiles
+
+Relationships load lazily, so looking an entity up costs one query unless
+the view asks for more. Models name the relations their views work with::
+
+    loading_profiles = {
+        "subjects": {"subjects": SELECTIN},
+        "card": {"position": JOINED, "specialty": JOINED},
+    }
+
+and views pass the name to the lookup (``profile="subjects"``), which
+loads those relations with the given strategy in the same round trip.
+Dotted paths load nested relations.
+"""
+from functools import lru_cache
+
+from sqlalchemy import orm
+
+SELECTIN = "selectin"
+JOINED = "joined"
+
+LOADERS = {SELECTIN: "selectinload", JOINED: "joinedload"}
+
+
+@lru_cache(maxsize=None)
+def get_profile_options(model, profile=None):
+    """Compiles a loading profile of the model to loader options
+
+    :param model: a specific model
+    :type model: Type[BaseModel]
+    :param profile: name of one of ``model.loading_profiles``, None to load
+     no relations
+    :type profile: str
+    :return: Tuple of loader options
+    """
+    if profile is None:
+        return ()
+    options = []
+    for path, strategy in model.loading_profiles[profile].items():
+        loader, related_model = orm, model
+        names = path.split(".")
+        for depth, name in enumerate(names, 1):
+            attribute = getattr(related_model, name)
+            method = (
+                LOADERS[strategy] if depth == len(names) else "defaultload"
+            )
+            loader = getattr(loader, method)(attribute)
+            related_model = attribute.property.mapper.class_
+        options.append(loader)
+    return tuple(options)
@@ -0,0 +1,173 @@
+import math
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict
+
+import bcrypt
+
+from utils.constants import SERVER_IS_BUSY
+from utils.custom_exceptions import Overloaded
+
+EXECUTOR_TYPES = {
+    "thread": ThreadPoolExecutor,
+    "process": ProcessPoolExecutor,
+}
+
+
+MIN_BCRYPT_ROUNDS = 4
+MAX_BCRYPT_ROUNDS = 31
+CALIBRATION_ROUNDS = 8
+
+
+def _hash_password(plain_text_password: bytes, rounds: int) -> bytes:
+    return bcrypt.hashpw(plain_text_password, bcrypt.gensalt(rounds))
+
+
+def _check_password(plain_text_password: bytes, hashed_password: bytes):
+    return bcrypt.checkpw(plain_text_password, hashed_password)
+
+
+def get_rounds(hashed_password: str) -> int:
+    """Gets the cost factor of a bcrypt hash ("$2b$<rounds>$...")"""
+    return int(hashed_password.split("$")[2])
+
+
+def calibrate_rounds(target_time: float, min_rounds: int) -> int:
+    """Finds the highest bcrypt cost that hashes within the target time
+
+    :param target_time: max seconds a single hash may take
+    :type target_time: float
+    :param min_rounds: lowest acceptable cost, returned even if slower
+    :type min_rounds: int
+    :return: bcrypt cost factor
+    """
+    start = time.perf_counter()
+    _hash_password(b"calibration", CALIBRATION_ROUNDS)
+    elapsed = time.perf_counter() - start
+    # every extra round doubles the work
+    rounds = CALIBRATION_ROUNDS + math.floor(math.log2(target_time / elapsed))
+    rounds = max(rounds, min_rounds, MIN_BCRYPT_ROUNDS)
+    return min(rounds, MAX_BCRYPT_ROUNDS)
+
+
+class PasswordHasher:
+    """Runs bcrypt on a bounded worker pool instead of the request thread
+
+    At most ``PASSWORD_HASHER_MAX_PENDING`` hashes may be queued or running
+    at once; requests beyond that fail fast with ``Overloaded`` instead of
+    tying up more request workers. New hashes use ``BCRYPT_ROUNDS``, see
+    ``flask calibrate-bcrypt-rounds`` for picking it.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_pending: int = 32,
+        executor_type: str = "thread",
+        rounds: int = 12,
+    ) -> None:
+        self._lock = threading.Lock()
+        self._executor = None
+        self._executor_pid = None
+        self.configure(max_workers, max_pending, executor_type, rounds)
+
+    def init_app(self, app) -> None:
+        self.configure(
+            app.config.get("PASSWORD_HASHER_WORKERS", self.max_workers),
+            app.config.get("PASSWORD_HASHER_MAX_PENDING", self.max_pending),
+            app.config.get("PASSWORD_HASHER_EXECUTOR", self.executor_type),
+            app.config.get("BCRYPT_ROUNDS", self.rounds),
+        )
+        if app.config.get("PASSWORD_HASHER_STATS_HEADER", False):
+            app.after_request(self.add_stats_header)
+
+    def configure(
+        self,
+        max_workers: int,
+        max_pending: int,
+        executor_type: str,
+        rounds: int,
+    ) -> None:
+        if executor_type not in EXECUTOR_TYPES:
+            raise ValueError(
+                "Unknown password hasher executor {}".format(executor_type)
+            )
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            self.max_workers = max_workers
+            self.max_pending = max_pending
+            self.executor_type = executor_type
+            self.rounds = rounds
+            self._pending = 0
+            self._completed = 0
+            self._failed = 0
+            self._rejected = 0
+
+    def hash(self, plain_text_password: bytes) -> bytes:
+        return self._run(_hash_password, plain_text_password, self.rounds)
+
+    def check(self, plain_text_password: bytes, hashed_password: bytes):
+        return self._run(_check_password, plain_text_password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        # only ever upgrade: a lower configured cost must not weaken hashes
+        return get_rounds(hashed_password) < self.rounds
+
+    def stats(self) -> Dict[str, int]:
+        """Returns counters of the hashing pool
+
+        :return: dictionary with "workers", "pending", "queue_depth",
+         "completed", "failed" and "rejected" counters
+        """
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "pending": self._pending,
+                "queue_depth": max(0, self._pending - self.max_workers),
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+            }
+
+    def add_stats_header(self, response):
+        counters = ", ".join(
+            "{}={}".format(name, value) for name, value in self.stats().items()
+        )
+        response.headers["X-Password-Hasher"] = counters
+        return response
+
+    def _run(self, func, *args):
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                raise Overloaded(SERVER_IS_BUSY)
+            self._pending += 1
+            executor = self._get_executor()
+        completed = False
+        try:
+            result = executor.submit(func, *args).result()
+            completed = True
+            return result
+        finally:
+            with self._lock:
+                self._pending -= 1
+                if completed:
+                    self._completed += 1
+                else:
+                    self._failed += 1
+
+    def _get_executor(self):
+        # pools do not survive fork(), so every worker process gets its own
+        if self._executor is None or self._executor_pid != os.getpid():
+            self._executor = EXECUTOR_TYPES[self.executor_type](
+                max_workers=self.max_workers
+            )
+            self._executor_pid = os.getpid()
+        return self._executor
+
+
+password_hasher = PasswordHasher()
@@ -0,0 +1,161 @@
+"""Dump functions generated from marshmallow schemas
+
+``Schema.dump`` calls ``Field.serialize`` for every field of every row:
+an accessor, a default check and a ``_serialize`` per value. The compiler
+inspects the dump fields of a schema instance once (``exclude``,
+``only`` and ``load_only`` are already applied to them) and generates a
+function that reads the attributes and keeps values that need no
+conversion as they are:
+
+* str values of String, int values of Integer, float values of Float and
+  bool values of Boolean fields;
+* any value of fields that set ``serializes_as_is`` (see
+  ``application.ma``);
+* None, which all of them dump as None.
+
+Other values and fields go through marshmallow, and nested schemas are
+compiled in turn, so the output is the same as ``schema.dump``. Schemas
+with pre_dump or post_dump processors or their own ``get_attribute`` are
+not compiled.
+"""
+from marshmallow import fields, missing
+from marshmallow.decorators import POST_DUMP, PRE_DUMP
+from marshmallow.schema import Schema
+
+CONVERTED_TYPES = {
+    fields.String: str,
+    fields.Integer: int,
+    fields.Float: float,
+    fields.Boolean: bool,
+}
+# deeper nested schemas are dumped by marshmallow, which ends cycles
+MAX_NESTING = 8
+
+
+def _is_compilable(schema):
+    if type(schema).get_attribute is not Schema.get_attribute:
+        return False
+    return not (
+        schema._has_processors(PRE_DUMP) or schema._has_processors(POST_DUMP)
+    )
+
+
+def get_dump(schema, depth=0):
+    """Gets the compiled dump function of a schema instance
+
+    The function is generated on the first call and kept on the instance.
+
+    :param schema: schema instance
+    :type schema: Schema
+    :param depth: nesting level of the schema
+    :type depth: int
+    :return: function that dumps one object like ``schema.dump``, or None
+     if the schema cannot be compiled
+    """
+    try:
+        return schema.__dict__["_compiled_dump"]
+    except KeyError:
+        if depth > MAX_NESTING or not _is_compilable(schema):
+            dump = None
+        else:
+            dump = compile_dump(schema, depth)
+        schema.__dict__["_compiled_dump"] = dump
+        return dump
+
+
+def _get_nested_dump(field, depth):
+    nested = field.schema
+    dump = get_dump(nested, depth + 1)
+    if dump is None:
+        return None
+    if nested.many or field.many:
+        return lambda value: [dump(item) for item in value]
+    return dump
+
+
+def _get_nested_expression(field, index, namespace, depth):
+    nested_dump = _get_nested_dump(field, depth)
+    if nested_dump is None:
+        return None
+    namespace[f"_nested{index}"] = nested_dump
+    return f"_nested{index}(value)"
+
+
+def _get_scalar_expression(field, name, index, namespace):
+    if vars(type(field)).get("serializes_as_is", False):
+        return "value"
+    converted_type = CONVERTED_TYPES.get(type(field))
+    if converted_type is None or getattr(field, "as_string", False):
+        return None
+    namespace[f"_type{index}"] = converted_type
+    return (
+        f"value if value.__class__ is _type{index} else "
+        f"_field{index}._serialize(value, {name!r}, obj)"
+    )
+
+
+def _get_expression(field, name, index, namespace, depth):
+    """Gets the expression that dumps a not None ``value`` of the field
+
+    :return: Python source or None if the field has to be serialized by
+     marshmallow from the object
+    """
+    if not field._CHECK_ATTRIBUTE:
+        return None
+    if isinstance(field, fields.Nested):
+        return _get_nested_expression(field, index, namespace, depth)
+    return _get_scalar_expression(field, name, index, namespace)
+
+
+def compile_dump(schema, depth=0):
+    """Generates the function that dumps one object like ``schema.dump``
+
+    :param schema: schema instance without dump processors
+    :type schema: Schema
+    :param depth: nesting level of the schema
+    :type depth: int
+    :return: function of the object
+    """
+    namespace = {
+        "_missing": missing,
+        "_accessor": schema.get_attribute,
+        "_dict_class": schema.dict_class,
+        "_serialize": lambda obj: Schema._serialize(schema, obj),
+    }
+    lines = [
+        "def dump(obj):",
+        # mappings are read by key, leave them to marshmallow
+        "    if hasattr(obj, '__getitem__'):",
+        "        return _serialize(obj)",
+        "    result = _dict_class()",
+    ]
+    for index, (name, field) in enumerate(schema.dump_fields.items()):
+        field_name = f"_field{index}"
+        namespace[field_name] = field
+        key = repr(field.data_key if field.data_key is not None else name)
+        attribute = field.attribute or name
+        expression = _get_expression(field, name, index, namespace, depth)
+        serialize = f"{field_name}.serialize({name!r}, obj, _accessor)"
+        # marshmallow reads dotted attributes from the related objects
+        if expression is None or "." in attribute:
+            lines += [
+                f"    value = {serialize}",
+                "    if value is not _missing:",
+                f"        result[{key}] = value",
+            ]
+            continue
+        lines += [
+            f"    value = getattr(obj, {attribute!r}, _missing)",
+            "    if value is _missing:",
+            f"        value = {serialize}",
+            "        if value is not _missing:",
+            f"            result[{key}] = value",
+            "    elif value is None:",
+            f"        result[{key}] = None",
+            "    else:",
+            f"        result[{key}] = {expression}",
+        ]
+    lines.append("    return result")
+    source = "\n".join(lines)
+    exec(compile(source, f"<dump {type(schema).__name__}>", "exec"), namespace)
+    return namespace["dump"]
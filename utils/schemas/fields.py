@@ -0,0 +1,13 @@
+from marshmallow import fields
+
+
+class CommaSeparated(fields.Field):
+    """Query string list: "a,b,a" -> ("a", "b")"""
+
+    default_error_messages = {"invalid": "Not a valid comma-separated list."}
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        if not isinstance(value, str):
+            raise self.make_error("invalid")
+        names = (name.strip() for name in value.split(","))
+        return tuple(dict.fromkeys(name for name in names if name))
@@ -0,0 +1,84 @@
+import base64
+import binascii
+import json
+import re
+
+from flask import current_app
+from marshmallow import (
+    EXCLUDE,
+    Schema,
+    ValidationError,
+    fields,
+    post_load,
+    pre_load,
+)
+from marshmallow.validate import Range
+
+from utils.constants import INVALID_CURSOR
+from utils.schemas.fields import CommaSeparated
+
+FILTER_ARGUMENT = re.compile(r"filter\[(\w+)\](?:\[(\w+)\])?")
+
+
+def encode_cursor(values):
+    """Packs the keyset position of the last row of a page into a token"""
+    position = json.dumps(values, separators=(",", ":"))
+    token = base64.urlsafe_b64encode(position.encode("utf-8"))
+    return token.decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor):
+    """Unpacks a token made by encode_cursor"""
+    padding = "=" * (-len(cursor) % 4)
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + padding))
+    except (binascii.Error, TypeError, ValueError):
+        raise ValidationError(INVALID_CURSOR)
+    if not isinstance(values, list):
+        raise ValidationError(INVALID_CURSOR)
+    return values
+
+
+class Cursor(fields.String):
+    def _deserialize(self, value, attr, data, **kwargs):
+        return decode_cursor(super()._deserialize(value, attr, data, **kwargs))
+
+
+class PageSchema(Schema):
+    """Query string arguments of list endpoints
+
+    ?cursor=<token>&limit=<n>&sort=-a,b&filter[a]=1&filter[b][gte]=2
+
+    ``limit`` defaults to DEFAULT_PAGE_SIZE and is capped at MAX_PAGE_SIZE.
+    ``stream`` asks for all the rows after the cursor at once, in a
+    streamed response (see ``utils.streaming``); ``limit`` is ignored then.
+    ``filters`` maps (field, operator) to the raw value, the operator is
+    "eq" unless given.
+    """
+
+    class Meta:
+        unknown = EXCLUDE
+
+    cursor = Cursor(load_default=None)
+    limit = fields.Integer(load_default=None, validate=Range(min=1))
+    sort = CommaSeparated(load_default=())
+    filters = fields.Raw(load_default=dict)
+    stream = fields.Boolean(load_default=False)
+
+    @pre_load
+    def collect_filters(self, data, **kwargs):
+        data = dict(data)
+        data["filters"] = {}
+        for key, value in list(data.items()):
+            match = FILTER_ARGUMENT.fullmatch(key)
+            if match:
+                name, operator_name = match.groups()
+                data["filters"][name, operator_name or "eq"] = value
+        return data
+
+    @post_load
+    def apply_page_size(self, data, **kwargs):
+        config = current_app.config
+        limit = data["limit"] or config["DEFAULT_PAGE_SIZE"]
+        data["limit"] = min(limit, config["MAX_PAGE_SIZE"])
+        return data
@@ -0,0 +1,147 @@
+from functools import lru_cache
+
+from flask import current_app
+from marshmallow import (
+    EXCLUDE,
+    Schema,
+    ValidationError,
+    fields,
+    post_load,
+)
+from sqlalchemy.orm import lazyload, selectinload
+
+from utils.constants import EXPAND_TOO_DEEP, NOT_EXPANDED, UNKNOWN_FIELDS
+from utils.schemas.fields import CommaSeparated
+
+
+class ProjectionSchema(Schema):
+    """Query string arguments of read endpoints: ?fields=a,b&expand=c,c.d
+
+    ``fields`` limits the attributes of the resource, ``expand`` lists the
+    relations to nest (dotted for deeper ones, at most MAX_EXPAND_DEPTH
+    levels). Relations that are not expanded are not serialized.
+    """
+
+    class Meta:
+        unknown = EXCLUDE
+
+    only = CommaSeparated(data_key="fields", load_default=())
+    expand = CommaSeparated(load_default=())
+
+    @post_load
+    def normalize(self, data, **kwargs):
+        max_depth = current_app.config["MAX_EXPAND_DEPTH"]
+        expand = set()
+        for path in data["expand"]:
+            names = path.split(".")
+            if len(names) > max_depth:
+                raise ValidationError(
+                    EXPAND_TOO_DEEP.format(max_depth), "expand"
+                )
+            expand.update(
+                ".".join(names[:depth]) for depth in range(1, len(names) + 1)
+            )
+        # sorted, so that equal projections share a cached schema
+        data["only"] = tuple(sorted(data["only"]))
+        data["expand"] = tuple(sorted(expand))
+        return data
+
+
+def _get_not_expanded(schema, expand, expanded, prefix=""):
+    not_expanded = []
+    for name, field in schema.fields.items():
+        if not isinstance(field, fields.Nested):
+            continue
+        path = prefix + name
+        if path in expand:
+            expanded.add(path)
+            not_expanded += _get_not_expanded(
+                field.schema, expand, expanded, path + "."
+            )
+        else:
+            not_expanded.append(path)
+    return not_expanded
+
+
+@lru_cache(maxsize=256)
+def get_schema(schema_class, only=(), expand=()):
+    """Gets a schema instance that dumps just the requested fields
+
+    Instances are cached per arguments, so marshmallow builds the fields of
+    every projection once.
+
+    :param schema_class: a specific schema
+    :type schema_class: Type[Schema]
+    :param only: names of the fields to dump, all fields if empty
+    :type only: Tuple[str, ...]
+    :param expand: paths of the relations to nest
+    :type expand: Tuple[str, ...]
+    :return: schema instance
+    :raises:
+        ValidationError: if a field or a relation does not exist, or a
+         relation in ``only`` is not expanded
+    """
+    schema = schema_class()
+    unknown_fields = set(only) - set(schema.fields)
+    if unknown_fields:
+        message = UNKNOWN_FIELDS.format(", ".join(sorted(unknown_fields)))
+        raise ValidationError({"fields": [message]})
+    expanded = set()
+    exclude = _get_not_expanded(schema, set(expand), expanded)
+    unknown_relations = set(expand) - expanded
+    if unknown_relations:
+        message = UNKNOWN_FIELDS.format(", ".join(sorted(unknown_relations)))
+        raise ValidationError({"expand": [message]})
+    not_expanded = set(only).intersection(exclude)
+    if not_expanded:
+        message = NOT_EXPANDED.format(", ".join(sorted(not_expanded)))
+        raise ValidationError({"fields": [message]})
+    if only:
+        only = set(only) | {path.split(".")[0] for path in expand}
+        exclude = [path for path in exclude if path.split(".")[0] in only]
+    return schema_class(only=only or None, exclude=exclude)
+
+
+@lru_cache(maxsize=256)
+def get_loader_options(model, expand=()):
+    """Gets ORM options that load just the expanded relations
+
+    :param model: a specific model
+    :type model: Type[BaseModel]
+    :param expand: paths of the relations to load
+    :type expand: Tuple[str, ...]
+    :return: Tuple of loader options
+    """
+    options = [lazyload("*")]
+    for path in expand:
+        loader, related_model = None, model
+        for name in path.split("."):
+            attribute = getattr(related_model, name)
+            loader = (
+                selectinload(attribute)
+                if loader is None
+                else loader.selectinload(attribute)
+            )
+            related_model = attribute.property.mapper.class_
+        options.append(loader.lazyload("*"))
+    return tuple(options)
+
+
+def get_projection(schema_class, args):
+    """Gets the schema and the loader options requested by the query string
+
+    :param schema_class: a specific schema of a model
+    :type schema_class: Type[SQLAlchemyAutoSchema]
+    :param args: query string arguments
+    :type args: MultiDict
+    :return: Tuple with the schema instance and the loader options
+    :raises:
+        ValidationError: if the arguments are invalid
+    """
+    projection = projection_schema.load(args)
+    schema = get_schema(schema_class, **projection)
+    model = schema_class.opts.model
+    return schema, get_loader_options(model, projection["expand"])
+
+
+projection_schema = ProjectionSchema()
@@ -11,3 +11,15 @@ class SubjectsUuidListSchemas(Schema):
     subject_ids = fields.List(
         fields.UUID, required=True, validate=validate.Length(min=1)
     )
+
+
+class StudentsUuidSetSchema(Schema):
+    """Students of a roster replacement, empty to remove all of them"""
+
+    student_ids = fields.List(fields.UUID, required=True)
+
+
+class SubjectsUuidSetSchema(Schema):
+    """Subjects of a replacement, empty to remove all of them"""
+
+    subject_ids = fields.List(fields.UUID, required=True)
@@ -0,0 +1,68 @@
+"""Streaming mode of list endpoints
+
+``?stream=true`` exports every row after the cursor instead of a page.
+The rows are read from a server-side cursor ``STREAM_BATCH_SIZE`` at a
+time, dumped and serialized batch by batch, and written as a chunked JSON
+array inside the usual envelope::
+
+    {"status": {...}, "data": {"next_cursor": null, "students": [...]}}
+
+so memory stays flat however large the table is, and the envelope leaves
+before the first row is read. Streamed responses have no validators, and
+an error in the middle of the stream can only cut the response short.
+"""
+from itertools import islice
+
+from flask import current_app, stream_with_context
+
+from utils.envelope import iter_list_envelope
+
+
+def _get_chunks(records, schema, batch_size):
+    records = iter(records)
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            return
+        yield schema.dump(batch, many=True)
+
+
+def stream_records(model, name, schema, options, page):
+    """Makes a streamed response of all the records after the page cursor
+
+    :param model: a specific model
+    :type model: Type[BaseModel]
+    :param name: key of the list in "data", e.g. "students"
+    :type name: str
+    :param schema: schema instance that dumps the records
+    :type schema: Schema
+    :param options: ORM loader options
+    :param page: arguments loaded by ``PageSchema``, "limit" is ignored
+    :type page: Dict
+    :return: Response
+    :raises:
+        ValidationError: if the sort, the filters or the cursor are invalid
+    """
+    app = current_app._get_current_object()
+    batch_size = app.config["STREAM_BATCH_SIZE"]
+    records = model.get_stream(
+        cursor=page["cursor"],
+        options=options,
+        sort=page["sort"],
+        filters=page["filters"],
+        batch_size=batch_size,
+    )
+    response = app.response_class(mimetype=app.config["JSONIFY_MIMETYPE"])
+    response.response = stream_with_context(
+        iter_list_envelope(
+            app.extensions["json_backend"],
+            name,
+            _get_chunks(records, schema, batch_size),
+            response.status,
+            response.status_code,
+            app.config["JSON_SORT_KEYS"],
+        )
+    )
+    # already in the envelope, see utils.envelope
+    response.enveloped = True
+    return response
@@ -0,0 +1,289 @@
+import datetime
+import unittest
+import uuid
+from unittest.mock import patch
+
+from marshmallow import ValidationError
+from sqlalchemy import inspect
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from application.db import db
+from positions import models as position_models
+from subjects import models as subject_models
+from users import models as user_models
+from users import schemas as user_schemas
+from utils.base_model import get_changed_members
+from utils.test_utils import BaseTestCase, create_obj
+
+
+class IdentityMapLookupTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.position_id, self.position = create_obj(
+            {"position_name": "Docent"}, position_models.PositionModel
+        )
+        make_transient_to_detached(self.position)
+        db.session.add(self.position)
+
+    def tearDown(self) -> None:
+        db.session.remove()
+        super().tearDown()
+
+    @patch("positions.models.PositionModel.query")
+    def test_get_by_id_from_identity_map(self, mock_query):
+        for searched_id in (self.position_id, str(self.position_id)):
+            self.assertIs(
+                position_models.PositionModel.get_by_id(searched_id),
+                self.position,
+            )
+        self.assertIsNone(position_models.PositionModel.get_by_id("invalid"))
+        mock_query.filter.assert_not_called()
+
+    @patch("positions.models.PositionModel.query")
+    def test_get_by_ids_queries_only_missing(self, mock_query):
+        missing_id, missing = create_obj(
+            {"position_name": "Professor"}, position_models.PositionModel
+        )
+        mock_query.filter.return_value = [missing]
+        positions = position_models.PositionModel.get_by_ids(
+            [str(missing_id), self.position_id, "invalid", missing_id]
+        )
+        self.assertListEqual(positions, [missing, self.position])
+        self.assertEqual(mock_query.filter.call_count, 1)
+        (criterion,) = mock_query.filter.call_args.args
+        self.assertListEqual(criterion.right.value, [missing_id])
+
+
+class InsertUniqueTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = patch("utils.base_model.unit_of_work.save_changes")
+        self.save_changes = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(db.session, "execute")
+        self.execute = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self) -> None:
+        db.session.remove()
+        super().tearDown()
+
+    def get_statements(self):
+        return [
+            call.args[0].compile(dialect=postgresql.dialect())
+            for call in self.execute.call_args_list
+        ]
+
+    def test_constraints(self):
+        constraints = {
+            constraint.name
+            for model in (
+                subject_models.SubjectModel,
+                position_models.PositionModel,
+            )
+            for constraint in model.__table__.constraints
+        }
+        self.assertIn("uq_subject_name_year", constraints)
+        self.assertIn("uq_position_position_name", constraints)
+
+    def test_conflict(self):
+        subject = subject_models.SubjectModel(name="Math", year=2021)
+        self.execute.return_value.first.return_value = None
+        self.assertFalse(subject.insert_unique())
+        (statement,) = self.get_statements()
+        self.assertIn("ON CONFLICT (name, year) DO NOTHING", str(statement))
+        self.assertNotIn(subject, db.session)
+        self.save_changes.assert_not_called()
+
+    def test_inserts_every_table(self):
+        student_id = uuid.uuid4()
+        student = user_models.StudentModel(
+            email="student@gmail.com", year_of_study=2
+        )
+        columns = [
+            *user_models.UserModel.__table__.columns,
+            *user_models.StudentModel.__table__.columns,
+        ]
+        self.execute.return_value.first.return_value._mapping = {
+            column: student_id if column.name == "id" else None
+            for column in columns
+        }
+        self.assertTrue(student.insert_unique())
+        user, extension = self.get_statements()
+        self.assertIn("ON CONFLICT (lower(email)) DO NOTHING", str(user))
+        self.assertEqual(user.params["type"], "student")
+        self.assertNotIn("ON CONFLICT", str(extension))
+        self.assertEqual(student.id, student_id)
+        self.assertIn(student, db.session)
+        self.assertFalse(db.session.is_modified(student))
+        self.save_changes.assert_called_once_with()
+
+
+class AssociationTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = patch("utils.base_model.unit_of_work.save_changes")
+        self.save_changes = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(db.session, "execute")
+        self.execute = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.teacher_id, self.teacher = create_obj(
+            {"email": "teacher@gmail.com"}, user_models.TeacherModel
+        )
+        make_transient_to_detached(self.teacher)
+        db.session.add(self.teacher)
+        set_committed_value(self.teacher, "subjects", [])
+        self.subject_ids = [uuid.uuid4() for _ in range(3)]
+
+    def tearDown(self) -> None:
+        db.session.remove()
+        super().tearDown()
+
+    def get_statement(self):
+        (call,) = self.execute.call_args_list
+        return str(call.args[0].compile(dialect=postgresql.dialect()))
+
+    def test_appoint_items(self):
+        missing_ids = self.subject_ids[:0:-1]
+        self.execute.return_value.all.return_value = [
+            (item_id,) for item_id in missing_ids
+        ]
+        self.assertListEqual(
+            self.teacher.appoint_items("subjects", self.subject_ids),
+            self.subject_ids[1:],
+        )
+        statement = self.get_statement()
+        self.assertIn("INSERT INTO subject_teacher", statement)
+        self.assertIn("ON CONFLICT DO NOTHING", statement)
+        self.assertIn('UPDATE "user" SET updated_at=now()', statement)
+        self.assertIn("UPDATE subject SET updated_at=now()", statement)
+        self.assertNotIn("subjects", inspect(self.teacher).dict)
+        self.save_changes.assert_called_once_with()
+
+    def test_replace_items(self):
+        self.execute.return_value.all.return_value = []
+        for subject_ids in (self.subject_ids, []):
+            self.assertListEqual(
+                self.teacher.appoint_items(
+                    "subjects", subject_ids, replace=True
+                ),
+                [],
+            )
+        statements = [
+            str(call.args[0].compile(dialect=postgresql.dialect()))
+            for call in self.execute.call_args_list
+        ]
+        for statement in statements:
+            self.assertIn("INSERT INTO subject_teacher", statement)
+            self.assertIn("DELETE FROM subject_teacher", statement)
+            self.assertIn("UPDATE subject SET updated_at=now()", statement)
+
+    def test_disappoint_items(self):
+        missing_id, unlinked_id, _ = self.subject_ids
+        self.execute.return_value.all.return_value = [
+            (unlinked_id, True),
+            (missing_id, False),
+        ]
+        self.assertEqual(
+            self.teacher.disappoint_items("subjects", self.subject_ids),
+            ([missing_id], [unlinked_id]),
+        )
+        statement = self.get_statement()
+        self.assertIn("DELETE FROM subject_teacher", statement)
+        self.assertIn("UPDATE subject SET updated_at=now()", statement)
+        self.assertNotIn("subjects", inspect(self.teacher).dict)
+
+
+class ChangedMembersTestCase(BaseTestCase):
+    def tearDown(self) -> None:
+        db.session.remove()
+        super().tearDown()
+
+    def test_changed_members(self):
+        _, teacher = create_obj(
+            {"email": "teacher@gmail.com"}, user_models.TeacherModel
+        )
+        _, subject = create_obj({"name": "Math"}, subject_models.SubjectModel)
+        for entity in (teacher, subject):
+            make_transient_to_detached(entity)
+            db.session.add(entity)
+        set_committed_value(teacher, "subjects", [])
+        self.assertListEqual(get_changed_members(teacher), [])
+        teacher.subjects.append(subject)
+        self.assertListEqual(get_changed_members(teacher), [teacher, subject])
+        # the other side is not loaded, the backref only queues the change
+        self.assertListEqual(get_changed_members(subject), [])
+
+
+class UpdateReturningTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = patch("utils.base_model.unit_of_work.save_changes")
+        self.save_changes = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(db.session, "execute")
+        self.execute = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get_statement(self):
+        (call,) = self.execute.call_args_list
+        return str(call.args[0].compile(dialect=postgresql.dialect()))
+
+    def test_load_changes(self):
+        schema = user_schemas.StudentSchema()
+        self.assertDictEqual(
+            schema.load_changes({"first_name": "Name", "year_of_study": 3}),
+            {"first_name": "Name", "year_of_study": 3},
+        )
+        with self.assertRaises(ValidationError):
+            schema.load_changes({"first_name": "N"})
+        with self.assertRaises(ValidationError):
+            schema.load_changes({"groups": []})
+
+    def test_update_changed_columns(self):
+        student_id = uuid.uuid4()
+        student = self.execute.return_value.scalars.return_value.first
+        self.assertIs(
+            user_models.StudentModel.update_returning(
+                student_id, {"first_name": "Name", "year_of_study": 2}
+            ),
+            student.return_value,
+        )
+        statement = self.get_statement()
+        self.assertIn(
+            'UPDATE "user" SET updated_at=now(), first_name=', statement
+        )
+        self.assertIn("UPDATE student SET year_of_study=", statement)
+        self.assertIn("RETURNING", statement)
+        self.assertNotIn("other", statement)
+        self.save_changes.assert_called_once_with()
+
+    def test_updated_at_given(self):
+        subject_models.SubjectModel.update_returning(
+            uuid.uuid4(), {"updated_at": datetime.datetime(2020, 1, 1)}
+        )
+        self.assertIn(
+            "UPDATE subject SET updated_at=now() WHERE", self.get_statement()
+        )
+
+    def test_natural_key_taken(self):
+        self.execute.return_value.scalars.return_value.first.return_value = (
+            None
+        )
+        self.assertIsNone(
+            subject_models.SubjectModel.update_returning(
+                uuid.uuid4(), {"name": "Math"}
+            )
+        )
+        statement = self.get_statement()
+        self.assertIn("FROM subject AS other", statement)
+        self.assertIn("other.name = %(param_1)s", statement)
+        self.assertIn("other.year = subject.year", statement)
+        self.save_changes.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import datetime
+import unittest
+import uuid
+from types import SimpleNamespace
+
+from marshmallow import Schema, fields, post_dump
+
+from groups import models as group_models
+from users import models as user_models
+from users import schemas as user_schemas
+from utils.schemas.compiler import compile_dump, get_dump
+from utils.schemas.projection import get_schema
+from utils.test_utils import BaseTestCase, create_obj
+
+
+class ItemSchema(Schema):
+    name = fields.String()
+    count = fields.Integer(data_key="total")
+    ratio = fields.Float(attribute="share")
+    flag = fields.Boolean()
+    secret = fields.String(load_only=True)
+    label = fields.Method("get_label")
+    city = fields.String(attribute="address.city")
+    when = fields.DateTime(dump_default=datetime.datetime(2020, 1, 2))
+
+    def get_label(self, obj):
+        return type(obj).__name__
+
+
+class OwnerSchema(Schema):
+    id = fields.UUID()
+    items = fields.Nested(ItemSchema, many=True, exclude=("secret",))
+    best = fields.Nested(ItemSchema, only=("name",))
+
+
+class HookedSchema(Schema):
+    name = fields.String()
+
+    @post_dump
+    def add(self, data, **kwargs):
+        return data
+
+
+def get_item(name, **values):
+    item = {
+        "name": name,
+        "count": 3,
+        "share": 0.5,
+        "flag": True,
+        "secret": "s",
+        "address": SimpleNamespace(city="Lviv"),
+    }
+    item.update(values)
+    return SimpleNamespace(**item)
+
+
+class CompilerTestCase(unittest.TestCase):
+    def assertSameDump(self, schema, obj):
+        self.assertEqual(compile_dump(schema)(obj), schema.dump(obj))
+
+    def test_fields(self):
+        schema = ItemSchema()
+        self.assertSameDump(schema, get_item("a"))
+        # values of other types than the field is for are converted
+        self.assertSameDump(schema, get_item(None, count="4", share=1, flag=1))
+        self.assertSameDump(schema, {"name": "c", "count": 1})
+        self.assertNotIn("secret", compile_dump(schema)(get_item("a")))
+        dump = compile_dump(ItemSchema(exclude=("flag",)))
+        self.assertNotIn("flag", dump(get_item("a")))
+
+    def test_nested(self):
+        owner = SimpleNamespace(
+            id=uuid.uuid4(),
+            items=[get_item("a"), get_item("b", when=None)],
+            best=get_item("c"),
+        )
+        schema = OwnerSchema()
+        self.assertSameDump(schema, owner)
+        owner.items, owner.best = [], None
+        self.assertSameDump(schema, owner)
+
+    def test_not_compiled(self):
+        self.assertIsNone(get_dump(HookedSchema()))
+        schema = ItemSchema()
+        self.assertIs(get_dump(schema), get_dump(schema))
+
+
+class CompiledModelSchemaTestCase(BaseTestCase):
+    def test_same_as_marshmallow(self):
+        _, group = create_obj(
+            {"name": "KN-1", "year": 2020, "credits_per_student": 60},
+            group_models.GroupModel,
+        )
+        students = [
+            create_obj(
+                {
+                    "email": f"student{index}@gmail.com",
+                    "first_name": "Name",
+                    "last_name": None,
+                    "password": "hash",
+                    "age": 20,
+                    "year_of_study": 2,
+                    "created_at": datetime.datetime(2021, 1, 1),
+                    "groups": [group],
+                },
+                user_models.StudentModel,
+            )[1]
+            for index in range(3)
+        ]
+        schema = get_schema(user_schemas.StudentSchema, expand=("groups",))
+        compiled = schema.dump(students, many=True)
+        user_schemas.StudentSchema.opts.compiled = False
+        try:
+            expected = schema.dump(students, many=True)
+        finally:
+            user_schemas.StudentSchema.opts.compiled = True
+        self.assertEqual(compiled, expected)
+        self.assertNotIn("password", compiled[0])
+        self.assertEqual(compiled[0]["groups"][0]["name"], "KN-1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import gzip
+import unittest
+import zlib
+
+from flask import Response, stream_with_context
+
+from utils.test_utils import BaseTestCase
+
+BODY = b'{"name": "Subject", "teachers": []}' * 100
+CHUNKS = [BODY[:10], BODY[10:20], BODY[20:30]]
+
+
+class CompressionTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.app.add_url_rule(
+            "/large",
+            "large",
+            lambda: Response(
+                BODY, mimetype="application/json", headers={"ETag": '"a"'}
+            ),
+        )
+        self.app.add_url_rule(
+            "/small",
+            "small",
+            lambda: Response(BODY[:100], mimetype="application/json"),
+        )
+        self.app.add_url_rule(
+            "/encoded",
+            "encoded",
+            lambda: Response(
+                gzip.compress(BODY),
+                mimetype="application/json",
+                headers={"Content-Encoding": "gzip"},
+            ),
+        )
+        self.app.add_url_rule(
+            "/streamed",
+            "streamed",
+            lambda: Response(
+                stream_with_context(iter(CHUNKS)),
+                mimetype="application/json",
+            ),
+        )
+        self.app.add_url_rule(
+            "/not_modified", "not_modified", lambda: ("", 304, {"ETag": '"a"'})
+        )
+
+    def get(self, url, accept_encoding):
+        return self.client.get(
+            url, headers={"Accept-Encoding": accept_encoding}
+        )
+
+    def test_negotiation(self):
+        response = self.get("/large", "deflate, gzip;q=0.5")
+        self.assertEqual(response.headers["Content-Encoding"], "deflate")
+        self.assertEqual(zlib.decompress(response.data), BODY)
+        self.assertEqual(response.headers["Vary"], "Accept-Encoding")
+        self.assertEqual(response.headers["ETag"], 'W/"a"')
+        self.assertEqual(response.content_length, len(response.data))
+
+        response = self.get("/large", "*")
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(response.data), BODY)
+
+        for accept_encoding in ("gzip;q=0, deflate;q=0", "br", "identity"):
+            response = self.get("/large", accept_encoding)
+            self.assertNotIn("Content-Encoding", response.headers)
+            self.assertEqual(response.data, BODY)
+            self.assertEqual(response.headers["ETag"], '"a"')
+
+    def test_skipped(self):
+        response = self.get("/small", "gzip")
+        self.assertNotIn("Content-Encoding", response.headers)
+        self.assertEqual(response.headers["Vary"], "Accept-Encoding")
+        response = self.get("/encoded", "deflate")
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(response.data), BODY)
+
+    def test_streamed(self):
+        response = self.client.get(
+            "/streamed", headers={"Accept-Encoding": "gzip"}, buffered=False
+        )
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertNotIn("Content-Length", response.headers)
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        chunks = iter(response.response)
+        # every chunk is sent as soon as it is compressed
+        self.assertEqual(decompressor.decompress(next(chunks)), CHUNKS[0])
+        rest = b"".join(decompressor.decompress(chunk) for chunk in chunks)
+        self.assertEqual(rest, b"".join(CHUNKS[1:]))
+        response.close()
+
+    def test_not_modified(self):
+        response = self.get("/not_modified", "gzip")
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers["ETag"], 'W/"a"')
+
+
+if __name__ == "__main__":
+    unittest.main()
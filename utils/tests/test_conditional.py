@@ -0,0 +1,63 @@
+import unittest
+from datetime import datetime
+
+from subjects import models as subject_models
+from subjects import schemas as subject_schemas
+from users import models as user_models
+from utils.conditional import get_validators, is_modified
+from utils.schemas.projection import get_schema
+from utils.test_utils import BaseTestCase, create_obj
+
+
+class ConditionalTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        _, self.subject = create_obj(
+            {"name": "Math", "updated_at": datetime(2022, 1, 1, 12)},
+            subject_models.SubjectModel,
+        )
+        _, self.teacher = create_obj(
+            {"first_name": "t", "updated_at": datetime(2022, 1, 2, 12)},
+            user_models.TeacherModel,
+        )
+        self.subject.teachers = [self.teacher]
+
+    def test_validators_follow_serialized_rows(self):
+        schema = get_schema(subject_schemas.SubjectSchema)
+        expanded = get_schema(
+            subject_schemas.SubjectSchema, expand=("teachers",)
+        )
+        validators = get_validators(schema, [self.subject])
+        self.assertEqual(validators.last_modified, datetime(2022, 1, 1, 12))
+        self.assertEqual(validators, get_validators(schema, [self.subject]))
+        expanded_validators = get_validators(expanded, [self.subject])
+        self.assertNotEqual(validators.etag, expanded_validators.etag)
+        # a row deleted from the collection would not be newer
+        self.assertIsNone(expanded_validators.last_modified)
+        self.teacher.updated_at = datetime(2022, 1, 3, 12)
+        self.assertEqual(validators, get_validators(schema, [self.subject]))
+        self.assertNotEqual(
+            expanded_validators, get_validators(expanded, [self.subject])
+        )
+        self.assertIsNone(
+            get_validators(schema, [self.subject], last_modified=False)[1]
+        )
+
+    def test_is_modified(self):
+        validators = get_validators(
+            get_schema(subject_schemas.SubjectSchema), [self.subject]
+        )
+        requests = [
+            ({"If-None-Match": f'"{validators.etag}"'}, False),
+            ({"If-None-Match": '"other"'}, True),
+            ({"If-Modified-Since": "Sat, 01 Jan 2022 12:00:00 GMT"}, False),
+            ({"If-Modified-Since": "Sat, 01 Jan 2022 11:59:59 GMT"}, True),
+            ({}, True),
+        ]
+        for headers, expected in requests:
+            with self.app.test_request_context(headers=headers):
+                self.assertEqual(is_modified(validators), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+
+from flask import jsonify
+
+from utils import envelope, json_backend
+from utils.test_utils import BaseTestCase
+
+
+class EnvelopeTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        # the standard library renders the historical bytes
+        self.app.config["JSON_BACKEND"] = "json"
+        json_backend.init_app(self.app)
+        envelope.init_app(self.app)
+
+    def test_data(self):
+        with self.app.test_request_context():
+            response = self.app.make_response(
+                ({"data": {"b": "ü", "a": [1.5, None]}}, 201, {"X-A": "1"})
+            )
+        self.assertEqual(
+            response.get_data(as_text=True),
+            '{"status": {"message": "201 CREATED", "code": 201}, '
+            '"data": {"a": [1.5, null], "b": "\\u00fc"}}',
+        )
+        self.assertEqual(response.mimetype, "application/json")
+        self.assertEqual(response.headers["X-A"], "1")
+
+    def test_message_and_errors(self):
+        with self.app.test_request_context():
+            response = self.app.make_response(
+                {"message": "Done", "data": [], "errors": {"E": "e"}}
+            )
+        self.assertEqual(
+            response.get_data(as_text=True),
+            '{"status": {"message": "Done", "code": 200}, '
+            '"errors": [{"E": "e"}]}',
+        )
+
+    def test_serialized_elsewhere(self):
+        with self.app.test_request_context():
+            response = self.app.make_response((jsonify(msg="no"), 401))
+            response = envelope.envelope_json_response(response)
+            empty = self.app.make_response(("", 304))
+        self.assertEqual(
+            response.get_data(as_text=True),
+            '{"status": {"message": "401 UNAUTHORIZED", "code": 401}}',
+        )
+        self.assertEqual(empty.get_data(), b"")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import unittest
+import uuid
+
+from marshmallow import ValidationError
+
+from application.db import db
+from groups import models as group_models
+from specialties import models as specialty_models
+from subjects import models as subject_models
+from users import models as user_models
+from utils.constants import FILTER_NOT_ALLOWED, SORT_NOT_ALLOWED
+from utils.filters import (
+    AssociationFilter,
+    get_filter_predicates,
+    get_keyset_predicate,
+    get_sort_keys,
+)
+from utils.test_utils import BaseTestCase
+
+FILTERED_MODELS = (
+    user_models.StudentModel,
+    user_models.TeacherModel,
+    subject_models.SubjectModel,
+    group_models.GroupModel,
+    specialty_models.SpecialtyModel,
+)
+
+
+def is_indexed(column):
+    """Checks if the column leads an index or the primary key"""
+    leading_columns = [
+        list(index.columns)[0] for index in column.table.indexes
+    ] + [list(column.table.primary_key.columns)[0]]
+    return any(column is leading for leading in leading_columns)
+
+
+def get_filtered_column(model, name, model_filter):
+    if isinstance(model_filter, AssociationFilter):
+        return model_filter.related_column
+    return getattr(model, name).property.columns[0]
+
+
+class FiltersTestCase(BaseTestCase):
+    def test_filter_fields_are_indexed(self):
+        for model in FILTERED_MODELS:
+            for name, model_filter in model.filter_fields.items():
+                column = get_filtered_column(model, name, model_filter)
+                # too few distinct values to be worth an index
+                if not isinstance(column.type, db.Boolean):
+                    self.assertTrue(is_indexed(column), f"{model} {name}")
+
+    def test_sort_fields_are_indexed(self):
+        for model in FILTERED_MODELS:
+            for name in model.sort_fields:
+                column, _ = get_sort_keys(model, (name,))[0]
+                self.assertTrue(is_indexed(column), f"{model} {name}")
+
+    def test_default_filter(self):
+        predicates = get_filter_predicates(user_models.StudentModel, {})
+        self.assertEqual(len(predicates), 1)
+        predicates = get_filter_predicates(
+            user_models.StudentModel,
+            {("is_active", "eq"): "false", ("year_of_study", "gte"): "2"},
+        )
+        self.assertEqual(len(predicates), 2)
+
+    def test_association_filter(self):
+        group_ids = [uuid.uuid4(), uuid.uuid4()]
+        (predicate,) = get_filter_predicates(
+            subject_models.SubjectModel,
+            {("group_id", "in"): ",".join(map(str, group_ids))},
+        )
+        sql = str(predicate)
+        self.assertIn("subject.id IN (SELECT subject_group.subject_id", sql)
+        self.assertIn("subject_group.group_id IN", sql)
+
+    def test_filter_fail(self):
+        with self.assertRaises(ValidationError) as context:
+            get_filter_predicates(
+                subject_models.SubjectModel, {("credits", "eq"): "1"}
+            )
+        self.assertDictEqual(
+            context.exception.messages,
+            {"filter": [FILTER_NOT_ALLOWED.format("credits", "eq")]},
+        )
+        with self.assertRaises(ValidationError) as context:
+            get_filter_predicates(
+                subject_models.SubjectModel, {("year", "eq"): "first"}
+            )
+        self.assertDictEqual(
+            context.exception.messages,
+            {"filter[year]": ["Not a valid integer."]},
+        )
+
+    def test_sort_keys(self):
+        keys = get_sort_keys(subject_models.SubjectModel, ("-year",))
+        self.assertListEqual(
+            [(column.name, descending) for column, descending in keys],
+            [("year", True), ("id", True)],
+        )
+        keys = get_sort_keys(user_models.StudentModel, ())
+        self.assertListEqual(
+            [str(column) for column, _ in keys],
+            ["user.created_at", "user.id"],
+        )
+
+    def test_sort_fail_not_allowed(self):
+        with self.assertRaises(ValidationError) as context:
+            get_sort_keys(subject_models.SubjectModel, ("credits",))
+        self.assertDictEqual(
+            context.exception.messages,
+            {"sort": [SORT_NOT_ALLOWED.format("credits")]},
+        )
+
+    def test_keyset_predicate(self):
+        subject_id = str(uuid.uuid4())
+        keys = get_sort_keys(subject_models.SubjectModel, ("-year",))
+        predicate = get_keyset_predicate(keys, [2021, subject_id])
+        self.assertEqual(
+            str(predicate), "(subject.year, subject.id) < (:param_1, :param_2)"
+        )
+        keys = get_sort_keys(subject_models.SubjectModel, ("name", "-year"))
+        predicate = get_keyset_predicate(keys, ["Math", 2021, subject_id])
+        self.assertEqual(str(predicate).count(" OR "), 2)
+        with self.assertRaises(ValidationError):
+            get_keyset_predicate(keys, ["Math", "first", subject_id])
+
+
+if __name__ == "__main__":
+    unittest.main()
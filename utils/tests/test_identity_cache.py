@@ -0,0 +1,43 @@
+import unittest
+import uuid
+from unittest.mock import patch
+
+from users import models as user_models
+from utils import identity_cache
+from utils.test_utils import BaseTestCase
+
+
+class IdentityCacheTestCase(BaseTestCase):
+    @patch("users.models.UserModel.get_by_id")
+    def test_get_by_id_once_per_request(self, mock_get_by_id):
+        user_id = uuid.uuid4()
+        mock_get_by_id.return_value = None
+        with self.app.test_request_context():
+            self.app.preprocess_request()
+            for searched_id in (user_id, str(user_id), user_id):
+                self.assertIsNone(
+                    identity_cache.get_by_id(
+                        user_models.UserModel, searched_id
+                    )
+                )
+            self.assertDictEqual(
+                identity_cache.stats(), {"hits": 2, "misses": 1}
+            )
+        with self.app.test_request_context():
+            self.app.preprocess_request()
+            identity_cache.get_by_id(user_models.UserModel, user_id)
+        self.assertEqual(mock_get_by_id.call_count, 2)
+
+    @patch("users.models.UserModel.get_by_id")
+    def test_discard(self, mock_get_by_id):
+        user_id = uuid.uuid4()
+        with self.app.test_request_context():
+            self.app.preprocess_request()
+            identity_cache.get_by_id(user_models.UserModel, user_id)
+            identity_cache.discard(user_id)
+            identity_cache.get_by_id(user_models.UserModel, user_id)
+        self.assertEqual(mock_get_by_id.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import datetime
+import decimal
+import json
+import unittest
+import uuid
+
+from flask import request
+from marshmallow import ValidationError
+
+from assignments import schemas as assignment_schemas
+from subjects import models as subject_models
+from subjects import schemas as subject_schemas
+from utils import json_backend
+from utils.schemas.uuid_list_validator import StudentsUuidListSchema
+from utils.test_utils import BaseTestCase, create_obj
+
+
+class JsonBackendTestCase(BaseTestCase):
+    value = {
+        "id": uuid.UUID(int=1),
+        "at": datetime.datetime(2022, 1, 2, 3, 4, 5, 6),
+        "on": datetime.date(2022, 1, 2),
+        "price": decimal.Decimal("1.10"),
+        "name": "ü",
+    }
+    expected = {
+        "id": "00000000-0000-0000-0000-000000000001",
+        "at": "2022-01-02T03:04:05.000006",
+        "on": "2022-01-02",
+        "price": "1.10",
+        "name": "ü",
+    }
+
+    def test_backends_render_the_same_values(self):
+        for backend in json_backend.BACKENDS.values():
+            rendered = backend.dumps(self.value, sort_keys=True)
+            self.assertEqual(json.loads(rendered), self.expected)
+            self.assertEqual(backend.loads(rendered), self.expected)
+            self.assertEqual(
+                list(backend.loads(rendered)), sorted(self.expected)
+            )
+            self.assertIsInstance(rendered, bytes)
+
+    def test_index_keys_of_list_errors(self):
+        with self.assertRaises(ValidationError) as context:
+            StudentsUuidListSchema().load({"student_ids": ["bad"]})
+        messages = context.exception.messages
+        expected = json.loads(json.dumps(messages))
+        self.assertIn("0", expected["student_ids"])
+        for backend in json_backend.BACKENDS.values():
+            rendered = backend.dumps(messages, sort_keys=True)
+            self.assertEqual(json.loads(rendered), expected)
+        with self.app.test_request_context():
+            response = self.app.make_response(({"errors": messages}, 400))
+        self.assertEqual(response.get_json(), {"errors": expected})
+
+    def test_auto(self):
+        self.assertIs(
+            json_backend.get_backend("auto"), json_backend.OrjsonBackend
+        )
+        self.assertIs(
+            json_backend.get_backend("json"), json_backend.StdlibBackend
+        )
+
+    def test_request_parsing(self):
+        with self.app.test_request_context(json={"a": [1, "ü"]}):
+            self.assertIs(
+                request.json_module, self.app.extensions["json_backend"]
+            )
+            self.assertEqual(request.get_json(), {"a": [1, "ü"]})
+
+    def test_schemas_dump_native_values(self):
+        subject_id, subject = create_obj(
+            {"name": "Math", "created_at": datetime.datetime(2022, 1, 1)},
+            subject_models.SubjectModel,
+        )
+        dumped = subject_schemas.SubjectSchema(only=("id", "created_at")).dump(
+            subject
+        )
+        self.assertEqual(
+            dumped,
+            {"id": subject_id, "created_at": datetime.datetime(2022, 1, 1)},
+        )
+        errors = assignment_schemas.AssignmentSchema(
+            only=("subject_id",)
+        ).validate({"subject_id": "invalid"})
+        self.assertIn("subject_id", errors)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+from unittest.mock import patch
+
+from assignments import models as assignment_models
+from groups import models as group_models
+from specialties import models as specialty_models
+from subjects import models as subject_models
+from users import models as user_models
+from utils.loading_profiles import JOINED, SELECTIN, get_profile_options
+from utils.test_utils import BaseTestCase
+
+
+class LoadingProfilesTestCase(BaseTestCase):
+    def test_relations_load_lazily_by_default(self):
+        for model in (subject_models.SubjectModel, group_models.GroupModel):
+            for relationship in model.__mapper__.relationships:
+                self.assertIn(relationship.lazy, (True, "select"))
+
+    def test_profiles_compile(self):
+        models = (
+            subject_models.SubjectModel,
+            group_models.GroupModel,
+            specialty_models.SpecialtyModel,
+            user_models.TeacherModel,
+        )
+        for model in models:
+            for profile, relations in model.loading_profiles.items():
+                options = get_profile_options(model, profile)
+                self.assertEqual(len(options), len(relations))
+        self.assertEqual(get_profile_options(subject_models.SubjectModel), ())
+
+    @patch.dict(
+        assignment_models.AssignmentModel.loading_profiles,
+        {"card": {"subject": JOINED, "subject.teachers": SELECTIN}},
+    )
+    def test_strategies(self):
+        get_profile_options.cache_clear()
+        options = get_profile_options(
+            assignment_models.AssignmentModel, "card"
+        )
+        query = assignment_models.AssignmentModel.query.options(*options)
+        self.assertIn("LEFT OUTER JOIN subject", str(query))
+        self.assertNotIn("subject_teacher", str(query))
+        get_profile_options.cache_clear()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from utils.custom_exceptions import Overloaded
+from utils.password_hasher import PasswordHasher, get_rounds, password_hasher
+from utils.test_utils import BaseTestCase
+
+
+class PasswordHasherTestCase(unittest.TestCase):
+    def setUp(self):
+        self.hasher = PasswordHasher(max_workers=1, max_pending=2, rounds=4)
+        self.addCleanup(self.hasher.configure, 1, 2, "thread", 4)
+        self.release = threading.Event()
+        self.started = threading.Semaphore(0)
+
+    def block(self, *args):
+        self.started.release()
+        self.release.wait(5)
+        return b"hashed"
+
+    def hash_in_thread(self):
+        thread = threading.Thread(target=self.hasher.hash, args=(b"pw",))
+        thread.start()
+        self.addCleanup(thread.join, 5)
+        return thread
+
+    def wait_for_pending(self, pending):
+        deadline = time.monotonic() + 5
+        while self.hasher.stats()["pending"] < pending:
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.01)
+
+    @patch("utils.password_hasher._hash_password")
+    def test_reject_when_full(self, mock_hash_password):
+        mock_hash_password.side_effect = self.block
+        self.addCleanup(self.release.set)
+        first = self.hash_in_thread()
+        self.assertTrue(self.started.acquire(timeout=5))
+        second = self.hash_in_thread()
+        # the second hash waits for the only worker
+        self.wait_for_pending(2)
+        with self.assertRaises(Overloaded):
+            self.hasher.hash(b"pw")
+        self.assertDictEqual(
+            self.hasher.stats(),
+            {
+                "workers": 1,
+                "pending": 2,
+                "queue_depth": 1,
+                "completed": 0,
+                "failed": 0,
+                "rejected": 1,
+            },
+        )
+        self.release.set()
+        first.join(5)
+        second.join(5)
+        stats = self.hasher.stats()
+        self.assertEqual((stats["pending"], stats["completed"]), (0, 2))
+
+    @patch("utils.password_hasher._check_password")
+    def test_count_failed(self, mock_check_password):
+        mock_check_password.side_effect = ValueError("Invalid salt")
+        with self.assertRaises(ValueError):
+            self.hasher.check(b"pw", b"not a hash")
+        stats = self.hasher.stats()
+        self.assertEqual((stats["completed"], stats["failed"]), (0, 1))
+        self.assertEqual(stats["pending"], 0)
+
+    def test_process_executor(self):
+        hasher = PasswordHasher(
+            max_workers=1, max_pending=2, executor_type="process", rounds=4
+        )
+        self.addCleanup(hasher.configure, 1, 2, "thread", 4)
+        hashed_password = hasher.hash(b"pw")
+        self.assertEqual(get_rounds(hashed_password.decode("utf-8")), 4)
+        self.assertTrue(hasher.check(b"pw", hashed_password))
+        self.assertFalse(hasher.check(b"other", hashed_password))
+        self.assertEqual(hasher.stats()["completed"], 3)
+
+    def test_configure_fail_unknown_executor(self):
+        with self.assertRaises(ValueError):
+            self.hasher.configure(1, 2, "greenlet", 4)
+        self.assertEqual(self.hasher.executor_type, "thread")
+        with self.assertRaises(ValueError):
+            PasswordHasher(executor_type="greenlet")
+
+
+class StatsHeaderTestCase(BaseTestCase):
+    def test_stats_header(self):
+        self.app.config["PASSWORD_HASHER_STATS_HEADER"] = True
+        password_hasher.init_app(self.app)
+        self.app.add_url_rule("/hash", "hash", lambda: {"data": {}})
+        response = self.client.get("/hash")
+        self.assertEqual(
+            response.headers["X-Password-Hasher"],
+            "workers=4, pending=0, queue_depth=0, completed=0, failed=0, "
+            "rejected=0",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+
+from marshmallow import ValidationError
+from werkzeug.datastructures import MultiDict
+
+from subjects import models as subject_models
+from subjects import schemas as subject_schemas
+from utils.constants import EXPAND_TOO_DEEP, NOT_EXPANDED, UNKNOWN_FIELDS
+from utils.schemas.projection import (
+    get_loader_options,
+    get_projection,
+    get_schema,
+    projection_schema,
+)
+from utils.test_utils import BaseTestCase
+
+
+class ProjectionTestCase(BaseTestCase):
+    def test_load_expands_parents(self):
+        projection = projection_schema.load(
+            MultiDict({"fields": "name, year", "expand": "teachers.position"})
+        )
+        self.assertDictEqual(
+            projection,
+            {
+                "only": ("name", "year"),
+                "expand": ("teachers", "teachers.position"),
+            },
+        )
+
+    def test_load_fail_too_deep(self):
+        with self.assertRaises(ValidationError) as context:
+            projection_schema.load({"expand": "teachers.subjects.groups"})
+        self.assertDictEqual(
+            context.exception.messages,
+            {"expand": [EXPAND_TOO_DEEP.format(2)]},
+        )
+
+    def test_relations_are_not_dumped_by_default(self):
+        schema = get_schema(subject_schemas.SubjectSchema)
+        relations = {"teachers", "specialties", "groups", "assignments"}
+        self.assertTrue(relations.isdisjoint(schema.fields))
+
+    def test_expand(self):
+        schema = get_schema(
+            subject_schemas.SubjectSchema,
+            only=("name",),
+            expand=("teachers",),
+        )
+        self.assertSetEqual(set(schema.fields), {"name", "teachers"})
+        teacher_schema = schema.fields["teachers"].schema
+        self.assertNotIn("position", teacher_schema.fields)
+        self.assertIs(
+            get_schema(
+                subject_schemas.SubjectSchema,
+                only=("name",),
+                expand=("teachers",),
+            ),
+            schema,
+        )
+
+    def test_fail_unknown_fields(self):
+        with self.assertRaises(ValidationError) as context:
+            get_schema(subject_schemas.SubjectSchema, only=("password",))
+        self.assertDictEqual(
+            context.exception.messages,
+            {"fields": [UNKNOWN_FIELDS.format("password")]},
+        )
+        with self.assertRaises(ValidationError) as context:
+            get_schema(
+                subject_schemas.SubjectSchema,
+                expand=("teachers", "teachers.subjects"),
+            )
+        self.assertDictEqual(
+            context.exception.messages,
+            {"expand": [UNKNOWN_FIELDS.format("teachers.subjects")]},
+        )
+
+    def test_fail_fields_not_expanded(self):
+        with self.assertRaises(ValidationError) as context:
+            get_schema(
+                subject_schemas.SubjectSchema, only=("name", "teachers")
+            )
+        self.assertDictEqual(
+            context.exception.messages,
+            {"fields": [NOT_EXPANDED.format("teachers")]},
+        )
+        args = MultiDict({"fields": "name,teachers"})
+        with self.assertRaises(ValidationError):
+            get_projection(subject_schemas.SubjectSchema, args)
+        args["expand"] = "teachers"
+        schema, _ = get_projection(subject_schemas.SubjectSchema, args)
+        self.assertSetEqual(set(schema.fields), {"name", "teachers"})
+
+    def test_loader_options(self):
+        options = get_loader_options(
+            subject_models.SubjectModel, ("teachers", "teachers.position")
+        )
+        self.assertEqual(len(options), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import json
+import unittest
+import uuid
+from unittest.mock import patch
+
+from application.db import db
+from groups import models as group_models
+from users import models as user_models
+from utils import envelope, json_backend
+from utils.test_utils import BaseTestCase, create_obj
+
+
+class ListEnvelopeTestCase(unittest.TestCase):
+    def test_same_bytes_as_whole_envelope(self):
+        items = [{"b": index, "a": "ü"} for index in range(5)]
+        for backend in json_backend.BACKENDS.values():
+            for name in ("students", "groups"):
+                body = {"data": {name: items, "next_cursor": None}}
+                whole = envelope.dumps_envelope(backend, body, "200 OK", 200)
+                chunks = envelope.iter_list_envelope(
+                    backend, name, [items[:2], [], items[2:]], "200 OK", 200
+                )
+                self.assertEqual(b"".join(chunks), whole)
+
+    def test_empty(self):
+        backend = json_backend.StdlibBackend
+        chunks = envelope.iter_list_envelope(
+            backend, "positions", iter(()), "200 OK", 200
+        )
+        self.assertEqual(
+            json.loads(b"".join(chunks))["data"],
+            {"positions": [], "next_cursor": None},
+        )
+
+
+class StreamRecordsTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.app.config["STREAM_BATCH_SIZE"] = 2
+        envelope.init_app(self.app)
+        self.groups = [
+            create_obj({"name": name}, group_models.GroupModel)[1]
+            for name in ("KN-1", "KN-2", "KN-3")
+        ]
+
+    @patch("groups.models.GroupModel.get_stream")
+    def test_stream(self, mock_get_stream):
+        mock_get_stream.return_value = iter(self.groups)
+        response = self.client.get("/groups/?stream=true&limit=1&fields=name")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "application/json")
+        self.assertNotIn("ETag", response.headers)
+        data = json.loads(response.data)["data"]
+        self.assertIsNone(data["next_cursor"])
+        self.assertListEqual(
+            data["groups"],
+            [{"name": group.name} for group in self.groups],
+        )
+        self.assertEqual(mock_get_stream.call_args.kwargs["batch_size"], 2)
+
+
+class StreamRowsTestCase(BaseTestCase):
+    year = 9999
+
+    def setUp(self):
+        super().setUp()
+        self.app.config["STREAM_BATCH_SIZE"] = 2
+        envelope.init_app(self.app)
+        students = [
+            user_models.StudentModel(
+                id=uuid.uuid4(),
+                email=f"stream-{index}@gmail.com",
+                first_name="Stream",
+                last_name="Student",
+                password="password",
+                year_of_study=1,
+            )
+            for index in range(6)
+        ]
+        groups = [
+            group_models.GroupModel(
+                id=uuid.uuid4(),
+                name=f"KN-{index}",
+                year=self.year,
+                credits_per_student=10,
+                students=students[index:][:2],
+            )
+            for index in range(5)
+        ]
+        db.session.add_all(groups)
+        db.session.commit()
+        self.entities = [*groups, *students]
+
+    def tearDown(self):
+        db.session.rollback()
+        for entity in self.entities:
+            db.session.delete(entity)
+        db.session.commit()
+        super().tearDown()
+
+    def test_stream_batches(self):
+        query = f"/groups/?filter[year]={self.year}&expand=students"
+        page = self.client.get(f"{query}&limit=100")
+        stream = self.client.get(f"{query}&stream=true")
+        self.assertEqual(stream.status_code, 200)
+        self.assertTrue(stream.is_streamed)
+        groups = json.loads(stream.data)["data"]["groups"]
+        self.assertEqual(len(groups), 5)
+        self.assertEqual(len(groups[0]["students"]), 2)
+        self.assertEqual(json.loads(stream.data), json.loads(page.data))
+
+
+if __name__ == "__main__":
+    unittest.main()
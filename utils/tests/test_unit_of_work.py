@@ -0,0 +1,86 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from flask import g
+
+from utils import unit_of_work
+from utils.test_utils import BaseTestCase
+
+
+class UnitOfWorkTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = patch("utils.unit_of_work.db")
+        self.db = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.db.session.new = self.db.session.dirty = ()
+        self.db.session.deleted = ()
+
+        def save_twice():
+            unit_of_work.save_changes()
+            unit_of_work.save_changes()
+            return {"data": {"saved": unit_of_work.is_active()}}, 201
+
+        def fail():
+            unit_of_work.save_changes()
+            raise ValueError("invalid")
+
+        def save_with_callback():
+            unit_of_work.save_changes()
+            unit_of_work.after_commit(self.callback)
+            self.callback.assert_not_called()
+            return {"data": {}}, 201
+
+        self.callback = Mock()
+        self.app.add_url_rule("/save", "save", save_twice, methods=["POST"])
+        self.app.add_url_rule(
+            "/callback", "callback", save_with_callback, methods=["POST"]
+        )
+        self.app.add_url_rule("/fail", "fail", fail, methods=["POST"])
+        self.app.add_url_rule("/read", "read", lambda: {"data": {}})
+
+    def test_one_commit_per_request(self):
+        response = self.client.post("/save")
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(response.get_json()["data"]["saved"])
+        self.assertEqual(self.db.session.flush.call_count, 2)
+        self.db.session.commit.assert_called_once_with()
+        self.db.session.rollback.assert_not_called()
+        self.assertNotIn("unit_of_work", g)
+
+    def test_rollback_on_error(self):
+        with self.assertRaises(ValueError):
+            self.client.post("/fail")
+        self.db.session.flush.assert_called_once_with()
+        self.db.session.commit.assert_not_called()
+        self.db.session.rollback.assert_called_once_with()
+        self.assertNotIn("unit_of_work", g)
+
+    def test_after_commit(self):
+        self.client.post("/callback")
+        self.db.session.commit.assert_called_once_with()
+        self.callback.assert_called_once_with()
+        self.callback.reset_mock()
+        self.db.session.commit.side_effect = unit_of_work.exc.OperationalError(
+            "COMMIT", {}, Exception()
+        )
+        with self.assertRaises(unit_of_work.exc.SQLAlchemyError):
+            self.client.post("/callback")
+        self.callback.assert_not_called()
+        self.db.session.commit.side_effect = None
+        unit_of_work.after_commit(self.callback)
+        self.callback.assert_called_once_with()
+
+    def test_no_commit_without_changes(self):
+        self.client.get("/read")
+        self.db.session.commit.assert_not_called()
+
+    def test_commit_outside_request(self):
+        self.assertFalse(unit_of_work.is_active())
+        unit_of_work.save_changes()
+        self.db.session.commit.assert_called_once_with()
+        self.db.session.flush.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""Request-scoped unit of work
+
+With ``UNIT_OF_WORK`` on, a request is one transaction: ``save_to_db``
+and ``remove_from_db`` only flush, so generated ids and defaults are
+there to dump, and the changes are committed once, after the view
+returns. If the view raises, or the commit fails, everything the request
+staged is rolled back, and the error goes to the error handlers like any
+other. Outside of requests (commands, scripts) every save commits.
+Side effects that must not get ahead of the database, e.g. caches, are
+registered with ``after_commit``.
+"""
+from functools import partial
+
+from flask import g, has_request_context
+from sqlalchemy import exc
+
+from application.db import db
+from utils.constants import SOMETHING_WENT_WRONG
+
+
+def init_app(app) -> None:
+    if not app.config["UNIT_OF_WORK"]:
+        return
+    app.dispatch_request = partial(
+        dispatch_in_unit_of_work, app.dispatch_request
+    )
+
+
+def dispatch_in_unit_of_work(dispatch_request):
+    """Dispatches the request, committing what it changed if it succeeds"""
+    g.unit_of_work = {"changed": False, "after_commit": []}
+    try:
+        rv = dispatch_request()
+        _end_unit_of_work()
+        return rv
+    except BaseException:
+        db.session.rollback()
+        raise
+    finally:
+        g.pop("unit_of_work", None)
+
+
+def _end_unit_of_work():
+    if not (g.unit_of_work["changed"] or _has_changes()):
+        return
+    _commit()
+    for callback in g.unit_of_work["after_commit"]:
+        callback()
+
+
+def _has_changes():
+    session = db.session
+    return bool(session.new or session.dirty or session.deleted)
+
+
+def _commit():
+    try:
+        db.session.commit()
+    except exc.SQLAlchemyError as err:
+        db.session.rollback()
+        raise exc.SQLAlchemyError(SOMETHING_WENT_WRONG.format(str(err)))
+
+
+def is_active() -> bool:
+    return has_request_context() and "unit_of_work" in g
+
+
+def save_changes() -> None:
+    """Flushes the session in a unit of work, commits it otherwise
+
+    :raises:
+        SQLAlchemyError: if the changes cannot be written, after rolling
+         the transaction back
+    """
+    if not is_active():
+        _commit()
+        return
+    try:
+        db.session.flush()
+    except exc.SQLAlchemyError as err:
+        db.session.rollback()
+        raise exc.SQLAlchemyError(SOMETHING_WENT_WRONG.format(str(err)))
+    g.unit_of_work["changed"] = True
+
+
+def after_commit(callback) -> None:
+    """Calls the callback once the changes saved so far are committed
+
+    In a unit of work that is after the view returns, and never if the
+    request is rolled back; otherwise ``save_changes`` committed already.
+
+    :param callback: function without arguments
+    """
+    if is_active():
+        g.unit_of_work["after_commit"].append(callback)
+    else:
+        callback()
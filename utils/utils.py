@@ -1,8 +1,6 @@
 from typing import Dict, Type, Union, List
 import uuid
 
-import bcrypt
-
 from flask import Request
 
 from assignments import models as assignment_models
@@ -21,9 +19,14 @@ from utils.constants import (
     EntityInfo,
     ITEM_NOT_FOUND_IN_ARRAY,
 )
+from utils import identity_cache
+from utils.base_model import as_uuid
+from utils.loading_profiles import get_profile_options
 from utils.custom_exceptions import (
+    CreateException,
     SearchException,
 )
+from utils.password_hasher import password_hasher
 
 
 def is_active_user(json_: Dict, user_type: str) -> None:
@@ -39,7 +42,7 @@ def is_active_user(json_: Dict, user_type: str) -> None:
     """
     user_id = json_.get("teacher_id", None)
     if user_id:
-        teacher = user_models.UserModel.get_by_id(user_id)
+        teacher = identity_cache.get_by_id(user_models.TeacherModel, user_id)
         if not teacher:
             raise SearchException(
                 DOES_NOT_EXIST.format(user_type, user_id), 404
@@ -54,8 +57,10 @@ def get_hashed_password(plain_text_password: bytes) -> bytes:
     :param plain_text_password: encoded (utf-8) string password
     :type plain_text_password: bytes
     :return: hashed password
+    :raises:
+        Overloaded: if too many passwords are already being hashed
     """
-    return bcrypt.hashpw(plain_text_password, bcrypt.gensalt())
+    return password_hasher.hash(plain_text_password)
 
 
 def check_password(plain_text_password: str, hashed_password: str) -> bool:
@@ -64,8 +69,10 @@ def check_password(plain_text_password: str, hashed_password: str) -> bool:
     :param plain_text_password: text password
     :param hashed_password: hashed password
     :return: True if the password matches, otherwise False
+    :raises:
+        Overloaded: if too many passwords are already being hashed
     """
-    return bcrypt.checkpw(
+    return password_hasher.check(
         plain_text_password.encode("utf-8"), hashed_password.encode("utf-8")
     )
 
@@ -92,27 +99,33 @@ def update_obj_with_name_and_year(
     :type user_type: str
     :return: a user json
     :raises:
-        SearchException: if entity object is not found
+        SearchException: if entity object is not found or its new name
+         and year are already taken
     """
-    entity_obj = entity_info.model.get_by_id(entity_info.id)
-    if not entity_obj:
-        raise SearchException(
-            NOT_FOUND_BY_ID.format(entity_info.type, entity_info.id)
-        )
     entity_json = request.get_json()
     if user_model:
         is_active_user(entity_json, user_type)
-
-    entity_obj = entity_info.schema.load(
-        entity_json, instance=entity_obj, partial=True
-    )
-    check_accessibility_for_name_and_year(
-        entity_obj, entity_json, entity_info.model, entity_info.type
-    )
-
-    entity_obj.save_to_db()
-    entity_json = entity_info.schema.dump(entity_obj)
-    return entity_json
+    changes = entity_info.schema.load_changes(entity_json)
+    entity_obj = entity_info.model.update_returning(entity_info.id, changes)
+    if not entity_obj:
+        if not {"name", "year"}.isdisjoint(changes):
+            entity_obj = entity_info.model.get_by_id(
+                entity_info.id, refresh=True
+            )
+        if not entity_obj:
+            raise SearchException(
+                NOT_FOUND_BY_ID.format(entity_info.type, entity_info.id)
+            )
+        # the row was kept because its name and year are taken
+        raise SearchException(
+            ALREADY_EXISTS_WITH_YEAR.format(
+                entity_info.type,
+                changes.get("name", entity_obj.name),
+                changes.get("year", entity_obj.year),
+            ),
+            400,
+        )
+    return entity_info.schema.dump(entity_obj)
 
 
 def get_entity_with_teacher(
@@ -120,6 +133,7 @@ def get_entity_with_teacher(
     entity_id: uuid.UUID,
     entity_model: Type[GROUP],
     entity_type: str,
+    profile: str = None,
 ) -> GROUP:
     """Gets entity that has a teacher foreign key
 
@@ -131,9 +145,15 @@ def get_entity_with_teacher(
     :type entity_model: Type[Group]
     :param entity_type: a specific entity type
     :type entity_type: str
+    :param profile: loading profile of the relations the view works with
+    :type profile: str
     :return: specific entity object
     """
-    entity = entity_model.get_by_id(entity_id)
+    entity = identity_cache.get_by_id(
+        entity_model,
+        entity_id,
+        options=get_profile_options(entity_model, profile),
+    )
     if not entity:
         raise SearchException(NOT_FOUND_BY_ID.format(entity_type, entity_id))
     if entity_type == SUBJECT:
@@ -190,10 +210,40 @@ def check_accessibility_for_name_and_year(
         )
 
 
+def insert_with_name_and_year(
+    entity_obj: Union[
+        subject_models.SubjectModel,
+        group_models.GroupModel,
+        specialty_models.SpecialtyModel,
+    ],
+    entity_type: str,
+) -> None:
+    """Inserts a new entity unless its name and year are already taken
+
+    The unique constraint on (name, year) decides, see
+    ``BaseModel.insert_unique``.
+
+    :param entity_obj: a new entity
+    :type entity_obj: Union[SubjectModel, GroupModel, SpecialtyModel]
+    :param entity_type: a specific entity type
+    :type entity_type: str
+    :return: None
+    :raises:
+        CreateException: if entity object with name and year already exists
+    """
+    if not entity_obj.insert_unique():
+        raise CreateException(
+            ALREADY_EXISTS_WITH_YEAR.format(
+                entity_type, entity_obj.name, entity_obj.year
+            )
+        )
+
+
 def get_entity(
     entity_id: uuid.UUID,
     entity_model: Type[subject_models.SubjectModel],
     entity_type: str,
+    profile: str = None,
 ) -> subject_models.SubjectModel:
     """Gets a specific entity
 
@@ -203,11 +253,17 @@ def get_entity(
     :type entity_model: Type[SubjectModel]
     :param entity_type: a specific entity type("SUBJECT")
     :type entity_type: str
+    :param profile: loading profile of the relations the view works with
+    :type profile: str
     :return: a specific entity object
     :raises:
         SearchException: if entity not found
     """
-    entity = entity_model.get_by_id(entity_id)
+    entity = identity_cache.get_by_id(
+        entity_model,
+        entity_id,
+        options=get_profile_options(entity_model, profile),
+    )
     if not entity:
         raise SearchException(DOES_NOT_EXIST.format(entity_type, entity_id))
     return entity
@@ -238,12 +294,12 @@ def get_item_from_entity(
     :raises:
         SearchException: if item not found in entity items
     """
+    searched_id = as_uuid(item_id)
     for item in entity_items:
-        if str(item.id) == str(item_id):
+        if item.id == searched_id:
             return item
-    else:
-        raise SearchException(
-            ITEM_NOT_FOUND_IN_ARRAY.format(
-                item_type, item_id, entity_type, entity_id
-            )
+    raise SearchException(
+        ITEM_NOT_FOUND_IN_ARRAY.format(
+            item_type, item_id, entity_type, entity_id
         )
+    )
@@ -1,19 +1,20 @@
-import json
+import math
 from marshmallow import ValidationError
 from sqlalchemy import exc
 from application import create_app
-from utils.schemas.response import BaseResponse
+from utils import envelope
 from utils.custom_exceptions import (
     SearchException,
     CreateException,
     NotProvided,
     InvalidCredentials,
     UpdateException,
+    Overloaded,
+    TooManyRequests,
 )
 
 app = create_app()
-
-response_schema = BaseResponse()
+envelope.init_app(app)
 
 
 @app.errorhandler(ValidationError)
@@ -56,28 +57,24 @@ def handle_update_exception(err):
     return {"errors": {err.__class__.__name__: str(err)}}, err.status_code
 
 
+@app.errorhandler(Overloaded)
+def handle_overloaded(err):
+    return (
+        {"errors": {err.__class__.__name__: str(err)}},
+        err.status_code,
+        {"Retry-After": "1"},
+    )
+
+
+@app.errorhandler(TooManyRequests)
+def handle_too_many_requests(err):
+    return (
+        {"errors": {err.__class__.__name__: str(err)}},
+        err.status_code,
+        {"Retry-After": str(math.ceil(err.retry_after))},
+    )
+
+
 @app.errorhandler(ValueError)
 def handle_value_error(err):
     return {"errors": {err.__class__.__name__: str(err)}}, 400
-
-
-@app.after_request
-def form_response(response):
-    response_json = response.get_json()
-    if not response_json:
-        return response
-    message = response_json.get("message", None)
-    message = message if message else response._status
-    result_json = {
-        "status": {"message": message, "code": response._status_code}
-    }
-    data = response_json.get("data", None)
-    if data:
-        result_json["data"] = data
-    errors = response_json.get("errors", None)
-    if errors:
-        errors = errors if isinstance(errors, list) else [errors]
-        result_json["errors"] = errors
-    processed_response = response_schema.load(result_json)
-    response.data = json.dumps(response_schema.dump(processed_response))
-    return response